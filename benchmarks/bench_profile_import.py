@@ -0,0 +1,94 @@
+"""
+Profile import benchmark: time to parse and validate polar files of
+increasing size with ProfileManager.read_profile_file, compared with the
+previous per-line csv/float parsing.
+
+Usage:
+    python benchmarks/bench_profile_import.py [--sizes 1000 100000 1000000]
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations.profile_manager import ProfileManager
+
+
+def write_polar(path, n_rows):
+    """Write a synthetic, valid polar with `n_rows` rows (CSV or TXT by extension)"""
+    alpha = np.linspace(-20, 25, n_rows)
+    cl = np.clip(0.1 * alpha + 0.3, -1.5, 1.6)
+    cd = 0.006 + 0.0004 * alpha**2
+    data = np.column_stack((alpha, cl, cd))
+    if path.endswith(".csv"):
+        np.savetxt(path, data, delimiter=",", fmt="%.6f", header="alpha,CL,CD", comments="")
+    else:
+        np.savetxt(path, data, fmt="%.6f", header="alpha CL CD")
+
+
+def legacy_read(path):
+    """Reference implementation: per-line parsing plus list-based validation"""
+    alpha, cl, cd = [], [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                try:
+                    alpha.append(float(row["alpha"]))
+                    cl.append(float(row["CL"]))
+                    cd.append(float(row["CD"]))
+                except ValueError:
+                    continue
+        else:
+            for line in f.readlines():
+                parts = line.strip().split()
+                if len(parts) >= 3 and not parts[0].startswith('#'):
+                    try:
+                        alpha.append(float(parts[0]))
+                        cl.append(float(parts[1]))
+                        cd.append(float(parts[2]))
+                    except ValueError:
+                        continue
+    for values in (alpha, cl, cd):
+        numeric = [float(x) for x in values]
+        min(numeric), max(numeric)
+    return [float(x) for x in alpha] == sorted(alpha)
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'format':<6} {'rows':>10} {'MB':>8} {'numpy [s]':>10} {'legacy [s]':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in (".csv", ".txt"):
+            for n_rows in args.sizes:
+                path = os.path.join(tmp, f"polar_{n_rows}{ext}")
+                write_polar(path, n_rows)
+                size_mb = os.path.getsize(path) / 1e6
+
+                success, result = ProfileManager.read_profile_file(path)
+                assert success, result
+                new = best_time(lambda: ProfileManager.read_profile_file(path), args.repeat)
+                old = best_time(lambda: legacy_read(path), args.repeat)
+                print(f"{ext[1:]:<6} {n_rows:>10} {size_mb:>8.2f} {new:>10.4f} {old:>11.4f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Load test of the local analysis service: starts `python -m calculations.service`
+on a free localhost port and drives it with concurrent keep-alive clients.
+
+Three workloads are measured: one analysis per request, lists of analyses
+per request (request batching) and column batches. For comparison the
+per-call cost of a fresh interpreter, which the service avoids, is timed too.
+
+Usage:
+    python benchmarks/bench_service.py [--clients 8] [--requests 2000] [--batch 100]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+CLI_SCRIPT = ("from calculations.aero_calculations import analyze_airfoil\n"
+              "from calculations.naca_data import naca_data\n"
+              "analyze_airfoil(5.0, 25.0, 1.225, 12.0, 'NACA 2412', naca_data)\n")
+
+
+def start_server():
+    """Starts the service on a free port; returns (process, port)"""
+    process = subprocess.Popen([sys.executable, "-m", "calculations.service", "--port", "0"], cwd=ROOT,
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    port = int(line.rsplit(":", 1)[1])
+    return process, port
+
+
+async def client(port, bodies, path, latencies):
+    """Sends every body over one keep-alive connection, recording latencies"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for body in bodies:
+            payload = json.dumps(body).encode()
+            start = time.perf_counter()
+            writer.write(f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = next(int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                          if line.lower().startswith(b"content-length"))
+            response = await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not head.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(response.decode())
+    finally:
+        writer.close()
+
+
+async def load(port, path, bodies, clients):
+    """Splits the bodies over concurrent clients; returns (seconds, latencies)"""
+    latencies = []
+    shares = [bodies[i::clients] for i in range(clients)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, share, path, latencies) for share in shares if share))
+    return time.perf_counter() - start, latencies
+
+
+def condition(i):
+    return {"profile": "NACA 2412", "alpha": -5.0 + (i % 200) * 0.1, "V": 20.0 + i % 50, "rho": 1.225, "S": 12.0}
+
+
+def report(label, seconds, latencies, analyses):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+    print(f"{label:<22} {len(latencies) / seconds:>10.0f} req/s {analyses / seconds:>12.0f} analyses/s "
+          f"p50 {statistics.median(latencies) * 1e3:>7.2f} ms  p99 {p99 * 1e3:>7.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per workload")
+    parser.add_argument("--batch", type=int, default=100, help="Analyses per batched request")
+    args = parser.parse_args(argv)
+
+    process, port = start_server()
+    try:
+        n = args.requests
+        singles = [condition(i) for i in range(n)]
+        lists = [[condition(i * args.batch + j) for j in range(args.batch)] for i in range(n // 10)]
+        columns = [{"profile": "NACA 2412", "alpha": [c["alpha"] for c in batch], "V": [c["V"] for c in batch],
+                    "rho": 1.225, "S": 12.0} for batch in lists]
+
+        print(f"{args.clients} keep-alive clients on port {port}\n")
+        seconds, latencies = asyncio.run(load(port, "/analyze", singles, args.clients))
+        report("single analysis", seconds, latencies, len(singles))
+        seconds, latencies = asyncio.run(load(port, "/analyze", lists, args.clients))
+        report(f"list of {args.batch}", seconds, latencies, len(lists) * args.batch)
+        seconds, latencies = asyncio.run(load(port, "/analyze/batch", columns, args.clients))
+        report(f"columns of {args.batch}", seconds, latencies, len(columns) * args.batch)
+    finally:
+        process.terminate()
+        process.wait()
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", CLI_SCRIPT], cwd=ROOT, check=True)
+    print(f"\nfresh interpreter per analysis: {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
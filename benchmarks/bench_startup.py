@@ -0,0 +1,87 @@
+"""
+Startup benchmark: import time of the application in a fresh interpreter,
+the slowest modules reported by `python -X importtime`, and (with a display)
+the time until the main window is painted and until the chart is ready.
+
+Exits with status 1 when the import time exceeds --budget, so it can be used
+to catch startup regressions.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--budget 0.5] [--window]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+WINDOW_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+from main import AirfoilGUI
+root = tk.Tk()
+app = AirfoilGUI(root)
+root.update()
+shown = time.perf_counter()
+while app.figure is None:
+    root.update()
+ready = time.perf_counter()
+root.destroy()
+print(shown - start, ready - start)
+"""
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def import_time(module):
+    """Wall time of `import module` in a fresh interpreter, in seconds"""
+    script = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return float(run_python("-c", script).stdout)
+
+
+def slowest_imports(module, count):
+    """(cumulative seconds, module name) of the slowest imports, from -X importtime"""
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(timings, reverse=True)[:count]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module whose import is timed")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument("--budget", type=float, default=None, help="Maximum median import time [s]")
+    parser.add_argument("--window", action="store_true", help="Also time window and chart creation (needs a display)")
+    args = parser.parse_args(argv)
+
+    times = [import_time(args.module) for _ in range(args.repeat)]
+    median = statistics.median(times)
+    print(f"import {args.module}: median {median:.3f} s, best {min(times):.3f} s ({args.repeat} runs)")
+
+    print(f"\n{'cumulative [s]':>14}  module")
+    for seconds, name in slowest_imports(args.module, args.top):
+        print(f"{seconds:>14.3f}  {name}")
+
+    if args.window:
+        shown, ready = map(float, run_python("-c", WINDOW_SCRIPT).stdout.split())
+        print(f"\nwindow shown after {shown:.3f} s, chart ready after {ready:.3f} s")
+
+    if args.budget is not None and median > args.budget:
+        print(f"\nFAIL: import time {median:.3f} s exceeds budget {args.budget:.3f} s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
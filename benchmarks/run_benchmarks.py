@@ -0,0 +1,334 @@
+"""
+Benchmark suite for the hot paths: coefficient interpolation (linear and the
+smooth pchip/spline modes), single-point and batch analysis, evaluating a
+whole profile library per angle (packed vs per profile), panel-method polar
+generation, profile import, saving large custom libraries, chart redraws and
+application startup.
+
+Runs headless (charts are drawn on the Agg canvas) and writes the timings as
+JSON. With --compare, every benchmark is checked against a stored baseline
+and the script exits with status 1 if any median got slower than the
+threshold allows.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json [--threshold 0.25]
+    python benchmarks/run_benchmarks.py --quick --filter analysis
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from bench_profile_import import write_polar
+from bench_startup import import_time
+from calculations.aero_calculations import analyze_airfoil, analyze_airfoil_batch, interpolate_coefficients
+from calculations.naca_data import naca_data, profile_info
+from calculations.panel_method import generate_polar
+from calculations.polar_library import PackedPolarLibrary
+from calculations.polar_table import CubicPolarTable, get_polar_table
+from calculations.profile_manager import ProfileManager
+
+PROFILE = "NACA 2412"
+
+# Problem sizes of the full and the --quick suite
+SIZES = {
+    "full": {"points": 10_000, "batch": 1_000_000, "rows": (1_000, 100_000, 1_000_000),
+             "library": (100, 1_000), "ranking": (2_000, 501), "panels": (100, 200, 400), "redraws": 50, "repeat": 5},
+    "quick": {"points": 1_000, "batch": 100_000, "rows": (1_000, 10_000),
+              "library": (20, 100), "ranking": (200, 101), "panels": (100, 200), "redraws": 10, "repeat": 3}
+}
+
+BENCHMARKS = []
+
+
+def benchmark(group):
+    """Registers a benchmark group; the function receives (sizes, record)"""
+    def register(func):
+        BENCHMARKS.append((group, func))
+        return func
+    return register
+
+
+def measure(func, repeat, setup=None):
+    """
+    Wall times of `repeat` calls of func.
+
+    Args:
+        func: Timed callable; receives the result of `setup` if given
+        repeat: Number of timed runs
+        setup: Optional untimed callable run before every run
+    """
+    times = []
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@benchmark("interpolation")
+def bench_interpolation(sizes, record):
+    n = sizes["points"]
+    angles = np.linspace(-10, 20, n)
+    scalars = angles.tolist()
+
+    def scalar_loop():
+        for angle in scalars:
+            interpolate_coefficients(PROFILE, angle, naca_data)
+
+    record("scalar", scalar_loop, items=n)
+    batch = np.linspace(-10, 20, sizes["batch"])
+    record("array", lambda: interpolate_coefficients(PROFILE, batch, naca_data), items=len(batch))
+
+    # Smooth modes: one-off coefficient build, then the same lookups as above
+    linear = get_polar_table(PROFILE, naca_data)
+    for method in ("pchip", "spline"):
+        def smooth_loop(method=method):
+            for angle in scalars:
+                interpolate_coefficients(PROFILE, angle, naca_data, method=method)
+
+        record(f"{method}.build", lambda method=method: CubicPolarTable(linear, method))
+        record(f"{method}.scalar", smooth_loop, items=n)
+        record(f"{method}.array", lambda method=method: interpolate_coefficients(PROFILE, batch, naca_data, method=method),
+               items=len(batch))
+
+
+@benchmark("analysis")
+def bench_analysis(sizes, record):
+    n = sizes["points"]
+    rng = np.random.default_rng(0)
+    alpha, V = rng.uniform(-10, 20, n), rng.uniform(5, 80, n)
+    points = list(zip(alpha.tolist(), V.tolist()))
+
+    def per_point():
+        for a, v in points:
+            analyze_airfoil(a, v, 1.225, 12.0, PROFILE, naca_data)
+
+    record("per_point", per_point, items=n)
+    record("batch", lambda: analyze_airfoil_batch(alpha, V, 1.225, 12.0, PROFILE, naca_data), items=n)
+    alpha, V = rng.uniform(-10, 20, sizes["batch"]), rng.uniform(5, 80, sizes["batch"])
+    record("batch_large", lambda: analyze_airfoil_batch(alpha, V, 1.225, 12.0, PROFILE, naca_data),
+           items=len(alpha))
+
+
+@benchmark("ranking")
+def bench_ranking(sizes, record):
+    n_profiles, n_angles = sizes["ranking"]
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(n_profiles):
+        n = int(rng.integers(10, 40))
+        data[f"P{i}"] = {"alpha": np.sort(rng.uniform(-15, 25, n)).tolist(),
+                         "CL": rng.normal(size=n).tolist(), "CD": rng.uniform(0.005, 0.1, n).tolist()}
+    names = list(data)
+    angles = np.linspace(-10, 20, n_angles)
+    items = n_profiles * n_angles
+
+    record("per_profile", lambda: [get_polar_table(name, data).evaluate(angles) for name in names], items=items)
+    record("pack", lambda: PackedPolarLibrary.from_profiles(names, data), items=n_profiles)
+    library = PackedPolarLibrary.from_profiles(names, data)
+    record("packed", lambda: library.evaluate(angles), items=items)
+
+
+@benchmark("panel")
+def bench_panel(sizes, record):
+    for n_panels in sizes["panels"]:
+        record(f"naca_polar_{n_panels}", lambda: generate_polar("NACA 4415", n_panels=n_panels))
+
+
+@benchmark("import")
+def bench_import(sizes, record):
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in (".csv", ".txt"):
+            for n_rows in sizes["rows"]:
+                path = os.path.join(tmp, f"polar_{n_rows}{ext}")
+                record(f"{ext[1:]}_{n_rows}", lambda: ProfileManager.read_profile_file(path), items=n_rows,
+                       prepare=lambda: write_polar(path, n_rows))
+
+
+@benchmark("save")
+def bench_save(sizes, record):
+    alpha = np.linspace(-10, 20, 200)
+    profile = ProfileManager.build_profile(alpha, 0.1 * alpha + 0.2, 0.006 + 0.0004 * alpha**2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_profiles in sizes["library"]:
+            runs = iter(range(sizes["repeat"]))
+
+            def library():
+                # A fresh store per run, so every run writes the whole library
+                store = os.path.join(tmp, f"store_{n_profiles}_{next(runs)}")
+                manager = ProfileManager(dict(naca_data), dict(profile_info), os.path.join(tmp, "none.json"),
+                                         store, max_loaded_profiles=n_profiles)
+                for i in range(n_profiles):
+                    manager.naca_data[f"CUSTOM {i}"] = dict(profile)
+                return manager
+
+            record(f"library_{n_profiles}", lambda manager: manager.save_custom_profiles(), items=n_profiles,
+                   setup=library)
+
+
+@benchmark("chart")
+def bench_chart(sizes, record):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from gui.chart import ProfileChart
+
+    figure = Figure(figsize=(7, 5), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    chart = ProfileChart(figure.add_subplot(111), canvas, {"primary": "#1E3A8A", "secondary": "#10B981",
+                                                           "text": "#F1F5F9"})
+    chart.show_profile(PROFILE, naca_data[PROFILE])
+    results = [analyze_airfoil(a, 25.0, 1.225, 12.0, PROFILE, naca_data)
+               for a in np.linspace(0, 10, sizes["redraws"])]
+    chart.show_results(results[0], naca_data[PROFILE])
+
+    def full_redraws():
+        for _ in results:
+            chart.redraw()
+
+    def operating_point():
+        for result in results:
+            chart.show_results(result, naca_data[PROFILE])
+
+    record("full_redraw", full_redraws, items=len(results))
+    record("operating_point", operating_point, items=len(results))
+
+
+@benchmark("startup")
+def bench_startup(sizes, record):
+    # Each run is a fresh interpreter; the reported time is the import itself
+    record("import_main", timer=lambda: [import_time("main") for _ in range(sizes["repeat"])])
+
+
+def run_suite(quick=False, name_filter=None, log=print):
+    """
+    Runs the registered benchmarks.
+
+    Args:
+        quick: Use the small problem sizes
+        name_filter: Only run benchmarks whose "group.name" contains this text
+        log: Callable receiving a progress line per benchmark
+
+    Returns:
+        Dictionary "group.name" -> {"median", "best", "runs", "items",
+        "per_item"}, times in seconds
+    """
+    sizes = SIZES["quick" if quick else "full"]
+    results = {}
+
+    for group, func in BENCHMARKS:
+        def record(name, timed=None, items=1, prepare=None, setup=None, timer=None):
+            """
+            Times one benchmark unless the filter excludes it. `prepare` runs
+            once before timing, `setup` before every run, and `timer`
+            replaces the timing loop for benchmarks that measure themselves.
+            """
+            key = f"{group}.{name}"
+            if name_filter and name_filter not in key:
+                return
+            if prepare is not None:
+                prepare()
+            times = timer() if timer is not None else measure(timed, sizes["repeat"], setup)
+            median = statistics.median(times)
+            results[key] = {"median": median, "best": min(times), "runs": len(times),
+                            "items": items, "per_item": median / items}
+            log(f"{key:<32} {median * 1e3:>10.3f} ms  {median / items * 1e6:>10.3f} us/item")
+
+        func(sizes, record)
+    return results
+
+
+def compare_results(current, baseline, threshold=0.25):
+    """
+    Compares two result sets by median time.
+
+    Args:
+        current: Results of `run_suite`
+        baseline: Stored results (the "benchmarks" of a JSON report)
+        threshold: Allowed relative slowdown before a benchmark is flagged
+
+    Returns:
+        List of (name, baseline median, current median, ratio, status) with
+        status "regression", "improvement" or "ok", for benchmarks in both
+    """
+    rows = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["median"], result["median"]
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+
+def metadata():
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default: %(default)s)")
+    parser.add_argument("--quick", action="store_true", help="Smaller problem sizes and fewer runs")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick, name_filter=args.filter)
+    report = {"metadata": {**metadata(), "quick": args.quick}, "benchmarks": results}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["metadata"].get("quick") != args.quick:
+            print("\nWarning: baseline and current run use different problem sizes")
+        rows = compare_results(results, baseline["benchmarks"], args.threshold)
+
+        print(f"\n{'benchmark':<32} {'baseline [ms]':>14} {'current [ms]':>13} {'ratio':>7}")
+        for name, before, after, ratio, status in rows:
+            flag = {"regression": "  SLOWER", "improvement": "  faster", "ok": ""}[status]
+            print(f"{name:<32} {before * 1e3:>14.3f} {after * 1e3:>13.3f} {ratio:>7.2f}{flag}")
+
+        regressions = [row[0] for row in rows if row[4] == "regression"]
+        if regressions:
+            print(f"\nFAIL: {len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,43 @@
 import numpy as np
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 
-def interpolate_coefficients(profile_name: str, angle: float, profiles_data: Dict) -> Tuple[float, float]:
+from calculations.instrumentation import instrumented
+from calculations.polar_table import get_polar_table, get_reference_table
+
+# Kinematic viscosity of air at sea level [m²/s]
+KINEMATIC_VISCOSITY = 1.48e-5
+
+def interpolate_coefficients(profile_name: str, angle: float, profiles_data: Dict,
+                             resolution: Optional[float] = None,
+                             reynolds: Optional[float] = None,
+                             method: str = "linear") -> Tuple[float, float]:
     """
     Interpolates the lift (CL) and drag (CD) coefficients for a given angle of attack.
 
     Args:
         profile_name: Name of the NACA airfoil profile
-        angle: Angle of attack in degrees
+        angle: Angle of attack in degrees, scalar or array
         profiles_data: Dictionary containing aerodynamic profile data
+        resolution: Optional uniform-grid spacing [°] for O(1) lookups on a
+            resampled polar (see `UniformPolarTable.max_error`)
+        reynolds: Reynolds number, used by profiles with polars at several
+            Reynolds numbers (others ignore it)
+        method: Interpolation in alpha - "linear", "pchip" (monotone cubic)
+            or "spline" (natural cubic spline)
 
     Returns:
-        Tuple (CL, CD) - interpolated lift and drag coefficients
+        Tuple (CL, CD) - interpolated lift and drag coefficients (floats for
+        a scalar angle, arrays otherwise)
 
     Raises:
-        ValueError: If the profile is not found in the data
+        ValueError: If the profile is not found in the data or the method is unknown
     """
-    if profile_name not in profiles_data:
-        available_profiles = ", ".join(profiles_data.keys())
-        raise ValueError(f"Profile '{profile_name}' not found. "
-                         f"Available profiles: {available_profiles}")
-
-    profile_data = profiles_data[profile_name]
+    # One lookup for CL and CD on the compiled polar
+    CL, CD = get_polar_table(profile_name, profiles_data, resolution, method).evaluate(angle, reynolds)
 
-    # Linear interpolation of coefficients
-    CL = np.interp(angle, profile_data["alpha"], profile_data["CL"])
-    CD = np.interp(angle, profile_data["alpha"], profile_data["CD"])
-
-    return float(CL), float(CD)
+    if np.ndim(CL) == 0:
+        return float(CL), float(CD)
+    return CL, CD
 
 def calculate_aerodynamic_forces(CL: float, CD: float, velocity: float,
                                   density: float, area: float) -> Tuple[float, float]:
@@ -54,7 +64,7 @@ def calculate_aerodynamic_forces(CL: float, CD: float, velocity: float,
     return lift_force, drag_force
 
 def calculate_reynolds_number(velocity: float, chord: float,
-                               kinematic_viscosity: float = 1.48e-5) -> float:
+                               kinematic_viscosity: float = KINEMATIC_VISCOSITY) -> float:
     """
     Calculates the Reynolds number for the airfoil.
 
@@ -68,9 +78,12 @@ def calculate_reynolds_number(velocity: float, chord: float,
     """
     return velocity * chord / kinematic_viscosity
 
+@instrumented("analysis.analyze_airfoil")
 def analyze_airfoil(alpha: float, V: float, rho: float, S: float,
                     profile_name: str, profiles_data: Dict,
-                    chord: float = 1.0) -> Dict[str, Any]:
+                    chord: float = 1.0, resolution: Optional[float] = None,
+                    kinematic_viscosity: float = KINEMATIC_VISCOSITY,
+                    method: str = "linear") -> Dict[str, Any]:
     """
     Performs a complete aerodynamic analysis of the airfoil.
 
@@ -82,6 +95,10 @@ def analyze_airfoil(alpha: float, V: float, rho: float, S: float,
         profile_name: NACA profile name
         profiles_data: Aerodynamic data dictionary
         chord: Chord length of the airfoil [m]
+        resolution: Optional uniform-grid spacing [°] for resampled lookups
+        kinematic_viscosity: Kinematic viscosity of air [m²/s], e.g. from
+            `calculations.atmosphere.isa`
+        method: Interpolation in alpha - "linear", "pchip" or "spline"
 
     Returns:
         Dictionary with all calculated aerodynamic results
@@ -93,8 +110,11 @@ def analyze_airfoil(alpha: float, V: float, rho: float, S: float,
     if S <= 0:
         raise ValueError("Wing area must be greater than zero.")
 
-    # Interpolate aerodynamic coefficients
-    CL, CD = interpolate_coefficients(profile_name, alpha, profiles_data)
+    # Reynolds number
+    reynolds = calculate_reynolds_number(V, chord, kinematic_viscosity)
+
+    # Interpolate aerodynamic coefficients (in alpha and, if tabulated, Re)
+    CL, CD = interpolate_coefficients(profile_name, alpha, profiles_data, resolution, reynolds, method)
 
     # Compute aerodynamic forces
     lift, drag = calculate_aerodynamic_forces(CL, CD, V, rho, S)
@@ -102,9 +122,6 @@ def analyze_airfoil(alpha: float, V: float, rho: float, S: float,
     # Lift-to-drag ratio
     L_D_ratio = lift / drag if drag > 0 else float('inf')
 
-    # Reynolds number
-    reynolds = calculate_reynolds_number(V, chord)
-
     # Dynamic pressure
     q = 0.5 * rho * V**2
 
@@ -123,6 +140,75 @@ def analyze_airfoil(alpha: float, V: float, rho: float, S: float,
         "wing_area": S
     }
 
+@instrumented("analysis.analyze_airfoil_batch")
+def analyze_airfoil_batch(alpha, V, rho, S, profile_name: str, profiles_data: Dict,
+                          chord=1.0, resolution: Optional[float] = None,
+                          kinematic_viscosity=KINEMATIC_VISCOSITY,
+                          method: str = "linear") -> Dict[str, np.ndarray]:
+    """
+    Vectorized counterpart of `analyze_airfoil` for arrays of flight conditions.
+
+    All condition arguments may be scalars or NumPy arrays and are broadcast
+    against each other, so a full sweep is evaluated in a single pass without
+    building a result dictionary per point.
+
+    Args:
+        alpha: Angle(s) of attack [°]
+        V: Flight speed(s) [m/s]
+        rho: Air density(ies) [kg/m³]
+        S: Wing surface area(s) [m²]
+        profile_name: NACA profile name
+        profiles_data: Aerodynamic data dictionary
+        chord: Chord length(s) of the airfoil [m]
+        resolution: Optional uniform-grid spacing [°] for resampled lookups
+        kinematic_viscosity: Kinematic viscosity(ies) of air [m²/s]
+        method: Interpolation in alpha - "linear", "pchip" or "spline"
+
+    Returns:
+        Column-oriented dictionary of arrays (one entry per result field,
+        all with the broadcast shape of the inputs)
+
+    Raises:
+        ValueError: If any velocity, density or area is not positive
+    """
+    alpha, V, rho, S, chord, kinematic_viscosity = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (alpha, V, rho, S, chord, kinematic_viscosity)))
+
+    if np.any(V <= 0):
+        raise ValueError("Velocity must be greater than zero.")
+    if np.any(rho <= 0):
+        raise ValueError("Air density must be greater than zero.")
+    if np.any(S <= 0):
+        raise ValueError("Wing area must be greater than zero.")
+
+    # Each condition's Reynolds number selects the polar of Re-dependent profiles
+    reynolds = calculate_reynolds_number(V, chord, kinematic_viscosity)
+    CL, CD = get_polar_table(profile_name, profiles_data, resolution, method).evaluate(alpha, reynolds)
+
+    # Dynamic pressure and forces, reusing q for both forces
+    q = 0.5 * rho * V**2
+    qS = q * S
+    lift = CL * qS
+    drag = CD * qS
+
+    # Lift-to-drag ratio (infinite where there is no drag)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        L_D_ratio = np.where(drag > 0, lift / drag, np.inf)
+
+    return {
+        "alpha": alpha,
+        "CL": CL,
+        "CD": CD,
+        "lift": lift,
+        "drag": drag,
+        "L_D_ratio": L_D_ratio,
+        "reynolds_number": reynolds,
+        "dynamic_pressure": q,
+        "velocity": V,
+        "density": rho,
+        "wing_area": S
+    }
+
 def get_stall_angle(profile_name: str, profiles_data: Dict) -> float:
     """
     Estimates the stall angle based on the maximum CL.
@@ -137,9 +223,14 @@ def get_stall_angle(profile_name: str, profiles_data: Dict) -> float:
     if profile_name not in profiles_data:
         return None
 
-    data = profiles_data[profile_name]
-    max_cl_idx = np.argmax(data["CL"])
-    stall_angle = data["alpha"][max_cl_idx]
+    # A ProfileRegistry keeps the value in its characteristics index
+    if hasattr(profiles_data, "characteristics"):
+        return profiles_data.characteristics(profile_name)["stall_angle"]
+
+    # Reynolds-dependent profiles use their reference polar, like the index
+    table = get_reference_table(profile_name, profiles_data)
+    max_cl_idx = np.argmax(table.values[:, 0])
+    stall_angle = float(table.alpha[max_cl_idx])
 
     return stall_angle
 
@@ -151,7 +242,8 @@ def calculate_efficiency_metrics(results: Dict[str, Any]) -> Dict[str, float]:
         results: Output dictionary from `analyze_airfoil`
 
     Returns:
-        Dictionary containing efficiency metrics
+        Dictionary containing efficiency metrics; `drag_efficiency` is NaN
+        for negative CL, as in `calculate_efficiency_metrics_batch`
     """
     CL = results["CL"]
     CD = results["CD"]
@@ -159,6 +251,29 @@ def calculate_efficiency_metrics(results: Dict[str, Any]) -> Dict[str, float]:
     return {
         "glide_ratio": results["L_D_ratio"],
         "CL_CD_ratio": CL / CD if CD > 0 else float('inf'),
-        "drag_efficiency": CL**1.5 / CD if CD > 0 else float('inf'),
+        "drag_efficiency": (CL**1.5 / CD if CL >= 0 else float('nan')) if CD > 0 else float('inf'),
         "power_factor": CL**3 / CD**2 if CD > 0 else float('inf')
     }
+
+
+def calculate_efficiency_metrics_batch(results: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Vectorized counterpart of `calculate_efficiency_metrics`.
+
+    Args:
+        results: Output dictionary from `analyze_airfoil_batch`
+
+    Returns:
+        Dictionary of metric arrays; ratios are infinite where CD is zero and
+        `drag_efficiency` is NaN where CL is negative
+    """
+    CL = results["CL"]
+    CD = results["CD"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "glide_ratio": results["L_D_ratio"],
+            "CL_CD_ratio": np.where(CD > 0, CL / CD, np.inf),
+            "drag_efficiency": np.where(CD > 0, CL**1.5 / CD, np.inf),
+            "power_factor": np.where(CD > 0, CL**3 / CD**2, np.inf)
+        }
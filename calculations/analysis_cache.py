@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from calculations.aero_calculations import KINEMATIC_VISCOSITY, analyze_airfoil
+
+# Inputs of `AnalysisCache.analyze` that can be snapped to a grid
+QUANTIZED_INPUTS = ("alpha", "V", "rho", "S")
+
+
+class AnalysisCache:
+    """
+    Bounded LRU memoization layer for `analyze_airfoil`.
+
+    Inputs can optionally be snapped to a grid (`quantum`, one step per
+    input) so that nearly identical conditions share an entry. The analysis
+    is then run on the snapped values, keeping cached and fresh results
+    identical; the returned results therefore carry the snapped inputs
+    ("alpha", "velocity", "density", "wing_area"), not the requested ones.
+    Register `profile_changed` with `ProfileManager.add_listener` to drop
+    entries of profiles that are added, replaced or removed.
+    """
+
+    def __init__(self, maxsize: int = 1024, quantum: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            maxsize: Maximum number of cached entries
+            quantum: Optional rounding step per input, keyed by "alpha", "V",
+                "rho" or "S" (e.g. {"alpha": 0.01, "V": 0.1}); inputs without
+                a step are used as given. The inputs differ by orders of
+                magnitude, so there is no shared step
+
+        Raises:
+            ValueError: If the size or a step is not positive, or a step names
+                an unknown input
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be greater than zero.")
+        quantum = dict(quantum or {})
+        unknown = set(quantum) - set(QUANTIZED_INPUTS)
+        if unknown:
+            raise ValueError(f"Unknown quantized inputs: {', '.join(sorted(unknown))}. "
+                             f"Use {', '.join(QUANTIZED_INPUTS)}.")
+        if any(step <= 0 for step in quantum.values()):
+            raise ValueError("Quantum must be greater than zero.")
+
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _quantize(self, name: str, value: float) -> float:
+        step = self.quantum.get(name)
+        if step is None:
+            return float(value)
+        return round(value / step) * step
+
+    def _lookup(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def analyze(self, alpha: float, V: float, rho: float, S: float,
+                profile_name: str, profiles_data: Dict,
+                chord: float = 1.0, resolution: Optional[float] = None,
+                kinematic_viscosity: float = KINEMATIC_VISCOSITY,
+                method: str = "linear") -> Dict[str, Any]:
+        """
+        Cached `analyze_airfoil`; takes the same arguments.
+
+        Returns:
+            A copy of the (possibly cached) result dictionary
+        """
+        alpha, V, rho, S = (self._quantize(name, x) for name, x in zip(QUANTIZED_INPUTS, (alpha, V, rho, S)))
+        key = (profile_name, alpha, V, rho, S, float(chord), resolution, float(kinematic_viscosity), method)
+
+        results = self._lookup(key)
+        if results is None:
+            results = analyze_airfoil(alpha, V, rho, S, profile_name, profiles_data,
+                                      chord=chord, resolution=resolution,
+                                      kinematic_viscosity=kinematic_viscosity, method=method)
+            self._store(key, results)
+        return dict(results)
+
+    def invalidate(self, profile_name: Optional[str] = None):
+        """Drops the entries of one profile, or everything if no name is given."""
+        with self._lock:
+            if profile_name is None:
+                self._entries.clear()
+                return
+            stale = [key for key in self._entries if key[0] == profile_name]
+            for key in stale:
+                del self._entries[key]
+
+    def profile_changed(self, profile_name: str):
+        """Listener for `ProfileManager.add_listener`."""
+        self.invalidate(profile_name)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
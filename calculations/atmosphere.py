@@ -0,0 +1,150 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from calculations.polar_table import get_polar_table
+
+# Sea-level conditions and constants of the International Standard Atmosphere
+SEA_LEVEL_TEMPERATURE = 288.15      # [K]
+SEA_LEVEL_PRESSURE = 101325.0       # [Pa]
+GAS_CONSTANT = 287.05287            # Specific gas constant of air [J/(kg K)]
+GRAVITY = 9.80665                   # [m/s²]
+HEAT_CAPACITY_RATIO = 1.4
+
+# Sutherland's law for the dynamic viscosity of air
+SUTHERLAND_REFERENCE = 1.458e-6     # [kg/(m s K^0.5)]
+SUTHERLAND_TEMPERATURE = 110.4      # [K]
+
+# Layers up to 32 km: (base geopotential altitude [m], temperature lapse rate [K/m])
+ISA_LAYERS = ((0.0, -0.0065), (11000.0, 0.0), (20000.0, 0.001))
+MIN_ALTITUDE = -610.0
+MAX_ALTITUDE = 32000.0
+
+
+def _layer_bases():
+    """Temperature and pressure at the base of every layer"""
+    temperatures = [SEA_LEVEL_TEMPERATURE]
+    pressures = [SEA_LEVEL_PRESSURE]
+    for (base, lapse), (top, _) in zip(ISA_LAYERS, ISA_LAYERS[1:]):
+        T0, p0 = temperatures[-1], pressures[-1]
+        T1 = T0 + lapse * (top - base)
+        if lapse == 0.0:
+            p1 = p0 * np.exp(-GRAVITY * (top - base) / (GAS_CONSTANT * T0))
+        else:
+            p1 = p0 * (T1 / T0) ** (-GRAVITY / (lapse * GAS_CONSTANT))
+        temperatures.append(T1)
+        pressures.append(p1)
+    return np.array(temperatures), np.array(pressures)
+
+
+_BASE_TEMPERATURES, _BASE_PRESSURES = _layer_bases()
+_BASE_ALTITUDES = np.array([base for base, _ in ISA_LAYERS])
+_LAPSE_RATES = np.array([lapse for _, lapse in ISA_LAYERS])
+
+
+def isa(altitude) -> Dict[str, np.ndarray]:
+    """
+    International Standard Atmosphere properties at one or many altitudes.
+
+    Args:
+        altitude: Geopotential altitude(s) [m], scalar or array, between
+            -610 m and 32 km
+
+    Returns:
+        Dictionary of arrays with the shape of `altitude`: "temperature" [K],
+        "pressure" [Pa], "density" [kg/m³], "speed_of_sound" [m/s],
+        "dynamic_viscosity" [Pa s] and "kinematic_viscosity" [m²/s]
+
+    Raises:
+        ValueError: If an altitude is outside the modelled range
+    """
+    h = np.asarray(altitude, dtype=np.float64)
+    if np.any(h < MIN_ALTITUDE) or np.any(h > MAX_ALTITUDE):
+        raise ValueError(f"Altitude must be between {MIN_ALTITUDE:g} m and {MAX_ALTITUDE:g} m.")
+
+    layer = np.clip(np.searchsorted(_BASE_ALTITUDES, h, side="right") - 1, 0, len(ISA_LAYERS) - 1)
+    dh = h - _BASE_ALTITUDES[layer]
+    lapse = _LAPSE_RATES[layer]
+    T0 = _BASE_TEMPERATURES[layer]
+    p0 = _BASE_PRESSURES[layer]
+
+    temperature = T0 + lapse * dh
+    isothermal = lapse == 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gradient = p0 * (temperature / T0) ** (-GRAVITY / (np.where(isothermal, 1.0, lapse) * GAS_CONSTANT))
+    pressure = np.where(isothermal, p0 * np.exp(-GRAVITY * dh / (GAS_CONSTANT * T0)), gradient)
+
+    density = pressure / (GAS_CONSTANT * temperature)
+    viscosity = SUTHERLAND_REFERENCE * temperature**1.5 / (temperature + SUTHERLAND_TEMPERATURE)
+
+    return {
+        "temperature": temperature,
+        "pressure": pressure,
+        "density": density,
+        "speed_of_sound": np.sqrt(HEAT_CAPACITY_RATIO * GAS_CONSTANT * temperature),
+        "dynamic_viscosity": viscosity,
+        "kinematic_viscosity": viscosity / density
+    }
+
+
+def flight_envelope(profile_name: str, profiles_data: Dict, altitudes, speeds, S: float,
+                    weight: Optional[float] = None, chord: float = 1.0) -> Dict[str, np.ndarray]:
+    """
+    Lift capability and stall speed over an (altitude x speed) grid.
+
+    The atmosphere is evaluated once per altitude and broadcast against the
+    speeds, so the whole grid is a single NumPy computation. CL_max follows
+    the Reynolds number of every cell for Reynolds-dependent profiles.
+
+    Args:
+        profile_name: Name of the airfoil profile
+        profiles_data: Aerodynamic data dictionary
+        altitudes: Altitudes [m] (grid rows)
+        speeds: True airspeeds [m/s] (grid columns)
+        S: Wing surface area [m²]
+        weight: Optional aircraft weight [N] for load factor and stall maps
+        chord: Chord length [m]
+
+    Returns:
+        Dictionary with the "altitude" and "velocity" axes, the per-altitude
+        "density", and (altitudes x speeds) maps "mach", "reynolds_number",
+        "CL_max" and "max_lift" [N]. With a weight also "max_load_factor"
+        (max_lift / weight), "stall_speed" [m/s] (at each cell's CL_max) and
+        "can_fly" (cell speed above its stall speed)
+
+    Raises:
+        ValueError: If a profile is unknown or an input is out of range
+    """
+    if S <= 0:
+        raise ValueError("Wing area must be greater than zero.")
+    if weight is not None and weight <= 0:
+        raise ValueError("Weight must be greater than zero.")
+
+    altitude = np.asarray(altitudes, dtype=np.float64).ravel()
+    velocity = np.asarray(speeds, dtype=np.float64).ravel()
+    if np.any(velocity <= 0):
+        raise ValueError("Velocity must be greater than zero.")
+
+    atmosphere = isa(altitude)
+    rho = atmosphere["density"][:, None]
+    reynolds = velocity[None, :] * chord / atmosphere["kinematic_viscosity"][:, None]
+
+    CL_max = get_polar_table(profile_name, profiles_data).max_lift(reynolds)
+    max_lift = 0.5 * rho * velocity[None, :]**2 * S * CL_max
+
+    envelope = {
+        "altitude": altitude,
+        "velocity": velocity,
+        "density": atmosphere["density"],
+        "mach": velocity[None, :] / atmosphere["speed_of_sound"][:, None],
+        "reynolds_number": reynolds,
+        "CL_max": CL_max,
+        "max_lift": max_lift
+    }
+    if weight is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stall_speed = np.where(CL_max > 0, np.sqrt(2 * weight / (rho * S * CL_max)), np.inf)
+        envelope["max_load_factor"] = max_lift / weight
+        envelope["stall_speed"] = stall_speed
+        envelope["can_fly"] = velocity[None, :] >= stall_speed
+    return envelope
@@ -0,0 +1,315 @@
+"""
+Headless batch analysis: streams a file of flight conditions through
+`analyze_airfoil_batch` in fixed-size chunks and writes the results
+incrementally, so memory use does not depend on the input size.
+
+Usage:
+    python -m calculations.batch "NACA 2412" conditions.csv results.npy
+    python -m calculations.batch my_polar.csv conditions.npy results.csv --chunk-size 50000
+    python -m calculations.batch "NACA 2412" conditions.csv results.csv --altitude 3000
+"""
+import argparse
+import itertools
+import os
+import struct
+import sys
+
+import numpy as np
+
+from calculations.aero_calculations import KINEMATIC_VISCOSITY, analyze_airfoil_batch
+from calculations.atmosphere import isa
+from calculations.polar_table import INTERPOLATION_METHODS
+
+# Input columns in positional order (NPY) and accepted CSV header names.
+# Altitude is optional: with it, rho defaults to the ISA density and the
+# Reynolds number uses the ISA viscosity at that altitude.
+CONDITION_COLUMNS = ("alpha", "V", "rho", "S", "chord", "altitude")
+OPTIONAL_COLUMNS = ("altitude",)
+CONDITION_ALIASES = {
+    "alpha": ("alpha", "Alpha", "ALPHA", "aoa", "AOA"),
+    "V": ("V", "v", "velocity", "speed"),
+    "rho": ("rho", "density"),
+    "S": ("S", "area", "wing_area"),
+    "chord": ("chord", "c"),
+    "altitude": ("altitude", "alt", "h")
+}
+
+RESULT_COLUMNS = ("alpha", "velocity", "density", "wing_area", "CL", "CD", "lift", "drag",
+                  "L_D_ratio", "reynolds_number", "dynamic_pressure")
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Fixed NPY header size, so the final row count can be patched in place
+NPY_HEADER_SIZE = 128
+
+
+def _resolve_profile(profile, profiles_data):
+    """
+    Returns (profile_name, profiles_data) for a profile name or a polar file.
+
+    Raises:
+        ValueError: If the profile is unknown or the polar file is invalid
+    """
+    if profile in profiles_data:
+        return profile, profiles_data
+
+    if os.path.isfile(profile):
+        from calculations.profile_manager import ProfileManager
+
+        success, result = ProfileManager.read_profile_file(profile)
+        if not success:
+            raise ValueError(result)
+        profile_name = os.path.splitext(os.path.basename(profile))[0].upper()
+        return profile_name, {profile_name: result}
+
+    available_profiles = ", ".join(profiles_data.keys())
+    raise ValueError(f"Profile '{profile}' not found and is not a file. "
+                     f"Available profiles: {available_profiles}")
+
+
+def iter_condition_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, defaults=None):
+    """
+    Yields flight conditions from a CSV or NPY file in chunks.
+
+    CSV files need a header naming the columns (alpha, V, rho, S, chord,
+    altitude or their aliases); NPY files hold a 2-D float array with the
+    columns in that order, or a structured array with those field names.
+    Columns missing from the file are filled from `defaults`; rho may be
+    missing altogether when an altitude is given.
+
+    Args:
+        path: Conditions file (.csv or .npy)
+        chunk_size: Maximum number of rows per chunk
+        defaults: Values for columns absent from the file
+
+    Yields:
+        Dictionary mapping each condition column to a 1-D array
+    """
+    defaults = defaults or {}
+
+    if path.lower().endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        if data.dtype.names:
+            columns = {name: name for name in CONDITION_COLUMNS if name in data.dtype.names}
+        else:
+            if data.ndim != 2:
+                raise ValueError("NPY conditions must be a 2-D array or a structured array")
+            columns = {name: i for i, name in enumerate(CONDITION_COLUMNS[:data.shape[1]])}
+        _check_columns(columns, defaults)
+
+        for start in range(0, len(data), chunk_size):
+            block = data[start:start + chunk_size]
+            yield _fill_defaults({name: np.asarray(block[key] if data.dtype.names else block[:, key],
+                                                   dtype=np.float64)
+                                  for name, key in columns.items()}, defaults, len(block))
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        headers = [h.strip() for h in f.readline().split(",")]
+        columns = {}
+        for name, aliases in CONDITION_ALIASES.items():
+            index = next((i for i, h in enumerate(headers) if h in aliases), None)
+            if index is not None:
+                columns[name] = index
+        _check_columns(columns, defaults, headers)
+
+        names = list(columns)
+        usecols = [columns[name] for name in names]
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            block = np.loadtxt(lines, delimiter=",", usecols=usecols, ndmin=2, dtype=np.float64)
+            yield _fill_defaults({name: block[:, i] for i, name in enumerate(names)},
+                                 defaults, len(block))
+
+
+def _check_columns(columns, defaults, headers=None):
+    available = set(columns) | set(defaults)
+    optional = set(OPTIONAL_COLUMNS)
+    if "altitude" in available:
+        optional.add("rho")
+    missing = [name for name in CONDITION_COLUMNS if name not in available and name not in optional]
+    if missing:
+        found = f" Found: {headers}" if headers is not None else ""
+        raise ValueError(f"Missing condition columns: {', '.join(missing)}.{found}")
+
+
+def _fill_defaults(chunk, defaults, n_rows):
+    for name, value in defaults.items():
+        if name not in chunk:
+            chunk[name] = np.full(n_rows, value, dtype=np.float64)
+    return chunk
+
+
+def _apply_atmosphere(chunk):
+    """Fills density (if absent) and kinematic viscosity of a chunk from its altitudes"""
+    if "altitude" not in chunk:
+        chunk["kinematic_viscosity"] = KINEMATIC_VISCOSITY
+        return
+    atmosphere = isa(chunk["altitude"])
+    chunk.setdefault("rho", atmosphere["density"])
+    chunk["kinematic_viscosity"] = atmosphere["kinematic_viscosity"]
+
+
+class CsvResultWriter:
+    """Appends result blocks to a CSV file with a header row."""
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.file.write(",".join(columns) + "\n")
+        self.rows = 0
+
+    def write(self, block):
+        np.savetxt(self.file, block, delimiter=",", fmt="%.10g")
+        self.rows += len(block)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NpyResultWriter:
+    """
+    Streams result blocks into a 2-D float64 NPY file.
+
+    The row count is unknown until the stream ends, so a fixed-size header
+    is reserved up front and rewritten with the final shape on close.
+    """
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        self.file = open(path, "wb")
+        self.n_columns = len(columns)
+        self.rows = 0
+        self.file.write(self._header())
+
+    def _header(self):
+        header = repr({"descr": "<f8", "fortran_order": False,
+                       "shape": (self.rows, self.n_columns)})
+        padding = NPY_HEADER_SIZE - 10 - len(header) - 1
+        return (b"\x93NUMPY\x01\x00" + struct.pack("<H", NPY_HEADER_SIZE - 10)
+                + header.encode("latin1") + b" " * padding + b"\n")
+
+    def write(self, block):
+        np.ascontiguousarray(block, dtype="<f8").tofile(self.file)
+        self.rows += len(block)
+
+    def close(self):
+        self.file.seek(0)
+        self.file.write(self._header())
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_result_writer(path, columns=RESULT_COLUMNS):
+    """Returns a NPY or CSV result writer depending on the file extension."""
+    if path.lower().endswith(".npy"):
+        return NpyResultWriter(path, columns)
+    return CsvResultWriter(path, columns)
+
+
+def run_batch(profile, conditions_path, output_path, profiles_data=None,
+              chunk_size=DEFAULT_CHUNK_SIZE, resolution=None, defaults=None, progress=None, method="linear"):
+    """
+    Analyzes every flight condition of a file and writes the results.
+
+    Args:
+        profile: Profile name or path to a polar file (CSV/TXT)
+        conditions_path: CSV or NPY file with flight conditions
+        output_path: CSV or NPY results file
+        profiles_data: Aerodynamic data dictionary (defaults to the library)
+        chunk_size: Number of conditions analyzed per vectorized pass
+        resolution: Optional uniform-grid spacing [°] for resampled lookups
+        defaults: Values for condition columns absent from the input (an
+            "altitude" default applies the ISA atmosphere to every row)
+        progress: Optional callback receiving the number of rows done
+        method: Interpolation in alpha - "linear", "pchip" or "spline"
+
+    Returns:
+        Number of analyzed rows
+    """
+    if profiles_data is None:
+        from calculations.naca_data import naca_data, profile_info
+        from calculations.profile_manager import ProfileManager
+
+        profiles_data = ProfileManager(dict(naca_data), dict(profile_info)).naca_data
+
+    profile_name, profiles_data = _resolve_profile(profile, profiles_data)
+    defaults = {"chord": 1.0, **(defaults or {})}
+
+    with open_result_writer(output_path) as writer:
+        for chunk in iter_condition_chunks(conditions_path, chunk_size, defaults):
+            _apply_atmosphere(chunk)
+            results = analyze_airfoil_batch(chunk["alpha"], chunk["V"], chunk["rho"], chunk["S"],
+                                            profile_name, profiles_data, chord=chunk["chord"],
+                                            resolution=resolution, method=method,
+                                            kinematic_viscosity=chunk["kinematic_viscosity"])
+            writer.write(np.column_stack([results[name] for name in RESULT_COLUMNS]))
+            if progress is not None:
+                progress(writer.rows)
+        return writer.rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m calculations.batch",
+        description="Analyze a file of flight conditions without a GUI.")
+    parser.add_argument("profile", help="Profile name (e.g. 'NACA 2412') or polar file (CSV/TXT)")
+    parser.add_argument("conditions", help="CSV or NPY file with alpha, V, rho, S[, chord, altitude] columns")
+    parser.add_argument("output", help="Results file (.csv or .npy)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Rows per vectorized pass (default: %(default)s)")
+    parser.add_argument("--resolution", type=float, default=None,
+                        help="Use a uniform alpha grid with this spacing [°] for lookups")
+    parser.add_argument("--method", choices=INTERPOLATION_METHODS, default="linear",
+                        help="Interpolation in alpha: linear, pchip (monotone cubic) or spline "
+                             "(natural cubic) (default: %(default)s)")
+    parser.add_argument("--chord", type=float, default=1.0,
+                        help="Chord length [m] when the input has no chord column")
+    parser.add_argument("--velocity", type=float, help="Speed [m/s] when the input has no V column")
+    parser.add_argument("--density", type=float, help="Density [kg/m³] when the input has no rho column")
+    parser.add_argument("--wing-area", type=float, help="Wing area [m²] when the input has no S column")
+    parser.add_argument("--altitude", type=float,
+                        help="ISA altitude [m] when the input has no altitude column; "
+                             "sets density (unless given) and viscosity")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be greater than zero")
+
+    defaults = {"chord": args.chord}
+    for name, value in (("V", args.velocity), ("rho", args.density), ("S", args.wing_area),
+                        ("altitude", args.altitude)):
+        if value is not None:
+            defaults[name] = value
+
+    def report(rows):
+        print(f"\r{rows} rows analyzed", end="", file=sys.stderr, flush=True)
+
+    try:
+        rows = run_batch(args.profile, args.conditions, args.output, chunk_size=args.chunk_size,
+                         resolution=args.resolution, method=args.method, defaults=defaults,
+                         progress=None if args.quiet else report)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Wrote {rows} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
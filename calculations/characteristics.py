@@ -0,0 +1,83 @@
+from typing import Dict, Optional, Iterable, Tuple
+
+import numpy as np
+
+# Summary values derived from a polar, in table column order
+CHARACTERISTICS = (
+    "CL_max",           # Maximum lift coefficient
+    "stall_angle",      # Angle of attack at CL_max [°]
+    "zero_lift_alpha",  # Angle of attack where CL crosses zero [°]
+    "lift_slope",       # dCL/dalpha at zero lift [1/°]
+    "CD0",              # Drag coefficient at zero lift
+    "CD_min",           # Minimum drag coefficient
+    "L_D_max",          # Maximum lift-to-drag ratio
+    "alpha_L_D_max"     # Angle of attack at L_D_max [°]
+)
+
+
+def compute_characteristics(alpha, CL, CD) -> Dict[str, Optional[float]]:
+    """
+    Derives the summary characteristics of one linearly interpolated polar.
+
+    All values are exact for the interpolated polar: CL_max, CD_min and the
+    maximum L/D lie on tabulated points (L/D is monotonic on each segment),
+    and the zero-lift angle is the first upward zero crossing of CL.
+
+    Args:
+        alpha: Angles of attack [°] in ascending order
+        CL: Lift coefficients
+        CD: Drag coefficients
+
+    Returns:
+        Dictionary with one value per name in CHARACTERISTICS; values that do
+        not exist for the polar (e.g. no zero crossing) are None
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    CL = np.asarray(CL, dtype=np.float64)
+    CD = np.asarray(CD, dtype=np.float64)
+
+    i_max = int(np.argmax(CL))
+    values = {name: None for name in CHARACTERISTICS}
+    values["CL_max"] = float(CL[i_max])
+    values["stall_angle"] = float(alpha[i_max])
+    values["CD_min"] = float(CD.min())
+
+    crossings = np.flatnonzero((CL[:-1] <= 0) & (CL[1:] > 0) & (alpha[1:] > alpha[:-1]))
+    if len(crossings):
+        i = crossings[0]
+        t = -CL[i] / (CL[i + 1] - CL[i])
+        values["zero_lift_alpha"] = float(alpha[i] + t * (alpha[i + 1] - alpha[i]))
+        values["lift_slope"] = float((CL[i + 1] - CL[i]) / (alpha[i + 1] - alpha[i]))
+        values["CD0"] = float(CD[i] + t * (CD[i + 1] - CD[i]))
+
+    positive = CD > 0
+    if positive.any():
+        ratio = np.where(positive, CL / np.where(positive, CD, 1.0), -np.inf)
+        i_best = int(np.argmax(ratio))
+        values["L_D_max"] = float(ratio[i_best])
+        values["alpha_L_D_max"] = float(alpha[i_best])
+    return values
+
+
+def characteristics_table(rows: Iterable[Tuple[str, Dict[str, Optional[float]]]]) -> np.ndarray:
+    """
+    Packs characteristics of many profiles into one structured array.
+
+    Missing values become NaN, so the table can be filtered and sorted with
+    NumPy directly, e.g. `table[table["CL_max"] > 1.4]` or
+    `np.sort(table, order="L_D_max")`.
+
+    Args:
+        rows: (profile name, characteristics) pairs
+
+    Returns:
+        Structured array with a "profile" field and one float field per
+        name in CHARACTERISTICS
+    """
+    rows = list(rows)
+    dtype = [("profile", object)] + [(name, np.float64) for name in CHARACTERISTICS]
+    table = np.empty(len(rows), dtype=dtype)
+    for i, (name, values) in enumerate(rows):
+        table[i] = (name,) + tuple(np.nan if values.get(key) is None else values[key]
+                                   for key in CHARACTERISTICS)
+    return table
@@ -0,0 +1,158 @@
+from typing import Dict, List, Optional, Callable, Sequence
+
+import numpy as np
+
+from calculations.aero_calculations import calculate_reynolds_number
+from calculations.polar_library import PackedPolarLibrary
+from calculations.polar_table import get_polar_table, get_reference_table
+
+
+def alpha_grid(start: float, stop: float, step: float) -> np.ndarray:
+    """
+    Builds an evenly spaced angle-of-attack grid including both end points.
+
+    Args:
+        start: First angle [°]
+        stop: Last angle [°]
+        step: Grid spacing [°]
+
+    Raises:
+        ValueError: If the step is not positive or the range is empty
+    """
+    if step <= 0:
+        raise ValueError("Grid step must be greater than zero.")
+    if stop <= start:
+        raise ValueError("The last angle must be greater than the first one.")
+    n_points = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return start + step * np.arange(n_points)
+
+
+def _evaluate_each(names, profiles_data, alpha, reynolds, resolution, method, progress):
+    """Per-profile evaluation for resampled or smooth lookups; NaN outside each polar"""
+    CL = np.empty((len(names), len(alpha)))
+    CD = np.empty((len(names), len(alpha)))
+    for i, name in enumerate(names):
+        exact = get_reference_table(name, profiles_data)
+        CL[i], CD[i] = get_polar_table(name, profiles_data, resolution, method).evaluate(alpha, reynolds)
+        outside = (alpha < exact.alpha[0]) | (alpha > exact.alpha[-1])
+        CL[i, outside] = np.nan
+        CD[i, outside] = np.nan
+        if progress is not None:
+            progress(i + 1, len(names))
+    return CL, CD
+
+
+def compare_profiles(profile_names: Sequence[str], profiles_data: Dict, alpha,
+                     V: float, rho: float, S: float, chord: float = 1.0, resolution: Optional[float] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     method: str = "linear") -> Dict[str, np.ndarray]:
+    """
+    Evaluates several profiles on one shared angle-of-attack grid.
+
+    Coefficients are computed for all profiles in one (profiles x angles)
+    array; exact linear lookups evaluate a `PackedPolarLibrary` in a single
+    call instead of looping over the profiles. Angles outside a profile's
+    tabulated range are set to NaN rather than clamped, so profiles are only
+    compared where they have data.
+
+    Args:
+        profile_names: Profiles to compare
+        profiles_data: Aerodynamic data dictionary
+        alpha: Shared angles of attack [°]
+        V: Flight speed [m/s]
+        rho: Air density [kg/m³]
+        S: Wing surface area [m²]
+        chord: Chord length [m], for the Reynolds number of Re-dependent profiles
+        resolution: Optional uniform-grid spacing [°] for resampled lookups
+        progress: Optional callback receiving (profiles done, total profiles)
+        method: Interpolation in alpha - "linear", "pchip" or "spline"
+
+    Returns:
+        Dictionary with "profiles", "alpha", the "reynolds_number" of the
+        condition and (profiles x angles) arrays "CL", "CD", "lift", "drag"
+        and "L_D_ratio"
+
+    Raises:
+        ValueError: If a profile is unknown or the flight parameters are invalid
+    """
+    if V <= 0:
+        raise ValueError("Velocity must be greater than zero.")
+    if rho <= 0:
+        raise ValueError("Air density must be greater than zero.")
+    if S <= 0:
+        raise ValueError("Wing area must be greater than zero.")
+
+    alpha = np.asarray(alpha, dtype=np.float64)
+    names = list(profile_names)
+    reynolds = calculate_reynolds_number(V, chord)
+    if names and resolution is None and method == "linear":
+        # Exact linear polars: every profile in one packed evaluation
+        CL, CD = PackedPolarLibrary.from_profiles(names, profiles_data, reynolds).evaluate(alpha, clamp=False)
+        if progress is not None:
+            progress(len(names), len(names))
+    else:
+        CL, CD = _evaluate_each(names, profiles_data, alpha, reynolds, resolution, method, progress)
+
+    q_S = 0.5 * rho * V**2 * S
+    with np.errstate(divide="ignore", invalid="ignore"):
+        L_D_ratio = np.where(CD > 0, CL / CD, np.inf)
+    L_D_ratio[np.isnan(CD)] = np.nan
+
+    return {
+        "profiles": names,
+        "alpha": alpha,
+        "reynolds_number": reynolds,
+        "CL": CL,
+        "CD": CD,
+        "lift": q_S * CL,
+        "drag": q_S * CD,
+        "L_D_ratio": L_D_ratio
+    }
+
+
+def rank_profiles(comparison: Dict, optima: Optional[Dict] = None) -> List[Dict]:
+    """
+    Summarizes a comparison and ranks the profiles by maximum L/D.
+
+    Args:
+        comparison: Result of `compare_profiles`
+        optima: Optional exact optima from `find_optima`, limited to the grid's
+            alpha range and computed with the comparison's interpolation
+            method and "reynolds_number"; used instead of the grid maxima
+            when given
+
+    Returns:
+        One dictionary per profile with "rank", "profile", "max_L_D",
+        "alpha_at_max_L_D" and "CL_max", best first. Profiles without data
+        on the grid come last with None values.
+    """
+    alpha = comparison["alpha"]
+    L_D = comparison["L_D_ratio"]
+    CL = comparison["CL"]
+    has_data = ~np.all(np.isnan(L_D), axis=1)
+
+    # argmax over rows with NaN replaced, so empty rows do not raise
+    best = np.argmax(np.where(np.isnan(L_D), -np.inf, L_D), axis=1)
+    rows = np.arange(len(best))
+    max_L_D = L_D[rows, best]
+    alpha_at_max = alpha[best]
+    CL_max = np.max(np.where(np.isnan(CL), -np.inf, CL), axis=1)
+
+    if optima is not None:
+        for i, name in enumerate(comparison["profiles"]):
+            optimum = optima[name]["L_D_ratio"]
+            if optimum is not None:
+                max_L_D[i], alpha_at_max[i] = optimum["value"], optimum["alpha"]
+                CL_max[i] = optima[name]["CL_max"]["value"]
+
+    order = sorted(rows, key=lambda i: (not has_data[i], -max_L_D[i] if has_data[i] else 0.0))
+    ranking = []
+    for rank, i in enumerate(order, start=1):
+        ranking.append({
+            "rank": rank,
+            "profile": comparison["profiles"][i],
+            "max_L_D": float(max_L_D[i]) if has_data[i] else None,
+            "alpha_at_max_L_D": float(alpha_at_max[i]) if has_data[i] else None,
+            "CL_max": float(CL_max[i]) if has_data[i] else None
+        })
+    return ranking
@@ -0,0 +1,182 @@
+"""
+Lightweight hot-path instrumentation: call counts and log2 latency
+histograms per named operation.
+
+Recording is off by default and costs one flag check per call while off.
+Switch it on with the AIRFOIL_PROFILING environment variable (any value but
+"", "0", "false", "no", "off") or with `enable()`, read the numbers with
+`snapshot()` and save them with `dump()`. If the variable names a .json
+file, the numbers are also dumped there when the process exits.
+
+Usage:
+    @instrumented("analysis.analyze_airfoil")
+    def analyze_airfoil(...): ...
+
+    with timed("chart.draw"):
+        canvas.draw()
+"""
+import atexit
+import json
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Optional
+
+ENV_VARIABLE = "AIRFOIL_PROFILING"
+
+# Bucket i of a histogram counts calls that took [2^(i-1), 2^i) nanoseconds
+HISTOGRAM_BUCKETS = 64
+
+_setting = os.environ.get(ENV_VARIABLE, "").strip()
+_enabled = _setting.lower() not in ("", "0", "false", "no", "off")
+_stats = {}
+_lock = threading.Lock()
+
+
+class _Stat:
+    """Counters of one operation"""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, elapsed_ns):
+        self.count += 1
+        self.total += elapsed_ns
+        if self.min is None or elapsed_ns < self.min:
+            self.min = elapsed_ns
+        if elapsed_ns > self.max:
+            self.max = elapsed_ns
+        self.buckets[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def quantile(self, q):
+        """Upper bound [ns] of the histogram bucket holding the q-quantile"""
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= target:
+                return min(2**i, self.max)
+        return self.max
+
+
+def enable():
+    """Start recording"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording; collected numbers are kept"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Drop all collected numbers"""
+    with _lock:
+        _stats.clear()
+
+
+def record(name: str, elapsed_ns: int):
+    """Adds one call of `name` that took `elapsed_ns` nanoseconds"""
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.add(elapsed_ns)
+
+
+def instrumented(name: str):
+    """Decorator recording every call of the function under `name` while enabled"""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def timed(name: str):
+    """Context manager recording the duration of its block under `name` while enabled"""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter_ns() - start)
+
+
+def snapshot() -> Dict[str, Dict]:
+    """
+    Returns:
+        Dictionary operation -> {"count", "total", "mean", "min", "max",
+        "p50", "p90", "p99", "histogram"}; times in seconds, quantiles are
+        histogram bucket bounds and "histogram" maps each non-empty bucket's
+        upper bound [s] to its call count
+    """
+    with _lock:
+        result = {}
+        for name, stat in sorted(_stats.items()):
+            result[name] = {
+                "count": stat.count,
+                "total": stat.total / 1e9,
+                "mean": stat.total / stat.count / 1e9,
+                "min": stat.min / 1e9,
+                "max": stat.max / 1e9,
+                "p50": stat.quantile(0.5) / 1e9,
+                "p90": stat.quantile(0.9) / 1e9,
+                "p99": stat.quantile(0.99) / 1e9,
+                "histogram": {f"{2**i / 1e9:.3g}": n for i, n in enumerate(stat.buckets) if n}
+            }
+        return result
+
+
+def dump(path: Optional[str] = None) -> str:
+    """
+    Writes the snapshot with host information as JSON.
+
+    Args:
+        path: Output file; None only returns the JSON text
+
+    Returns:
+        The JSON text
+    """
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "enabled": _enabled,
+        "operations": snapshot()
+    }
+    text = json.dumps(report, indent=2)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
+
+
+if _setting.lower().endswith(".json"):
+    atexit.register(dump, _setting)
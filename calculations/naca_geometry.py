@@ -0,0 +1,131 @@
+import re
+from typing import Dict, Tuple
+
+import numpy as np
+
+# Mean lines of the 5-digit series for a design lift coefficient of 0.3,
+# keyed by the (P, Q) digits: (m, k1, k2/k1). Q = 1 marks reflexed lines.
+FIVE_DIGIT_MEAN_LINES = {
+    (1, 0): (0.0580, 361.400, 0.0),
+    (2, 0): (0.1260, 51.640, 0.0),
+    (3, 0): (0.2025, 15.957, 0.0),
+    (4, 0): (0.2900, 6.643, 0.0),
+    (5, 0): (0.3910, 3.230, 0.0),
+    (2, 1): (0.1300, 51.990, 0.000764),
+    (3, 1): (0.2170, 15.793, 0.00677),
+    (4, 1): (0.3180, 6.520, 0.0303),
+    (5, 1): (0.4410, 3.191, 0.1355),
+}
+
+
+def parse_designation(designation: str) -> Dict:
+    """
+    Parses a NACA 4- or 5-digit designation such as "2412", "NACA 0012" or
+    "naca23012".
+
+    Returns:
+        Dictionary with "digits", "series" (4 or 5), "thickness" (fraction of
+        the chord) and the mean-line parameters of the series
+
+    Raises:
+        ValueError: If the designation is not a supported 4- or 5-digit code
+    """
+    digits = re.sub(r"^\s*NACA[\s-]*", "", str(designation).strip(), flags=re.IGNORECASE).replace(" ", "")
+    if not re.fullmatch(r"\d{4}|\d{5}", digits):
+        raise ValueError(f"'{designation}' is not a NACA 4- or 5-digit designation")
+
+    thickness = int(digits[-2:]) / 100
+    if thickness <= 0:
+        raise ValueError("The airfoil thickness must be greater than zero.")
+
+    if len(digits) == 4:
+        camber, position = int(digits[0]) / 100, int(digits[1]) / 10
+        if camber > 0 and position == 0:
+            raise ValueError(f"NACA {digits}: a cambered airfoil needs a maximum camber position")
+        return {"digits": digits, "series": 4, "thickness": thickness,
+                "camber": camber, "camber_position": position}
+
+    lift, key = int(digits[0]), (int(digits[1]), int(digits[2]))
+    if key not in FIVE_DIGIT_MEAN_LINES:
+        raise ValueError(f"NACA {digits}: unknown 5-digit mean line {digits[:3]}")
+    m, k1, k2_k1 = FIVE_DIGIT_MEAN_LINES[key]
+    return {"digits": digits, "series": 5, "thickness": thickness, "design_lift": 0.15 * lift,
+            "m": m, "k1": k1 * lift / 2, "k2_k1": k2_k1}
+
+
+def thickness_distribution(x, thickness: float, closed_trailing_edge: bool = True) -> np.ndarray:
+    """Half thickness of the NACA 4-digit family at chord positions x (0..1)"""
+    last = -0.1036 if closed_trailing_edge else -0.1015
+    return 5 * thickness * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 + last * x**4)
+
+
+def mean_line(x, parameters: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Camber line and its slope at chord positions x (0..1).
+
+    Args:
+        x: Chord positions
+        parameters: Result of `parse_designation`
+
+    Returns:
+        Tuple (y_c, dy_c/dx)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if parameters["series"] == 4:
+        m, p = parameters["camber"], parameters["camber_position"]
+        if m == 0:
+            return np.zeros_like(x), np.zeros_like(x)
+        front = x < p
+        yc = np.where(front, m / p**2 * (2 * p * x - x**2), m / (1 - p)**2 * (1 - 2 * p + 2 * p * x - x**2))
+        slope = np.where(front, 2 * m / p**2 * (p - x), 2 * m / (1 - p)**2 * (p - x))
+        return yc, slope
+
+    m, k1, r = parameters["m"], parameters["k1"], parameters["k2_k1"]
+    front = x < m
+    if r == 0:
+        yc = np.where(front, k1 / 6 * (x**3 - 3 * m * x**2 + m**2 * (3 - m) * x), k1 * m**3 / 6 * (1 - x))
+        slope = np.where(front, k1 / 6 * (3 * x**2 - 6 * m * x + m**2 * (3 - m)), -k1 * m**3 / 6)
+        return yc, slope
+
+    tail = r * (1 - m)**3 * x + m**3 * x - m**3
+    yc = np.where(front, k1 / 6 * ((x - m)**3 - tail), k1 / 6 * (r * (x - m)**3 - tail))
+    slope = np.where(front, k1 / 6 * (3 * (x - m)**2 - r * (1 - m)**3 - m**3),
+                     k1 / 6 * (3 * r * (x - m)**2 - r * (1 - m)**3 - m**3))
+    return yc, slope
+
+
+def naca_coordinates(designation: str, n_panels: int = 200,
+                     closed_trailing_edge: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Surface coordinates of a NACA 4- or 5-digit airfoil with unit chord.
+
+    Points are cosine spaced (dense at both edges) and ordered clockwise:
+    from the trailing edge along the lower surface to the leading edge and
+    back along the upper surface, the order the panel method expects.
+
+    Args:
+        designation: NACA designation, e.g. "2412" or "NACA 23012"
+        n_panels: Number of panels (rounded down to an even number)
+        closed_trailing_edge: Use the thickness form with a sharp trailing edge
+
+    Returns:
+        Tuple (x, y) of n_panels + 1 points; the first and last points are the
+        trailing edge
+
+    Raises:
+        ValueError: If the designation is invalid or n_panels is below 10
+    """
+    if n_panels < 10:
+        raise ValueError("At least 10 panels are needed.")
+    parameters = parse_designation(designation)
+
+    beta = np.linspace(0.0, np.pi, n_panels // 2 + 1)
+    x = 0.5 * (1 - np.cos(beta))
+    yt = thickness_distribution(x, parameters["thickness"], closed_trailing_edge)
+    yc, slope = mean_line(x, parameters)
+    theta = np.arctan(slope)
+
+    x_upper, y_upper = x - yt * np.sin(theta), yc + yt * np.cos(theta)
+    x_lower, y_lower = x + yt * np.sin(theta), yc - yt * np.cos(theta)
+    return (np.concatenate((x_lower[::-1], x_upper[1:])),
+            np.concatenate((y_lower[::-1], y_upper[1:])))
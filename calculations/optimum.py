@@ -0,0 +1,254 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calculations.polar_table import ReynoldsPolarTable, get_polar_table
+
+# Efficiency ratios CL^p / CD^q, named as in `calculate_efficiency_metrics_batch`
+OPTIMUM_METRICS = {
+    "L_D_ratio": (1.0, 1.0),
+    "drag_efficiency": (1.5, 1.0),
+    "power_factor": (3.0, 2.0)
+}
+
+# Coefficients below this fraction of a polynomial's largest one (in the
+# segment-normalized variable) are treated as zero when finding its roots
+ROOT_TOLERANCE = 1e-13
+
+
+def _segments(profile_names, profiles_data, method="linear", reynolds=None):
+    """
+    Concatenates the segments of all profiles as cubics in the offset from
+    their start angle: start angle, width, coefficients, owner.
+
+    The coefficients have shape (segments, 4, 2) for CL and CD, lowest order
+    first, like `CubicPolarTable.coefficients`; linear segments have zero
+    quadratic and cubic terms.
+    """
+    tables = []
+    for name in profile_names:
+        table = get_polar_table(name, profiles_data, method=method)
+        if isinstance(table, ReynoldsPolarTable):
+            table = table.reference if reynolds is None else table.at_reynolds(reynolds)
+        tables.append(table)
+    alpha0 = np.concatenate([table.alpha[:-1] for table in tables])
+    width = np.concatenate([np.diff(table.alpha) for table in tables])
+    coefficients = np.zeros((len(alpha0), 4, 2))
+    row = 0
+    for table in tables:
+        n = len(table) - 1
+        if hasattr(table, "coefficients"):
+            coefficients[row:row + n] = table.coefficients
+        else:
+            coefficients[row:row + n, 0] = table.values[:-1]
+            coefficients[row:row + n, 1] = table.slopes
+        row += n
+    owner = np.repeat(np.arange(len(tables)), [len(table) - 1 for table in tables])
+    return alpha0, width, coefficients, owner
+
+
+def _polyval(coefficients, t):
+    """Polynomials (rows of lowest-order-first coefficients) at offsets t of shape (rows, ...)"""
+    result = np.zeros_like(t)
+    for k in range(coefficients.shape[1] - 1, -1, -1):
+        result = result * t + coefficients[:, k].reshape((-1,) + (1,) * (t.ndim - 1))
+    return result
+
+
+def _derivative(coefficients):
+    return coefficients[:, 1:] * np.arange(1, coefficients.shape[1])
+
+
+def _polymul(a, b):
+    product = np.zeros((len(a), a.shape[1] + b.shape[1] - 1))
+    for k in range(a.shape[1]):
+        product[:, k:k + b.shape[1]] += a[:, k, None] * b
+    return product
+
+
+def _stationary_points(derivative, width):
+    """
+    Real zeros of the polynomials `derivative` inside their segments [0, width].
+
+    The roots are the eigenvalues of each polynomial's companion matrix (as in
+    `np.roots`), computed for all segments of the same degree in one batched
+    `eigvals` call. Close and double (tangential) roots are found as well, as
+    they need no sign change. The real part of every eigenvalue is kept: a
+    complex pair only adds a feasible candidate point, which cannot raise the
+    maximum above the true one.
+
+    Returns:
+        Array (degree, segments) of offsets, NaN where a segment has fewer
+        roots inside [0, width]
+    """
+    degree = derivative.shape[1] - 1
+    # Polynomials in u = t / width on [0, 1], so the tolerance is scale-free
+    scaled = derivative * width[:, None] ** np.arange(degree + 1)
+    scale = np.abs(scaled).max(axis=1, keepdims=True)
+    significant = np.abs(scaled) > ROOT_TOLERANCE * scale
+    effective = np.where(significant.any(axis=1),
+                         degree - np.argmax(significant[:, ::-1], axis=1), 0)
+
+    roots = np.full((len(derivative), degree), np.nan)
+    for d in range(1, degree + 1):
+        rows = np.flatnonzero(effective == d)
+        if not len(rows):
+            continue
+        monic = scaled[rows, :d] / scaled[rows, d, None]
+        companion = np.zeros((len(rows), d, d))
+        companion[:, 1:, :-1] = np.eye(d - 1)
+        companion[:, :, -1] = -monic
+        u = np.linalg.eigvals(companion).real
+        roots[rows, :d] = np.where((u >= 0) & (u <= 1), u, np.nan) * width[rows, None]
+    return roots.T
+
+
+def _ratio(CL, CD, p, q):
+    """CL^p / CD^q, or -inf where it is undefined (CD <= 0, or CL < 0 with fractional p)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = np.sign(CL) * np.abs(CL)**p / CD**q
+    valid = (CD > 0) & ((CL >= 0) | (p == np.floor(p)))
+    return np.where(valid, value, -np.inf)
+
+
+def _group_argmax(value, owner, n_groups):
+    """Index of the largest value of every owner group (-1 for empty groups)"""
+    order = np.lexsort((-value, owner))
+    first = np.full(n_groups, -1)
+    starts = np.flatnonzero(np.r_[True, owner[order][1:] != owner[order][:-1]])
+    first[owner[order][starts]] = order[starts]
+    return first
+
+
+def find_optima(profile_names: Sequence[str], profiles_data: Dict,
+                alpha_range: Optional[Tuple[float, float]] = None,
+                method: str = "linear", reynolds: Optional[float] = None) -> Dict[str, Dict]:
+    """
+    Exact maxima of CL, L/D, CL^1.5/CD and CL^3/CD^2 on the interpolated polars.
+
+    With linear interpolation CL = a + b*x and CD = c + d*x on every segment,
+    so the maximum of CL^p / CD^q on a segment lies either at its ends or at
+    the single critical point x = (q*d*a - p*b*c) / (b*d*(p - q)). For L/D
+    (p = q) the ratio is monotonic and only the ends count. All segments of
+    all profiles are evaluated together in one vectorized pass.
+    Reynolds-dependent profiles are solved on their polar at `reynolds`
+    (exact, see `ReynoldsPolarTable.at_reynolds`), or on their reference
+    polar without one.
+
+    The smooth modes ("pchip", "spline") have cubic segments. The interior
+    candidates are then the zeros of CL' (for CL_max) and of
+    p*CL'*CD - q*CL*CD' (the numerator of the ratio's derivative), a
+    polynomial of degree 5 at most, whose roots are taken directly.
+
+    Args:
+        profile_names: Profiles to solve
+        profiles_data: Aerodynamic data dictionary
+        alpha_range: Optional (min, max) angles [°] the search is limited to
+        method: Interpolation in alpha, as in `get_polar_table`
+        reynolds: Reynolds number of the flight condition, for
+            Reynolds-dependent profiles
+
+    Returns:
+        Dictionary profile -> {"CL_max": {...}, "L_D_ratio": {...},
+        "drag_efficiency": {...}, "power_factor": {...}}, where each optimum is
+        {"value", "alpha", "CL", "CD"}, or None if no point qualifies
+
+    Raises:
+        ValueError: If a profile is not found in the data or the method is unknown
+    """
+    names = list(profile_names)
+    if not names:
+        return {}
+    lo, hi = alpha_range if alpha_range is not None else (-np.inf, np.inf)
+
+    alpha0, width, coefficients, owner = _segments(names, profiles_data, method, reynolds)
+    start = np.maximum(alpha0, lo)
+    end = np.minimum(alpha0 + width, hi)
+    inside = start <= end
+    x_ends = np.concatenate((start - alpha0, end - alpha0))
+
+    candidates = {}
+    if method == "linear":
+        a, c = coefficients[:, 0, 0], coefficients[:, 0, 1]
+        b, d = coefficients[:, 1, 0], coefficients[:, 1, 1]
+        for metric, (p, q) in OPTIMUM_METRICS.items():
+            x = [x_ends]
+            if p != q:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    critical = (q * d * a - p * b * c) / (b * d * (p - q))
+                x.append(np.where(np.isfinite(critical), critical, -1.0))
+            candidates[metric] = np.concatenate(x)
+        candidates["CL_max"] = x_ends
+    else:
+        lift, drag = coefficients[..., 0], coefficients[..., 1]
+        d_lift, d_drag = _derivative(lift), _derivative(drag)
+        for metric, (p, q) in OPTIMUM_METRICS.items():
+            numerator = p * _polymul(d_lift, drag) - q * _polymul(lift, d_drag)
+            candidates[metric] = np.concatenate((x_ends, _stationary_points(numerator, width).ravel()))
+        candidates["CL_max"] = np.concatenate((x_ends, _stationary_points(d_lift, width).ravel()))
+
+    results = {name: {} for name in names}
+    for metric, x in candidates.items():
+        repeats = len(x) // len(alpha0)
+        seg = np.tile(np.arange(len(alpha0)), repeats)
+        alpha = alpha0[seg] + x
+        valid = np.tile(inside, repeats) & (alpha >= start[seg]) & (alpha <= end[seg])
+
+        x = np.where(valid, x, 0.0)
+        CL = _polyval(coefficients[seg, :, 0], x)
+        CD = _polyval(coefficients[seg, :, 1], x)
+        if metric == "CL_max":
+            value = CL
+        else:
+            value = _ratio(CL, CD, *OPTIMUM_METRICS[metric])
+        value = np.where(valid, value, -np.inf)
+
+        best = _group_argmax(value, owner[seg], len(names))
+        for i, name in enumerate(names):
+            j = best[i]
+            if j < 0 or value[j] == -np.inf:
+                results[name][metric] = None
+            else:
+                results[name][metric] = {"value": float(value[j]), "alpha": float(alpha[j]),
+                                         "CL": float(CL[j]), "CD": float(CD[j])}
+    return results
+
+
+def optimum_speeds(optima: Dict, weight: float, rho: float, S: float) -> Dict[str, Optional[Dict]]:
+    """
+    Minimum-drag and minimum-power flight conditions in steady level flight.
+
+    Minimum drag is flown at maximum L/D and minimum power at maximum
+    CL^1.5/CD, at the speed where lift equals weight: V = sqrt(2W / (rho S CL)).
+
+    Args:
+        optima: Optima of one profile, from `find_optima`
+        weight: Aircraft weight [N]
+        rho: Air density [kg/m³]
+        S: Wing surface area [m²]
+
+    Returns:
+        {"min_drag": {...}, "min_power": {...}}, each with "velocity",
+        "alpha", "CL", "CD", "drag" and "power", or None without a valid optimum
+
+    Raises:
+        ValueError: If weight, density or wing area are not positive
+    """
+    if weight <= 0:
+        raise ValueError("Weight must be greater than zero.")
+    if rho <= 0:
+        raise ValueError("Air density must be greater than zero.")
+    if S <= 0:
+        raise ValueError("Wing area must be greater than zero.")
+
+    speeds = {}
+    for key, metric in (("min_drag", "L_D_ratio"), ("min_power", "drag_efficiency")):
+        optimum = optima.get(metric)
+        if optimum is None or optimum["CL"] <= 0:
+            speeds[key] = None
+            continue
+        velocity = float(np.sqrt(2 * weight / (rho * S * optimum["CL"])))
+        drag = weight * optimum["CD"] / optimum["CL"]
+        speeds[key] = {"velocity": velocity, "alpha": optimum["alpha"], "CL": optimum["CL"],
+                       "CD": optimum["CD"], "drag": drag, "power": drag * velocity}
+    return speeds
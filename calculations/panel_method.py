@@ -0,0 +1,237 @@
+"""
+Linear-strength vortex panel method (Kuethe and Chow) for synthesizing airfoil
+polars from NACA 4- and 5-digit designations.
+
+The potential-flow solution gives the lift; profile drag is estimated from
+the skin friction of a flat plate with a thickness form factor. The flow
+stays attached in this model, so generated polars have no stall and should
+be limited to moderate angles of attack.
+"""
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from calculations.naca_geometry import naca_coordinates, parse_designation
+
+# Angles of attack of generated polars [°]: the attached-flow range
+DEFAULT_ALPHA = np.arange(-10.0, 15.0 + 0.5, 1.0)
+# Reynolds numbers of generated polars (the drag estimate depends on Re)
+DEFAULT_REYNOLDS = (1e5, 3e5, 1e6, 3e6, 1e7)
+DEFAULT_PANELS = 200
+
+# Control points per block of the influence-matrix assembly
+INFLUENCE_BLOCK = 64
+
+# Growth of the profile drag with lift away from the drag-bucket centre
+DRAG_DUE_TO_LIFT = 0.01
+
+
+class PanelSolver:
+    """
+    Linear-strength vortex panel solution of one airfoil geometry.
+
+    The influence matrix depends only on the geometry. The right-hand side,
+    sin(theta_i - alpha), is linear in cos(alpha) and sin(alpha), so the
+    system is factorized and solved once for those two unit free streams and
+    the vortex strengths at any angle of attack are their combination. Every
+    further angle costs O(panels).
+    """
+
+    def __init__(self, x, y):
+        """
+        Args:
+            x, y: Closed contour, clockwise from the trailing edge along the
+                lower surface (see `naca_coordinates`), unit chord
+
+        Raises:
+            ValueError: If the contour has fewer than 3 panels
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.ndim != 1 or x.shape != y.shape or len(x) < 4:
+            raise ValueError("A panel contour needs at least 4 points")
+        self.x, self.y = x, y
+
+        dx, dy = np.diff(x), np.diff(y)
+        self.lengths = np.hypot(dx, dy)
+        self.theta = np.arctan2(dy, dx)
+        self._cos, self._sin = np.cos(self.theta), np.sin(self.theta)
+        self.control_x = 0.5 * (x[:-1] + x[1:])
+        self.control_y = 0.5 * (y[:-1] + y[1:])
+
+        normal, tangential = self._influence_coefficients()
+        n = len(self.lengths)
+        # Rows: flow tangency at every control point plus the Kutta condition
+        matrix = np.zeros((n + 1, n + 1))
+        matrix[:n] = normal
+        matrix[n, 0] = matrix[n, n] = 1.0
+
+        # Unit free streams along x (cos alpha) and y (sin alpha)
+        rhs = np.zeros((n + 1, 2))
+        rhs[:n, 0] = self._sin
+        rhs[:n, 1] = -self._cos
+        self.gamma = np.linalg.solve(matrix, rhs)
+
+        # Surface speed of each unit free stream
+        self.speed = tangential @ self.gamma + np.column_stack((self._cos, self._sin))
+
+    def _influence_coefficients(self):
+        """Normal and tangential influence of the node vortex strengths, shape (panels, panels + 1)"""
+        n = len(self.lengths)
+        normal = np.zeros((n, n + 1))
+        tangential = np.zeros((n, n + 1))
+        # Blocks of control points keep the (block x panels) temporaries in cache
+        for start in range(0, n, INFLUENCE_BLOCK):
+            rows = slice(start, min(start + INFLUENCE_BLOCK, n))
+            cn1, cn2, ct1, ct2 = self._panel_coefficients(rows)
+            # Node j collects the end of panel j - 1 and the start of panel j
+            normal[rows, :-1] += cn1
+            normal[rows, 1:] += cn2
+            tangential[rows, :-1] += ct1
+            tangential[rows, 1:] += ct2
+        return normal, tangential
+
+    def _panel_coefficients(self, rows):
+        """Kuethe and Chow's CN1, CN2, CT1 and CT2 of the control points `rows` and all panels"""
+        xi = self.control_x[rows, None] - self.x[None, :-1]
+        eta = self.control_y[rows, None] - self.y[None, :-1]
+        s = self.lengths[None, :]
+
+        # Angle differences through products of the per-panel sines and
+        # cosines, so only the log and arctan below are evaluated per pair
+        cos_i, sin_i = self._cos[rows, None], self._sin[rows, None]
+        cos_j, sin_j = self._cos[None, :], self._sin[None, :]
+
+        A = -xi * cos_j - eta * sin_j
+        B = xi**2 + eta**2
+        C = sin_i * cos_j - cos_i * sin_j  # sin(theta_i - theta_j)
+        D = cos_i * cos_j + sin_i * sin_j  # cos(theta_i - theta_j)
+        E = xi * sin_j - eta * cos_j
+        F = 0.5 * np.log1p(s * (s + 2 * A) / B) / s
+        G = np.arctan2(E * s, B + A * s) / s
+        # Kuethe and Chow's P and Q terms reduce to -U and -W
+        U = A * C + D * E
+        W = A * D - C * E
+
+        cn2 = D - (W * F + U * G)
+        cn1 = D * F * s + C * G * s - cn2
+        ct2 = C + (W * G - U * F)
+        ct1 = C * F * s - D * G * s - ct2
+
+        # A panel's own control point: analytic limit of the expressions above
+        local = np.arange(rows.stop - rows.start)
+        own = local + rows.start
+        cn1[local, own], cn2[local, own] = -1.0, 1.0
+        ct1[local, own] = ct2[local, own] = 0.5 * np.pi
+        return cn1, cn2, ct1, ct2
+
+    def _free_stream(self, alpha):
+        alpha = np.radians(np.asarray(alpha, dtype=np.float64))
+        return np.stack((np.cos(alpha), np.sin(alpha)), axis=-1)
+
+    def pressure_coefficient(self, alpha) -> np.ndarray:
+        """
+        Surface pressure coefficients at the control points.
+
+        Args:
+            alpha: Angle(s) of attack [°]
+
+        Returns:
+            Array of shape (*alpha.shape, panels)
+        """
+        speed = self._free_stream(alpha) @ self.speed.T
+        return 1.0 - speed**2
+
+    def lift_coefficient(self, alpha) -> np.ndarray:
+        """
+        Lift coefficient from the circulation (Kutta-Joukowski).
+
+        Args:
+            alpha: Angle(s) of attack [°]
+
+        Returns:
+            Array of the shape of alpha
+        """
+        # Circulation of each unit free stream, with gamma scaled by 2*pi*V
+        circulation = 2 * np.pi * (0.5 * (self.gamma[:-1] + self.gamma[1:]) * self.lengths[:, None]).sum(axis=0)
+        chord = self.x.max() - self.x.min()
+        return self._free_stream(alpha) @ (2 * circulation / chord)
+
+
+def skin_friction(reynolds):
+    """
+    Flat-plate skin friction coefficient: Blasius (laminar) or the
+    Prandtl-Schlichting mixed laminar/turbulent law, whichever is larger.
+    """
+    reynolds = np.asarray(reynolds, dtype=np.float64)
+    return np.maximum(1.328 / np.sqrt(reynolds), 0.074 * reynolds**-0.2 - 1742.0 / reynolds)
+
+
+def profile_drag(CL, thickness: float, reynolds, design_lift: float = 0.0):
+    """
+    Estimated profile drag coefficient.
+
+    Skin friction on both surfaces times the form factor
+    1 + 2 t/c + 60 (t/c)^4, growing quadratically with the lift away from
+    the design lift coefficient.
+
+    Args:
+        CL: Lift coefficient(s)
+        thickness: Thickness ratio t/c
+        reynolds: Reynolds number(s), broadcast against CL
+        design_lift: Centre of the drag bucket
+    """
+    form_factor = 1 + 2 * thickness + 60 * thickness**4
+    return 2 * skin_friction(reynolds) * form_factor + DRAG_DUE_TO_LIFT * (np.asarray(CL) - design_lift)**2
+
+
+def generate_polar(designation: str, alpha: Optional[Sequence[float]] = None,
+                   reynolds=DEFAULT_REYNOLDS, n_panels: int = DEFAULT_PANELS,
+                   should_stop: Optional[Callable[[], bool]] = None) -> Optional[Dict]:
+    """
+    Synthesizes the polar of a NACA 4- or 5-digit airfoil.
+
+    Args:
+        designation: NACA designation, e.g. "4415" or "NACA 23012"
+        alpha: Angles of attack [°] (defaults to `DEFAULT_ALPHA`)
+        reynolds: One Reynolds number for a plain polar, or several for a
+            Reynolds-dependent profile (same lift, Re-dependent drag)
+        n_panels: Number of panels of the geometry
+        should_stop: Optional callable polled between the solution steps;
+            generation is abandoned once it returns True
+
+    Returns:
+        Profile dictionary in the usual format: "alpha", "CL" and "CD" lists,
+        plus "Re" with (Re x alpha) nested lists when several Reynolds
+        numbers are given; None if stopped by `should_stop`
+
+    Raises:
+        ValueError: If the designation, panel count or Reynolds numbers are invalid
+    """
+    parameters = parse_designation(designation)
+    alpha = np.asarray(DEFAULT_ALPHA if alpha is None else alpha, dtype=np.float64)
+    if alpha.ndim != 1 or len(alpha) < 2 or np.any(np.diff(alpha) <= 0):
+        raise ValueError("Angles of attack must be at least 2 strictly ascending values")
+    reynolds = np.asarray(reynolds, dtype=np.float64)
+    if np.any(reynolds <= 0):
+        raise ValueError("Reynolds numbers must be greater than zero.")
+
+    stopped = should_stop if should_stop is not None else (lambda: False)
+    geometry = naca_coordinates(parameters["digits"], n_panels)
+    if stopped():
+        return None
+    solver = PanelSolver(*geometry)
+    if stopped():
+        return None
+    CL = solver.lift_coefficient(alpha)
+    # Bucket centred on the design lift (5-digit) or on the zero-incidence lift
+    design_lift = parameters.get("design_lift", float(solver.lift_coefficient(0.0)))
+
+    if reynolds.ndim == 0:
+        CD = profile_drag(CL, parameters["thickness"], reynolds, design_lift)
+        return {"alpha": alpha.tolist(), "CL": CL.tolist(), "CD": CD.tolist()}
+
+    reynolds = np.unique(reynolds)
+    CD = profile_drag(CL[None, :], parameters["thickness"], reynolds[:, None], design_lift)
+    return {"alpha": alpha.tolist(), "Re": reynolds.tolist(),
+            "CL": np.tile(CL, (len(reynolds), 1)).tolist(), "CD": CD.tolist()}
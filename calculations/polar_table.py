@@ -0,0 +1,773 @@
+import threading
+
+import numpy as np
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Tuple, Dict, Optional
+
+
+class PolarTable:
+    """
+    Compiled, read-only form of a single airfoil polar.
+
+    The tabulated angles and coefficients are stored once as contiguous
+    float64 arrays together with the slope of every segment, so a lookup
+    needs one `searchsorted` for CL and CD together instead of two
+    `np.interp` calls that convert the source lists each time.
+    Out-of-range angles are clamped to the end points, like `np.interp`.
+    """
+
+    __slots__ = ("alpha", "values", "slopes", "source", "_alpha_list", "_rows", "_first", "_last", "_cl_max")
+
+    def __init__(self, alpha, CL, CD, source=None):
+        """
+        Args:
+            alpha: Angles of attack [°] in ascending order
+            CL: Lift coefficients at each angle
+            CD: Drag coefficients at each angle
+            source: Profile dictionary the table was built from (optional)
+        """
+        self.alpha = np.ascontiguousarray(alpha, dtype=np.float64)
+        # One row per tabulated angle: (CL, CD)
+        self.values = np.ascontiguousarray(np.column_stack((CL, CD)), dtype=np.float64)
+
+        if self.alpha.ndim != 1 or len(self.alpha) < 2:
+            raise ValueError("A polar needs at least 2 angle of attack points")
+        if self.values.shape[0] != len(self.alpha):
+            raise ValueError("All data columns must have the same length")
+
+        # Segment slopes d(CL, CD)/d(alpha); zero-width segments get zero slope
+        d_alpha = np.diff(self.alpha)
+        d_values = np.diff(self.values, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.where(d_alpha[:, None] > 0, d_values / d_alpha[:, None], 0.0)
+        self.slopes = np.ascontiguousarray(slopes)
+        self.source = source
+
+        # Plain Python copies for the scalar fast path: one row per segment
+        values = self.values.tolist()
+        self._alpha_list = self.alpha.tolist()
+        self._rows = [(a, v[0], v[1], s[0], s[1]) for a, v, s in
+                      zip(self._alpha_list, values, self.slopes.tolist())]
+        self._first = tuple(values[0])
+        self._last = tuple(values[-1])
+        self._cl_max = float(self.values[:, 0].max())
+
+    @classmethod
+    def from_profile(cls, profile_data: Dict) -> "PolarTable":
+        """Builds a table from a profile dictionary with alpha/CL/CD lists."""
+        return cls(profile_data["alpha"], profile_data["CL"], profile_data["CD"],
+                   source=profile_data)
+
+    def __len__(self):
+        return len(self._alpha_list)
+
+    def segment_index(self, angle) -> np.ndarray:
+        """Returns the index of the segment containing each (clamped) angle."""
+        idx = np.searchsorted(self.alpha, angle, side="right") - 1
+        return np.clip(idx, 0, len(self._alpha_list) - 2)
+
+    def evaluate(self, angle, reynolds=None):
+        """
+        Interpolates CL and CD at one or many angles of attack.
+
+        Args:
+            angle: Angle of attack [°], scalar or array
+            reynolds: Ignored; accepted so all polar tables share one interface
+
+        Returns:
+            Tuple (CL, CD) - floats for scalar input, arrays otherwise
+        """
+        if np.ndim(angle) == 0:
+            return self._evaluate_scalar(float(angle))
+
+        x = np.clip(np.asarray(angle, dtype=np.float64), self.alpha[0], self.alpha[-1])
+        idx = self.segment_index(x)
+        result = self.values[idx] + self.slopes[idx] * (x - self.alpha[idx])[..., None]
+        return result[..., 0], result[..., 1]
+
+    def max_lift(self, reynolds=None):
+        """
+        Maximum lift coefficient of the polar.
+
+        Args:
+            reynolds: Ignored apart from its shape; the result is broadcast to it
+        """
+        if reynolds is None:
+            return self._cl_max
+        return np.full(np.shape(reynolds), self._cl_max)
+
+    def _evaluate_scalar(self, angle: float) -> Tuple[float, float]:
+        alphas = self._alpha_list
+        # Also taken by NaN, which fails every comparison (np.interp gives NaN too)
+        if not angle < alphas[-1]:
+            return self._last if angle >= alphas[-1] else (np.nan, np.nan)
+        if angle <= alphas[0]:
+            return self._first
+
+        a0, cl0, cd0, cl_slope, cd_slope = self._rows[bisect_right(alphas, angle) - 1]
+        dx = angle - a0
+        return cl0 + cl_slope * dx, cd0 + cd_slope * dx
+
+
+# Finest accepted grid spacing of resampled polars [°]
+MIN_RESOLUTION = 1e-3
+
+
+class UniformPolarTable:
+    """
+    Polar resampled onto a uniform angle-of-attack grid.
+
+    Because the grid spacing is constant, a lookup is a direct index
+    computation plus one linear interpolation, independent of how many
+    (unevenly spaced) points the source polar has. The price is a small
+    resampling error, reported per coefficient in `max_error`.
+    """
+
+    __slots__ = ("alpha", "values", "slopes", "step", "max_error", "source",
+                 "_alpha_min", "_alpha_max", "_inv_step", "_last_cell", "_rows", "_first", "_last")
+
+    def __init__(self, table: PolarTable, resolution: float):
+        """
+        Args:
+            table: Compiled source polar
+            resolution: Requested grid spacing [°], at least MIN_RESOLUTION;
+                the actual `step` is adjusted slightly so the grid ends exactly
+                on the last angle
+
+        Raises:
+            ValueError: If the resolution is below MIN_RESOLUTION
+        """
+        if not resolution >= MIN_RESOLUTION:
+            raise ValueError(f"Resolution must be at least {MIN_RESOLUTION}°.")
+
+        alpha_min, alpha_max = float(table.alpha[0]), float(table.alpha[-1])
+        n_points = max(int(np.ceil((alpha_max - alpha_min) / resolution)) + 1, 2)
+
+        self.alpha = np.linspace(alpha_min, alpha_max, n_points)
+        self.step = (alpha_max - alpha_min) / (n_points - 1)
+        CL, CD = table.evaluate(self.alpha)
+        self.values = np.ascontiguousarray(np.column_stack((CL, CD)))
+        self.slopes = np.ascontiguousarray(np.diff(self.values, axis=0) / self.step)
+        self.source = table.source
+
+        self._alpha_min = alpha_min
+        self._alpha_max = alpha_max
+        self._inv_step = 1.0 / self.step
+        self._last_cell = n_points - 2
+        values = self.values.tolist()
+        self._rows = [(a, v[0], v[1], s[0], s[1]) for a, v, s in
+                      zip(self.alpha.tolist(), values, self.slopes.tolist())]
+        self._first = tuple(values[0])
+        self._last = tuple(values[-1])
+
+        # Both polars are piecewise linear and agree on the grid nodes, so the
+        # largest deviation occurs at one of the source break points
+        resampled = np.column_stack(self.evaluate(table.alpha))
+        error = np.abs(resampled - table.values).max(axis=0)
+        self.max_error = {"CL": float(error[0]), "CD": float(error[1])}
+
+    def __len__(self):
+        return len(self._rows) + 1
+
+    def evaluate(self, angle, reynolds=None):
+        """
+        Interpolates CL and CD at one or many angles of attack.
+
+        Args:
+            angle: Angle of attack [°], scalar or array
+            reynolds: Ignored; accepted so all polar tables share one interface
+
+        Returns:
+            Tuple (CL, CD) - floats for scalar input, arrays otherwise
+        """
+        if np.ndim(angle) == 0:
+            return self._evaluate_scalar(float(angle))
+
+        x = np.clip(np.asarray(angle, dtype=np.float64), self._alpha_min, self._alpha_max)
+        t = (x - self._alpha_min) * self._inv_step
+        # fmin maps NaN angles to a valid cell; their result stays NaN
+        idx = np.fmin(t, self._last_cell).astype(np.intp)
+        result = self.values[idx] + self.slopes[idx] * (x - self.alpha[idx])[..., None]
+        return result[..., 0], result[..., 1]
+
+    def _evaluate_scalar(self, angle: float) -> Tuple[float, float]:
+        # Also taken by NaN, which fails every comparison
+        if not angle < self._alpha_max:
+            return self._last if angle >= self._alpha_max else (np.nan, np.nan)
+        if angle <= self._alpha_min:
+            return self._first
+
+        cell = min(int((angle - self._alpha_min) * self._inv_step), self._last_cell)
+        a0, cl0, cd0, cl_slope, cd_slope = self._rows[cell]
+        dx = angle - a0
+        return cl0 + cl_slope * dx, cd0 + cd_slope * dx
+
+
+# Interpolation modes accepted by `get_polar_table`
+INTERPOLATION_METHODS = ("linear", "pchip", "spline")
+
+
+class CubicPolarTable:
+    """
+    Smooth (piecewise cubic) interpolation of a single polar.
+
+    "pchip" is the monotone cubic of Fritsch and Carlson: it passes through
+    every tabulated point without overshooting between them, so CL keeps a
+    single peak and CD never dips below its neighbours. "spline" is the
+    natural cubic spline with continuous curvature, which is smoother but may
+    overshoot near sharp corners such as the stall break.
+
+    The four polynomial coefficients of every segment are computed once and
+    stored for CL and CD together in `coefficients`, shape (segments, 4, 2),
+    so a lookup is the `searchsorted` of the linear table plus a Horner step.
+    Out-of-range angles are clamped to the end points.
+    """
+
+    __slots__ = ("alpha", "coefficients", "method", "source", "_alpha_list", "_rows", "_first", "_last",
+                 "_cl_max")
+
+    def __init__(self, table: PolarTable, method: str):
+        """
+        Args:
+            table: Compiled source polar
+            method: "pchip" or "spline"
+
+        Raises:
+            ValueError: If the method is unknown or the angles are not
+                strictly ascending
+        """
+        if method not in ("pchip", "spline"):
+            raise ValueError(f"Unknown cubic interpolation method '{method}'. Use 'pchip' or 'spline'.")
+        h = np.diff(table.alpha)
+        if np.any(h <= 0):
+            raise ValueError("Smooth interpolation needs strictly ascending angles of attack")
+
+        y = table.values
+        delta = table.slopes
+        if method == "pchip":
+            d = _pchip_derivatives(h, delta)
+        else:
+            d = _natural_spline_derivatives(h, delta)
+
+        # y(a0 + t) = c0 + c1 t + c2 t² + c3 t³ on every segment
+        h = h[:, None]
+        coefficients = np.empty((len(h), 4, 2))
+        coefficients[:, 0] = y[:-1]
+        coefficients[:, 1] = d[:-1]
+        coefficients[:, 2] = (3 * delta - 2 * d[:-1] - d[1:]) / h
+        coefficients[:, 3] = (d[:-1] + d[1:] - 2 * delta) / h**2
+
+        self.alpha = table.alpha
+        self.coefficients = np.ascontiguousarray(coefficients)
+        self.method = method
+        self.source = table.source
+
+        self._alpha_list = table._alpha_list
+        self._rows = [(a, *c[0], *c[1], *c[2], *c[3]) for a, c in
+                      zip(self._alpha_list, self.coefficients.tolist())]
+        self._first = table._first
+        self._last = table._last
+        self._cl_max = max(table._cl_max, _cubic_maximum(self.coefficients[..., 0], h[:, 0]))
+
+    def __len__(self):
+        return len(self._alpha_list)
+
+    def evaluate(self, angle, reynolds=None):
+        """
+        Interpolates CL and CD at one or many angles of attack.
+
+        Args:
+            angle: Angle of attack [°], scalar or array
+            reynolds: Ignored; accepted so all polar tables share one interface
+
+        Returns:
+            Tuple (CL, CD) - floats for scalar input, arrays otherwise
+        """
+        if np.ndim(angle) == 0:
+            return self._evaluate_scalar(float(angle))
+
+        x = np.clip(np.asarray(angle, dtype=np.float64), self.alpha[0], self.alpha[-1])
+        idx = np.clip(np.searchsorted(self.alpha, x, side="right") - 1, 0, len(self._alpha_list) - 2)
+        t = (x - self.alpha[idx])[..., None]
+        c = self.coefficients[idx]
+        result = ((c[..., 3, :] * t + c[..., 2, :]) * t + c[..., 1, :]) * t + c[..., 0, :]
+        return result[..., 0], result[..., 1]
+
+    def max_lift(self, reynolds=None):
+        """
+        Maximum lift coefficient of the interpolated curve (which, for
+        "spline", may lie between the tabulated points).
+
+        Args:
+            reynolds: Ignored apart from its shape; the result is broadcast to it
+        """
+        if reynolds is None:
+            return self._cl_max
+        return np.full(np.shape(reynolds), self._cl_max)
+
+    def _evaluate_scalar(self, angle: float) -> Tuple[float, float]:
+        alphas = self._alpha_list
+        # Also taken by NaN, which fails every comparison (np.interp gives NaN too)
+        if not angle < alphas[-1]:
+            return self._last if angle >= alphas[-1] else (np.nan, np.nan)
+        if angle <= alphas[0]:
+            return self._first
+
+        a0, cl0, cd0, cl1, cd1, cl2, cd2, cl3, cd3 = self._rows[bisect_right(alphas, angle) - 1]
+        t = angle - a0
+        return ((cl3 * t + cl2) * t + cl1) * t + cl0, ((cd3 * t + cd2) * t + cd1) * t + cd0
+
+
+def _pchip_derivatives(h, delta):
+    """
+    Node derivatives of the monotone cubic (Fritsch-Carlson, with the
+    weighted harmonic mean and shape-preserving end conditions).
+
+    Args:
+        h: Segment widths, shape (n - 1,)
+        delta: Segment slopes, shape (n - 1, k)
+
+    Returns:
+        Derivatives at the n nodes, shape (n, k)
+    """
+    d = np.zeros((len(h) + 1, delta.shape[1]))
+    if len(h) == 1:
+        d[:] = delta
+        return d
+
+    # Interior nodes: zero at local extrema, weighted harmonic mean otherwise
+    h0, h1 = h[:-1, None], h[1:, None]
+    left, right = delta[:-1], delta[1:]
+    w1, w2 = 2 * h1 + h0, h1 + 2 * h0
+    same_sign = left * right > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = (w1 + w2) / (w1 / left + w2 / right)
+    d[1:-1] = np.where(same_sign, mean, 0.0)
+
+    # End nodes: three-point estimate, limited so the end segments stay monotone
+    for node, (ha, hb, da, db) in ((0, (h[0], h[1], delta[0], delta[1])),
+                                   (-1, (h[-1], h[-2], delta[-1], delta[-2]))):
+        end = ((2 * ha + hb) * da - ha * db) / (ha + hb)
+        end = np.where(np.sign(end) != np.sign(da), 0.0, end)
+        end = np.where((np.sign(da) != np.sign(db)) & (np.abs(end) > np.abs(3 * da)), 3 * da, end)
+        d[node] = end
+    return d
+
+
+def _natural_spline_derivatives(h, delta):
+    """
+    Node derivatives of the natural cubic spline (zero curvature at both
+    ends), solving the tridiagonal system for the second derivatives.
+
+    Args:
+        h: Segment widths, shape (n - 1,)
+        delta: Segment slopes, shape (n - 1, k)
+
+    Returns:
+        Derivatives at the n nodes, shape (n, k)
+    """
+    n = len(h) + 1
+    M = np.zeros((n, delta.shape[1]))
+    if n > 2:
+        # h[i-1] M[i-1] + 2 (h[i-1] + h[i]) M[i] + h[i] M[i+1] = 6 (delta[i] - delta[i-1])
+        lower, upper = h[1:-1], h[1:-1]
+        diagonal = 2 * (h[:-1] + h[1:])
+        rhs = 6 * (delta[1:] - delta[:-1])
+
+        # Thomas algorithm (the matrix is diagonally dominant)
+        diagonal = diagonal.copy()
+        for i in range(1, n - 2):
+            factor = lower[i - 1] / diagonal[i - 1]
+            diagonal[i] -= factor * upper[i - 1]
+            rhs[i] -= factor * rhs[i - 1]
+        M[n - 2] = rhs[-1] / diagonal[-1]
+        for i in range(n - 4, -1, -1):
+            M[i + 1] = (rhs[i] - upper[i] * M[i + 2]) / diagonal[i]
+
+    hh = h[:, None]
+    d = np.empty_like(M)
+    d[:-1] = delta - hh * (2 * M[:-1] + M[1:]) / 6
+    d[-1] = delta[-1] + hh[-1] * (M[-2] + 2 * M[-1]) / 6
+    return d
+
+
+def _cubic_maximum(coefficients, h) -> float:
+    """Largest value of the cubics c0 + c1 t + c2 t² + c3 t³ inside their segments [0, h]"""
+    c1, c2, c3 = coefficients[:, 1], coefficients[:, 2], coefficients[:, 3]
+    # Stationary points: 3 c3 t² + 2 c2 t + c1 = 0
+    a, b = 3 * c3, 2 * c2
+    discriminant = b**2 - 4 * a * c1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(np.maximum(discriminant, 0.0))
+        quadratic = np.abs(a) > 1e-12 * (np.abs(b) + np.abs(c1) + 1e-300)
+        candidates = np.stack((np.where(quadratic, (-b + root) / (2 * a), -c1 / b),
+                               np.where(quadratic, (-b - root) / (2 * a), np.nan)))
+    candidates = np.where((discriminant >= 0) & (candidates > 0) & (candidates < h), candidates, 0.0)
+    values = ((c3 * candidates + c2) * candidates + c1) * candidates + coefficients[:, 0]
+    return float(values.max())
+
+
+class ReynoldsPolarTable:
+    """
+    Compiled polars of one profile at several Reynolds numbers.
+
+    The coefficients form a dense (Re x alpha) grid. A lookup interpolates
+    linearly in alpha within the two neighbouring Re rows and then linearly in
+    log(Re) between them (bilinear in alpha and log Re). Reynolds numbers
+    outside the tabulated range are clamped like the angles.
+
+    The cell lookup (`cells`) is separated from the interpolation
+    (`evaluate_cells`): one pair of `searchsorted` calls serves CL and CD
+    together, and callers evaluating many quantities on the same conditions
+    can reuse the cells.
+    """
+
+    __slots__ = ("alpha", "reynolds", "values", "slopes", "source", "reference", "_log_re", "_lift_envelopes")
+
+    def __init__(self, alpha, reynolds, CL, CD, source=None):
+        """
+        Args:
+            alpha: Angles of attack [°] in ascending order, shared by all polars
+            reynolds: Reynolds numbers in ascending order, one per polar
+            CL: Lift coefficients, shape (len(reynolds), len(alpha))
+            CD: Drag coefficients, shape (len(reynolds), len(alpha))
+            source: Profile dictionary the table was built from (optional)
+        """
+        self.alpha = np.ascontiguousarray(alpha, dtype=np.float64)
+        self.reynolds = np.ascontiguousarray(reynolds, dtype=np.float64)
+        # One (CL, CD) pair per grid node: shape (Re, alpha, 2)
+        self.values = np.ascontiguousarray(np.stack((CL, CD), axis=-1), dtype=np.float64)
+
+        if self.alpha.ndim != 1 or len(self.alpha) < 2:
+            raise ValueError("A polar needs at least 2 angle of attack points")
+        if self.values.shape[:2] != (len(self.reynolds), len(self.alpha)):
+            raise ValueError("CL and CD must have one row per Reynolds number and one column per angle")
+        if np.any(self.reynolds <= 0) or np.any(np.diff(self.reynolds) <= 0):
+            raise ValueError("Reynolds numbers must be positive and strictly ascending")
+
+        d_alpha = np.diff(self.alpha)
+        d_values = np.diff(self.values, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.where(d_alpha[None, :, None] > 0, d_values / d_alpha[None, :, None], 0.0)
+        self.slopes = np.ascontiguousarray(slopes)
+        self.source = source
+        self._log_re = np.log(self.reynolds)
+
+        # Re-independent view for tools that need a single polar
+        middle = len(self.reynolds) // 2
+        self.reference = PolarTable(self.alpha, self.values[middle, :, 0], self.values[middle, :, 1])
+        self._lift_envelopes = None
+
+    def __len__(self):
+        return len(self.alpha)
+
+    def cells(self, angle, reynolds):
+        """
+        Locates the grid cell of every (angle, Re) condition.
+
+        Args:
+            angle: Angle(s) of attack [°]
+            reynolds: Reynolds number(s), broadcast against `angle`
+
+        Returns:
+            Tuple (alpha index, offset in the alpha segment [°], Re index,
+            weight of the next Re row) - arrays of the broadcast shape
+        """
+        angle, reynolds = np.broadcast_arrays(np.asarray(angle, dtype=np.float64),
+                                              np.asarray(reynolds, dtype=np.float64))
+        x = np.clip(angle, self.alpha[0], self.alpha[-1])
+        i = np.clip(np.searchsorted(self.alpha, x, side="right") - 1, 0, len(self.alpha) - 2)
+
+        if len(self.reynolds) == 1:
+            return i, x - self.alpha[i], np.zeros_like(i), np.zeros_like(x)
+        log_re = np.clip(np.log(reynolds), self._log_re[0], self._log_re[-1])
+        j = np.clip(np.searchsorted(self._log_re, log_re, side="right") - 1, 0, len(self.reynolds) - 2)
+        weight = (log_re - self._log_re[j]) / (self._log_re[j + 1] - self._log_re[j])
+        return i, x - self.alpha[i], j, weight
+
+    def evaluate_cells(self, cells):
+        """Interpolates CL and CD for cells returned by `cells`"""
+        i, dx, j, weight = cells
+        result = self.values[j, i] + self.slopes[j, i] * dx[..., None]
+        if len(self.reynolds) > 1:
+            upper = self.values[j + 1, i] + self.slopes[j + 1, i] * dx[..., None]
+            result += (upper - result) * weight[..., None]
+        return result[..., 0], result[..., 1]
+
+    def max_lift(self, reynolds=None):
+        """
+        Exact maximum lift coefficient at one or many Reynolds numbers.
+
+        Between two tabulated Reynolds numbers every alpha node's CL is linear
+        in the log(Re) weight w, so CL_max(w) is the upper envelope of those
+        lines. The envelopes are built once; a query is a `searchsorted` on
+        the envelope break points.
+
+        Args:
+            reynolds: Reynolds number(s); None uses the reference polar
+        """
+        if reynolds is None:
+            return self.reference.max_lift()
+        reynolds = np.asarray(reynolds, dtype=np.float64)
+        if len(self.reynolds) == 1:
+            return np.full(reynolds.shape, self.values[0, :, 0].max())
+
+        if self._lift_envelopes is None:
+            CL = self.values[..., 0]
+            self._lift_envelopes = [_upper_envelope(CL[j], CL[j + 1] - CL[j])
+                                    for j in range(len(self.reynolds) - 1)]
+
+        log_re = np.clip(np.log(reynolds), self._log_re[0], self._log_re[-1])
+        j = np.clip(np.searchsorted(self._log_re, log_re, side="right") - 1, 0, len(self.reynolds) - 2)
+        w = (log_re - self._log_re[j]) / (self._log_re[j + 1] - self._log_re[j])
+
+        result = np.empty(reynolds.shape)
+        for interval, (breaks, intercepts, slopes) in enumerate(self._lift_envelopes):
+            mask = j == interval
+            if mask.any():
+                line = np.searchsorted(breaks, w[mask])
+                result[mask] = intercepts[line] + slopes[line] * w[mask]
+        return result
+
+    def at_reynolds(self, reynolds: float) -> PolarTable:
+        """
+        Single polar at a fixed Reynolds number.
+
+        At a fixed Re the bilinear interpolation is piecewise linear in alpha
+        with the same break points, so the returned table is exact.
+        """
+        CL, CD = self.evaluate(self.alpha, np.full(len(self.alpha), float(reynolds)))
+        return PolarTable(self.alpha, CL, CD)
+
+    def evaluate(self, angle, reynolds=None):
+        """
+        Interpolates CL and CD at one or many (angle, Re) conditions.
+
+        Args:
+            angle: Angle of attack [°], scalar or array
+            reynolds: Reynolds number(s); None uses the reference polar
+
+        Returns:
+            Tuple (CL, CD) - floats for scalar input, arrays otherwise
+        """
+        if reynolds is None:
+            return self.reference.evaluate(angle)
+        CL, CD = self.evaluate_cells(self.cells(angle, reynolds))
+        if CL.ndim == 0:
+            return float(CL), float(CD)
+        return CL, CD
+
+
+def _upper_envelope(intercepts, slopes):
+    """
+    Upper envelope of the lines intercepts + slopes * w.
+
+    Returns:
+        Tuple (break points, intercepts, slopes): line k of the envelope is the
+        maximum for break points[k - 1] <= w <= break points[k]
+    """
+    hull = []
+    for i in np.lexsort((intercepts, slopes)):
+        if hull and slopes[hull[-1]] == slopes[i]:
+            hull.pop()  # Parallel line with a smaller intercept
+        while len(hull) >= 2:
+            l1, l2 = hull[-2], hull[-1]
+            # l2 is never the maximum if l3 overtakes l1 before l2 does
+            if (intercepts[l1] - intercepts[i]) * (slopes[l2] - slopes[l1]) <= \
+                    (intercepts[l1] - intercepts[l2]) * (slopes[i] - slopes[l1]):
+                hull.pop()
+            else:
+                break
+        hull.append(i)
+
+    hull = np.array(hull)
+    a, b = intercepts[hull], slopes[hull]
+    breaks = (a[:-1] - a[1:]) / (b[1:] - b[:-1])
+    return breaks, a, b
+
+
+def is_reynolds_profile(profile_data: Dict) -> bool:
+    """True if the profile holds polars at several Reynolds numbers"""
+    return "Re" in profile_data
+
+
+def compile_polar(profile_data: Dict):
+    """Builds the lookup table matching a profile dictionary."""
+    if is_reynolds_profile(profile_data):
+        return ReynoldsPolarTable(profile_data["alpha"], profile_data["Re"], profile_data["CL"],
+                                  profile_data["CD"], source=profile_data)
+    return PolarTable.from_profile(profile_data)
+
+
+def reference_polar(profile_data: Dict) -> Dict:
+    """
+    Single polar of a profile, for tools that do not model the Reynolds number.
+
+    Plain profiles are returned unchanged; for Reynolds-dependent profiles this
+    is the polar at the middle tabulated Reynolds number.
+    """
+    if not is_reynolds_profile(profile_data):
+        return profile_data
+    middle = len(profile_data["Re"]) // 2
+    return {"alpha": profile_data["alpha"], "CL": profile_data["CL"][middle],
+            "CD": profile_data["CD"][middle]}
+
+
+def build_reynolds_grid(alpha, CL, CD, reynolds) -> Dict:
+    """
+    Builds a Reynolds-dependent profile from polars in long format.
+
+    Every row is one (alpha, CL, CD, Re) point. The polars of all Reynolds
+    numbers are resampled onto the union of their angles, limited to the
+    range they all cover, so every polar keeps its own tabulated points.
+
+    Returns:
+        Profile dictionary with "alpha" and "Re" lists and (Re x alpha)
+        nested "CL" and "CD" lists
+
+    Raises:
+        ValueError: If a polar has fewer than 2 points or the polars share no
+            common angle of attack range
+    """
+    alpha, CL, CD, reynolds = (np.asarray(x, dtype=np.float64) for x in (alpha, CL, CD, reynolds))
+    numbers = np.unique(reynolds)
+    polars = []
+    for number in numbers:
+        mask = reynolds == number
+        if np.count_nonzero(mask) < 2:
+            raise ValueError(f"The polar at Re={number:g} needs at least 2 points")
+        polars.append((alpha[mask], CL[mask], CD[mask]))
+
+    low = max(a[0] for a, _, _ in polars)
+    high = min(a[-1] for a, _, _ in polars)
+    if low >= high:
+        raise ValueError("The polars at different Reynolds numbers share no common angle of attack range")
+
+    grid = np.unique(np.concatenate([a for a, _, _ in polars]))
+    grid = grid[(grid >= low) & (grid <= high)]
+    return {
+        "alpha": grid.tolist(),
+        "Re": numbers.tolist(),
+        "CL": [np.interp(grid, a, cl).tolist() for a, cl, _ in polars],
+        "CD": [np.interp(grid, a, cd).tolist() for a, _, cd in polars]
+    }
+
+
+def get_reference_table(profile_name: str, profiles_data: Dict) -> PolarTable:
+    """Compiled single polar of a profile (see `reference_polar`)."""
+    table = get_polar_table(profile_name, profiles_data)
+    return getattr(table, "reference", table)
+
+
+# Tables compiled when profiles are registered, keyed by profile name
+_compiled_tables: Dict[str, PolarTable] = {}
+# Uniform-grid tables, keyed by (profile name, resolution); least recently
+# used tables are dropped beyond MAX_RESAMPLED_TABLES, since every distinct
+# resolution requested (e.g. by service clients) adds one
+MAX_RESAMPLED_TABLES = 64
+_resampled_tables: "OrderedDict[Tuple[str, float], UniformPolarTable]" = OrderedDict()
+# Smooth-interpolation tables, keyed by (profile name, method)
+_cubic_tables: Dict[Tuple[str, str], CubicPolarTable] = {}
+# Guards the caches above: service executor threads and GUI workers look up
+# tables while profiles are registered
+_tables_lock = threading.RLock()
+
+
+def register_polar(profile_name: str, profile_data: Dict) -> PolarTable:
+    """
+    Compiles a profile polar and stores it for later lookups.
+
+    Args:
+        profile_name: Name of the airfoil profile
+        profile_data: Dictionary with "alpha", "CL" and "CD" lists (plus
+            "Re" for Reynolds-dependent profiles)
+
+    Returns:
+        The compiled PolarTable or ReynoldsPolarTable
+    """
+    table = compile_polar(profile_data)
+    with _tables_lock:
+        _compiled_tables[profile_name] = table
+        _drop_derived_tables(profile_name)
+    return table
+
+
+def unregister_polar(profile_name: str):
+    """Drops the compiled table of a removed profile."""
+    with _tables_lock:
+        _compiled_tables.pop(profile_name, None)
+        _drop_derived_tables(profile_name)
+
+
+def _drop_derived_tables(profile_name: str):
+    """Drops the resampled and smooth tables of a profile; call with `_tables_lock` held"""
+    for cache in (_resampled_tables, _cubic_tables):
+        for key in [key for key in cache if key[0] == profile_name]:
+            del cache[key]
+
+
+def get_polar_table(profile_name: str, profiles_data: Dict,
+                    resolution: Optional[float] = None, method: str = "linear"):
+    """
+    Returns the compiled table for a profile, compiling it on first use.
+
+    A cached table is reused only while it was built from the very same
+    profile dictionary, so replacing a profile in `profiles_data` never
+    serves stale coefficients.
+
+    Args:
+        profile_name: Name of the airfoil profile
+        profiles_data: Dictionary containing aerodynamic profile data
+        resolution: If given, return a UniformPolarTable resampled with this
+            grid spacing [°] (at least MIN_RESOLUTION) instead of the exact
+            PolarTable (ignored for Reynolds-dependent profiles)
+        method: Interpolation in alpha, one of `INTERPOLATION_METHODS`:
+            "linear" (default), "pchip" or "spline" for a CubicPolarTable.
+            The smooth modes interpolate the tabulated points directly, so
+            `resolution` is ignored; Reynolds-dependent profiles are always
+            interpolated linearly
+
+    Raises:
+        ValueError: If the profile is not found in the data, the method is
+            unknown or the resolution is too fine
+    """
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"Unknown interpolation method '{method}'. "
+                         f"Available methods: {', '.join(INTERPOLATION_METHODS)}")
+
+    if profile_name not in profiles_data:
+        available_profiles = ", ".join(profiles_data.keys())
+        raise ValueError(f"Profile '{profile_name}' not found. "
+                         f"Available profiles: {available_profiles}")
+
+    profile_data = profiles_data[profile_name]
+    table = _compiled_tables.get(profile_name)
+    if table is None or table.source is not profile_data:
+        table = register_polar(profile_name, profile_data)
+
+    # Exact lookups need no derived table (a single dict read is atomic)
+    if isinstance(table, ReynoldsPolarTable) or (method == "linear" and resolution is None):
+        return table
+
+    # Derived tables are checked against the profile too: one built from a
+    # table replaced meanwhile by another thread must not be served
+    with _tables_lock:
+        if method != "linear":
+            key = (profile_name, method)
+            smooth = _cubic_tables.get(key)
+            if smooth is None or smooth.source is not profile_data:
+                smooth = CubicPolarTable(table, method)
+                _cubic_tables[key] = smooth
+            return smooth
+
+        key = (profile_name, float(resolution))
+        resampled = _resampled_tables.get(key)
+        if resampled is None or resampled.source is not profile_data:
+            resampled = UniformPolarTable(table, resolution)
+            _resampled_tables[key] = resampled
+            while len(_resampled_tables) > MAX_RESAMPLED_TABLES:
+                _resampled_tables.popitem(last=False)
+        else:
+            _resampled_tables.move_to_end(key)
+        return resampled
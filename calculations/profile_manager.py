@@ -1,116 +1,271 @@
+import io
 import os
-import json
+import re
 import csv
-from tkinter import filedialog, messagebox
+import warnings
+
+import numpy as np
+
+from calculations.instrumentation import instrumented
+from calculations.naca_geometry import parse_designation
+from calculations.polar_table import register_polar, unregister_polar, build_reynolds_grid
+from calculations.profile_store import ProfileStore
+from calculations.profile_registry import ProfileRegistry
+
+# A number as accepted in polar files (e.g. -1, 0.5, .25, 1.2e-3), including
+# the non-finite values NumPy parses (nan, inf, -Infinity) so that both
+# parsers see the same rows
+NUMBER_PATTERN = rb"[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|(?i:nan|inf(?:inity)?))"
+
+# TXT data row: alpha CL CD separated by whitespace, extra columns ignored
+TXT_ROW_PATTERN = re.compile(
+    rb"^[ \t]*(" + NUMBER_PATTERN + rb")[ \t]+(" + NUMBER_PATTERN + rb")[ \t]+("
+    + NUMBER_PATTERN + rb")(?:[ \t][^\r\n]*)?\r?$", re.MULTILINE)
+
+# TXT data row with a Reynolds number column: alpha CL CD Re
+TXT_REYNOLDS_ROW_PATTERN = re.compile(
+    rb"^[ \t]*(" + NUMBER_PATTERN + rb")[ \t]+(" + NUMBER_PATTERN + rb")[ \t]+("
+    + NUMBER_PATTERN + rb")[ \t]+(" + NUMBER_PATTERN + rb")(?:[ \t][^\r\n]*)?\r?$", re.MULTILINE)
+
+# Column names that mark the Reynolds number of each row
+REYNOLDS_COLUMN_NAMES = ('Re', 're', 'RE', 'Reynolds', 'reynolds')
+
+# Lines that are neither data nor invalid rows: blank lines (and TXT comments)
+TXT_IGNORED_LINE_PATTERN = re.compile(rb"^[ \t]*(?:#[^\n]*)?\r?$", re.MULTILINE)
+CSV_IGNORED_LINE_PATTERN = re.compile(rb"^[ \t]*\r?$", re.MULTILINE)
+
+# Maximum number of offending rows listed in a validation message
+MAX_REPORTED_ROWS = 5
+
+
+def _line_numbers(raw, starts):
+    """1-based line numbers of the byte offsets `starts` in `raw`"""
+    newlines = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == ord("\n"))
+    return np.searchsorted(newlines, np.asarray(starts, dtype=np.intp)) + 1
+
+
+def _data_row_numbers(raw):
+    """1-based line numbers of the lines np.loadtxt parses: all but blank and comment lines"""
+    line_starts = np.concatenate(([0], np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == ord("\n")) + 1))
+    line_starts = line_starts[line_starts < len(raw)]
+    ignored = np.fromiter((match.start() for match in TXT_IGNORED_LINE_PATTERN.finditer(raw)), dtype=np.intp)
+    return np.flatnonzero(~np.isin(line_starts, ignored)) + 1
+
+
+def _count_skipped_rows(raw, parsed_rows, ignored_pattern):
+    """Number of lines that are neither parsed data nor ignorable lines"""
+    lines = raw.count(b"\n") + (1 if raw and not raw.endswith(b"\n") else 0)
+    # The pattern also matches the empty position after a final newline
+    ignored = len(ignored_pattern.findall(raw)) - (1 if raw.endswith(b"\n") or not raw else 0)
+    return max(lines - ignored - parsed_rows, 0)
+
+
+def _load_columns(raw, usecols, delimiter=None):
+    """
+    Fast path: parse the data rows of a file with NumPy's C tokenizer.
+    
+    Raises:
+        ValueError: If any data row is malformed (callers then fall back to
+            the row-skipping regex parser)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # empty file warning
+        return np.loadtxt(io.BytesIO(raw), delimiter=delimiter, comments='#', usecols=usecols,
+                          quotechar='"' if delimiter else None, ndmin=2, dtype=np.float64,
+                          encoding='utf-8-sig')
+
+
+def _parse_rows(raw, pattern):
+    """
+    Parse every row matched by `pattern` into a (n, groups) float64 array.
+    
+    Returns:
+        tuple: (values, 1-based line numbers of the parsed rows)
+    """
+    matches = list(pattern.finditer(raw))
+    if not matches:
+        return np.empty((0, pattern.groups), dtype=np.float64), np.empty(0, dtype=np.intp)
+    values = np.array([match.groups() for match in matches], dtype=bytes).astype(np.float64)
+    return values, _line_numbers(raw, [match.start() for match in matches])
+
+STANDARD_PROFILES = ("NACA 2412", "NACA 0012", "NACA 4412", "NACA 2415",
+                     "NACA 6409", "NACA 0015", "NACA 23012", "NACA 64A010")
+
+# Compact the binary store once this fraction of it is deleted profiles
+COMPACT_THRESHOLD = 0.5
 
 class ProfileManager:
     """Manages custom airfoil profiles loading and validation"""
     
-    def __init__(self, naca_data_dict, profile_info_dict):
+    def __init__(self, naca_data_dict, profile_info_dict,
+                 custom_profiles_file="calculations/custom_profiles.json",
+                 custom_profiles_dir="calculations/custom_profiles",
+                 max_loaded_profiles=64):
         """
         Initialize ProfileManager
         
         Args:
             naca_data_dict: Reference to the main naca_data dictionary
             profile_info_dict: Reference to the profile_info dictionary
+            custom_profiles_file: Legacy JSON file, migrated into the store once
+            custom_profiles_dir: Directory of the binary custom profile store
+            max_loaded_profiles: Custom profiles kept in memory at once
         """
-        self.naca_data = naca_data_dict
+        self.builtin_data = naca_data_dict
         self.profile_info = profile_info_dict
-        self.custom_profiles_file = "calculations/custom_profiles.json"
+        self.custom_profiles_file = custom_profiles_file
+        self.store = ProfileStore(custom_profiles_dir)
+        self.max_loaded_profiles = max_loaded_profiles
+        self.listeners = []
+        self.migrate_json_profiles()
         self.load_custom_profiles()
+        self.compile_profiles()
+    
+    def add_listener(self, callback):
+        """Register a callback(profile_name) run when a profile is added or removed"""
+        self.listeners.append(callback)
+    
+    def _notify_profile_changed(self, profile_name):
+        for callback in self.listeners:
+            callback(profile_name)
+
+    def compile_profiles(self):
+        """Precompile lookup tables for the built-in profiles (custom ones compile on first use)"""
+        for profile_name, profile_data in self.builtin_data.items():
+            register_polar(profile_name, profile_data)
+    
+    def migrate_json_profiles(self):
+        """Move profiles from the legacy JSON file into the binary store"""
+        if not os.path.exists(self.custom_profiles_file):
+            return
+        try:
+            self.store.migrate_from_json(self.custom_profiles_file, skip=STANDARD_PROFILES)
+            os.replace(self.custom_profiles_file, self.custom_profiles_file + ".bak")
+        except Exception as e:
+            print(f"Error migrating custom profiles: {e}")
     
     def load_custom_profiles(self):
-        """Load previously saved custom profiles"""
-        if os.path.exists(self.custom_profiles_file):
-            try:
-                with open(self.custom_profiles_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Add custom profiles to main data
-                    for profile_name, profile_data in data.get('profiles', {}).items():
-                        if profile_name not in self.naca_data:
-                            self.naca_data[profile_name] = profile_data
-                    # Add custom profile info
-                    for profile_name, info in data.get('profile_info', {}).items():
-                        if profile_name not in self.profile_info:
-                            self.profile_info[profile_name] = info
-            except Exception as e:
-                print(f"Error loading custom profiles: {e}")
+        """Index previously saved custom profiles; their data is loaded on first use"""
+        self.naca_data = ProfileRegistry(self.builtin_data, self.profile_info, self.store,
+                                         max_loaded=self.max_loaded_profiles)
+        self.naca_data.add_eviction_listener(unregister_polar)
     
+    @instrumented("profiles.save_custom_profiles")
     def save_custom_profiles(self):
-        """Save custom profiles to file"""
+        """Synchronize the store with the custom profiles currently registered"""
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.custom_profiles_file), exist_ok=True)
-            
-            # Find custom profiles (not standard NACA)
-            standard_profiles = ["NACA 2412", "NACA 0012", "NACA 4412", "NACA 2415", 
-                                "NACA 6409", "NACA 0015", "NACA 23012", "NACA 64A010"]
-            
-            custom_profiles = {}
-            custom_info = {}
-            
-            for profile_name, profile_data in self.naca_data.items():
-                if profile_name not in standard_profiles:
-                    custom_profiles[profile_name] = profile_data
-                    
-            for profile_name, info in self.profile_info.items():
-                if profile_name not in standard_profiles:
-                    custom_info[profile_name] = info
+            custom_profiles = [name for name in self.naca_data if name not in STANDARD_PROFILES]
             
-            # Save to file
-            data_to_save = {
-                'profiles': custom_profiles,
-                'profile_info': custom_info
-            }
+            for profile_name in custom_profiles:
+                if profile_name not in self.store:
+                    self._save_profile(profile_name)
             
-            with open(self.custom_profiles_file, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
+            for profile_name in self.store.names():
+                if profile_name not in self.naca_data:
+                    self.store.delete(profile_name)
                 
         except Exception as e:
             print(f"Error saving custom profiles: {e}")
     
-    def validate_profile_data(self, alpha_values, cl_values, cd_values):
+    def _save_profile(self, profile_name):
+        """Append a single profile to the store"""
+        try:
+            self.store.append(profile_name, self.naca_data[profile_name],
+                              self.naca_data.describe(profile_name))
+            self.naca_data.release(profile_name)
+        except Exception as e:
+            print(f"Error saving custom profile: {e}")
+    
+    def _delete_saved_profile(self, profile_name):
+        """Delete a single profile from the store, compacting it when mostly dead space"""
+        try:
+            if self.store.delete(profile_name) and self.store.dead_space() > COMPACT_THRESHOLD:
+                self.store.compact()
+        except Exception as e:
+            print(f"Error removing saved profile: {e}")
+    
+    @staticmethod
+    @instrumented("profiles.validate")
+    def validate_profile_data(alpha_values, cl_values, cd_values, rows=None, reynolds_values=None):
         """
         Validate profile data format and values
         
+        Args:
+            alpha_values, cl_values, cd_values: Data columns (lists or arrays)
+            rows: Source row number of every point, as an array or as a
+                callable evaluated only when an error is reported
+            reynolds_values: Optional Reynolds number of every point; angles
+                must then ascend within each Reynolds number
+        
         Returns:
             tuple: (is_valid, error_message)
         """
         # Check if all lists have same length
         if not (len(alpha_values) == len(cl_values) == len(cd_values)):
             return False, "All data columns must have the same length"
+        if reynolds_values is not None and len(reynolds_values) != len(alpha_values):
+            return False, "All data columns must have the same length"
         
         # Check minimum number of points
         if len(alpha_values) < 3:
             return False, "Profile must have at least 3 data points"
         
-        # Check if alpha values are numeric and in reasonable range (range is larger than the app can calculate for)
-        try:
-            alpha_numeric = [float(x) for x in alpha_values]
-            if min(alpha_numeric) < -30 or max(alpha_numeric) > 30:
-                return False, "Angle of attack values should be between -30° and 30°"
-        except (ValueError, TypeError):
-            return False, "Angle of attack values must be numeric"
+        def where(mask):
+            points = np.flatnonzero(mask)[:MAX_REPORTED_ROWS]
+            numbers = (rows() if callable(rows) else rows) if rows is not None else None
+            numbers = points + 1 if numbers is None else np.asarray(numbers)[points]
+            listed = ", ".join(str(n) for n in numbers)
+            more = ", ..." if np.count_nonzero(mask) > MAX_REPORTED_ROWS else ""
+            return f" (rows {listed}{more})"
         
-        # Check if CL values are numeric and in reasonable range
-        try:
-            cl_numeric = [float(x) for x in cl_values]
-            if min(cl_numeric) < -3 or max(cl_numeric) > 3:
-                return False, "CL values should be between -3 and 3"
-        except (ValueError, TypeError):
-            return False, "CL values must be numeric"
+        named_columns = [(alpha_values, "Angle of attack"), (cl_values, "CL"), (cd_values, "CD")]
+        if reynolds_values is not None:
+            named_columns.append((reynolds_values, "Reynolds number"))
         
-        # Check if CD values are numeric and positive
-        try:
-            cd_numeric = [float(x) for x in cd_values]
-            if min(cd_numeric) < 0 or max(cd_numeric) > 1:
-                return False, "CD values should be between 0 and 1"
-        except (ValueError, TypeError):
-            return False, "CD values must be numeric"
+        columns = []
+        for values, name in named_columns:
+            try:
+                column = np.asarray(values, dtype=np.float64)
+            except (ValueError, TypeError):
+                return False, f"{name} values must be numeric"
+            if column.ndim != 1:
+                return False, f"{name} values must be numeric"
+            if np.isnan(column).any():
+                return False, f"{name} values must be numeric{where(np.isnan(column))}"
+            columns.append(column)
+        alpha, cl, cd = columns[:3]
+        
+        # Check value ranges (the alpha range is larger than the app can calculate for)
+        bad = (alpha < -30) | (alpha > 30)
+        if bad.any():
+            return False, f"Angle of attack values should be between -30° and 30°{where(bad)}"
+        
+        bad = (cl < -3) | (cl > 3)
+        if bad.any():
+            return False, f"CL values should be between -3 and 3{where(bad)}"
+        
+        bad = (cd < 0) | (cd > 1)
+        if bad.any():
+            return False, f"CD values should be between 0 and 1{where(bad)}"
+        
+        if reynolds_values is None:
+            order = np.arange(len(alpha))
+            same_polar = True
+        else:
+            reynolds = columns[3]
+            bad = reynolds <= 0
+            if bad.any():
+                return False, f"Reynolds numbers must be greater than zero{where(bad)}"
+            # Rows of each Reynolds number in file order
+            order = np.argsort(reynolds, kind="stable")
+            same_polar = np.diff(reynolds[order]) == 0
         
         # Check if alpha values are sorted
-        if alpha_numeric != sorted(alpha_numeric):
-            return False, "Angle of attack values should be in ascending order"
+        descending = (np.diff(alpha[order]) < 0) & same_polar
+        if descending.any():
+            bad = np.zeros(len(alpha), dtype=bool)
+            bad[order[1:][descending]] = True
+            return False, f"Angle of attack values should be in ascending order{where(bad)}"
         
         return True, "Valid profile data"
     
@@ -118,26 +273,44 @@ class ProfileManager:
         """
         Load profile from file (CSV or TXT)
         Expected formats:
-        CSV: alpha,CL,CD (with headers)
-        TXT: space or tab separated: alpha CL CD
+        CSV: alpha,CL,CD (with headers), optionally with a Re column
+        TXT: space or tab separated: alpha CL CD, optionally with a Re
+             column announced by a "# alpha CL CD Re" header
+        Rows with several Reynolds numbers form one Reynolds-dependent profile.
         
         Returns:
             tuple: (success, profile_name or error_message)
         """
+        filepath = self.ask_profile_path()
+        if not filepath:
+            return False, "No file selected"
+        
+        return self.load_profile_from_path(filepath)
+    
+    @staticmethod
+    def ask_profile_path():
+        """Show the file dialog; returns the selected path or an empty string"""
         filetypes = [
             ("CSV files", "*.csv"),
             ("Text files", "*.txt"),
             ("All files", "*.*")
         ]
         
-        filepath = filedialog.askopenfilename(
+        # Imported here so headless tools can use the manager without Tk
+        from tkinter import filedialog
+        
+        return filedialog.askopenfilename(
             title="Select Profile Data File",
             filetypes=filetypes
         )
+    
+    def load_profile_from_path(self, filepath):
+        """
+        Load and register a profile file without any dialog
         
-        if not filepath:
-            return False, "No file selected"
-        
+        Returns:
+            tuple: (success, profile_name or error_message)
+        """
         try:
             # Try to determine file format and load
             if filepath.lower().endswith('.csv'):
@@ -148,87 +321,232 @@ class ProfileManager:
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
     
+    @classmethod
+    def parse_profile_file(cls, filepath):
+        """
+        Parse a profile file into NumPy columns without validating or registering it
+        
+        Safe to call from a worker thread; pass the result to `add_parsed_profile`.
+        
+        Returns:
+            tuple: (success, (alpha, CL, CD, skipped_rows, row_numbers, Re or None) or error_message)
+        """
+        try:
+            if filepath.lower().endswith('.csv'):
+                return cls._read_csv_file(filepath)
+            return cls._read_txt_file(filepath)
+        except Exception as e:
+            return False, f"Error reading file: {str(e)}"
+    
+    @classmethod
+    def read_profile_file(cls, filepath):
+        """
+        Parse and validate a profile file without registering it
+        
+        Returns:
+            tuple: (success, profile data dict or error_message)
+        """
+        success, result = cls.parse_profile_file(filepath)
+        if not success:
+            return False, result
+        
+        alpha_values, cl_values, cd_values, skipped, rows, reynolds_values = result
+        if not len(alpha_values):
+            return False, "No valid data found in file"
+        
+        is_valid, message = cls.validate_profile_data(alpha_values, cl_values, cd_values, rows, reynolds_values)
+        if not is_valid:
+            return False, f"Data validation failed: {message}"
+        
+        try:
+            return True, cls.build_profile(alpha_values, cl_values, cd_values, reynolds_values)
+        except ValueError as e:
+            return False, f"Data validation failed: {e}"
+    
+    @staticmethod
+    def build_profile(alpha_values, cl_values, cd_values, reynolds_values=None):
+        """
+        Build a profile dictionary from validated columns
+        
+        Rows at more than one Reynolds number become a dense (Re x alpha) grid
+        (see `build_reynolds_grid`); otherwise a plain alpha/CL/CD polar.
+        
+        Raises:
+            ValueError: If the Reynolds polars cannot form a common grid
+        """
+        if reynolds_values is not None and len(np.unique(reynolds_values)) > 1:
+            return build_reynolds_grid(alpha_values, cl_values, cd_values, reynolds_values)
+        return {
+            "alpha": np.asarray(alpha_values, dtype=np.float64).tolist(),
+            "CL": np.asarray(cl_values, dtype=np.float64).tolist(),
+            "CD": np.asarray(cd_values, dtype=np.float64).tolist()
+        }
+    
+    def add_parsed_profile(self, filepath, parsed):
+        """
+        Validate and register the result of `parse_profile_file`
+        
+        Returns:
+            tuple: (success, profile_name or error_message)
+        """
+        return self._process_loaded_data(filepath, *parsed)
+    
     def _load_csv_file(self, filepath):
         """Load CSV file with headers: alpha,CL,CD"""
+        success, result = self._read_csv_file(filepath)
+        if not success:
+            return False, result
+        return self._process_loaded_data(filepath, *result)
+    
+    @staticmethod
+    @instrumented("profiles.read_csv")
+    def _read_csv_file(filepath):
+        """
+        Read CSV file with headers: alpha,CL,CD into NumPy columns
+        
+        Returns:
+            tuple: (success, (alpha, CL, CD, skipped_rows, row_numbers, Re or None) or error_message)
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                alpha_values = []
-                cl_values = []
-                cd_values = []
-                
-                # Try different possible column names
-                alpha_cols = ['alpha', 'Alpha', 'ALPHA', 'angle', 'Angle', 'AOA', 'aoa']
-                cl_cols = ['CL', 'cl', 'Cl', 'lift', 'Lift', 'CL_coeff']
-                cd_cols = ['CD', 'cd', 'Cd', 'drag', 'Drag', 'CD_coeff']
-                
-                # Find correct column names
-                headers = reader.fieldnames
-                alpha_col = next((col for col in alpha_cols if col in headers), None)
-                cl_col = next((col for col in cl_cols if col in headers), None)
-                cd_col = next((col for col in cd_cols if col in headers), None)
-                
-                if not all([alpha_col, cl_col, cd_col]):
-                    return False, f"Required columns not found. Expected columns like: alpha, CL, CD. Found: {headers}"
-                
-                for row in reader:
-                    try:
-                        alpha_values.append(float(row[alpha_col]))
-                        cl_values.append(float(row[cl_col]))
-                        cd_values.append(float(row[cd_col]))
-                    except ValueError:
-                        continue  # Skip invalid rows
-                
-                return self._process_loaded_data(filepath, alpha_values, cl_values, cd_values)
+            # Header is the first line; the file is read once for both parsers
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            header_end = raw.find(b"\n") + 1 or len(raw)
+            header_line, body = raw[:header_end].decode('utf-8-sig'), raw[header_end:]
+            headers = next(csv.reader([header_line]), [])
+            
+            # Try different possible column names
+            alpha_cols = ['alpha', 'Alpha', 'ALPHA', 'angle', 'Angle', 'AOA', 'aoa']
+            cl_cols = ['CL', 'cl', 'Cl', 'lift', 'Lift', 'CL_coeff']
+            cd_cols = ['CD', 'cd', 'Cd', 'drag', 'Drag', 'CD_coeff']
+            
+            # Find correct column names
+            alpha_col = next((col for col in alpha_cols if col in headers), None)
+            cl_col = next((col for col in cl_cols if col in headers), None)
+            cd_col = next((col for col in cd_cols if col in headers), None)
+            re_col = next((col for col in REYNOLDS_COLUMN_NAMES if col in headers), None)
+            
+            if not all([alpha_col, cl_col, cd_col]):
+                return False, f"Required columns not found. Expected columns like: alpha, CL, CD. Found: {headers}"
+            
+            # One regex for the whole file: numeric fields in the wanted
+            # columns, anything in the others; extra trailing columns allowed
+            wanted = {headers.index(alpha_col): 0, headers.index(cl_col): 1, headers.index(cd_col): 2}
+            if re_col is not None:
+                wanted[headers.index(re_col)] = 3
+            # Numbers may be quoted; other fields may be quoted strings with commas
+            fields = [b'[ \t]*"?(' + NUMBER_PATTERN + b')"?[ \t]*' if i in wanted else b'(?:"[^"\r\n]*"|[^,\r\n]*)'
+                      for i in range(max(wanted) + 1)]
+            pattern = re.compile(b"^" + b",".join(fields) + rb"(?:,[^\r\n]*)?\r?$", re.MULTILINE)
+            
+            order = sorted(wanted, key=wanted.get)
+            try:
+                values = _load_columns(body, order, delimiter=",")
+                columns = [values[:, i] for i in range(len(order))]
+                skipped = 0
+                row_numbers = None
+            except ValueError:
+                # Some rows are malformed: keep the ones that match
+                values, row_numbers = _parse_rows(body, pattern)
+                capture_index = {column: i for i, column in enumerate(sorted(wanted))}
+                columns = [values[:, capture_index[column]] for column in order]
+                skipped = _count_skipped_rows(body, len(values), CSV_IGNORED_LINE_PATTERN)
+            
+            def rows():
+                numbers = _data_row_numbers(body) if row_numbers is None else row_numbers
+                return numbers + 1  # header is row 1
+            
+            reynolds = columns[3] if re_col is not None else None
+            return True, (*columns[:3], skipped, rows, reynolds)
                 
         except Exception as e:
             return False, f"Error reading CSV file: {str(e)}"
     
     def _load_txt_file(self, filepath):
         """Load TXT file with format: alpha CL CD (space/tab separated)"""
+        success, result = self._read_txt_file(filepath)
+        if not success:
+            return False, result
+        return self._process_loaded_data(filepath, *result)
+    
+    @staticmethod
+    @instrumented("profiles.read_txt")
+    def _read_txt_file(filepath):
+        """
+        Read TXT file with format: alpha CL CD (space/tab separated) into NumPy columns
+        
+        Returns:
+            tuple: (success, (alpha, CL, CD, skipped_rows, row_numbers, Re or None) or error_message)
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            alpha_values = []
-            cl_values = []
-            cd_values = []
+            # A 4th column is only read as Re when the header names it, since
+            # plain files may carry arbitrary extra columns
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            header = raw[:raw.find(b"\n") + 1 or len(raw)].decode('utf-8-sig', errors='replace').lstrip()
+            names = header[1:].split() if header.startswith('#') else []
+            has_reynolds = len(names) >= 4 and names[3] in REYNOLDS_COLUMN_NAMES
+            pattern = TXT_REYNOLDS_ROW_PATTERN if has_reynolds else TXT_ROW_PATTERN
             
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):  # Skip empty lines and comments
-                    continue
-                    
-                # Split by whitespace
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        alpha_values.append(float(parts[0]))
-                        cl_values.append(float(parts[1]))
-                        cd_values.append(float(parts[2]))
-                    except ValueError:
-                        continue  # Skip invalid lines
+            try:
+                values = _load_columns(raw, tuple(range(pattern.groups)))
+                skipped = 0
+                row_numbers = None
+            except ValueError:
+                # Rows that do not match (and are not blank or comments) are skipped
+                values, row_numbers = _parse_rows(raw, pattern)
+                skipped = _count_skipped_rows(raw, len(values), TXT_IGNORED_LINE_PATTERN)
+            
+            def rows():
+                return _data_row_numbers(raw) if row_numbers is None else row_numbers
             
-            return self._process_loaded_data(filepath, alpha_values, cl_values, cd_values)
+            reynolds = values[:, 3] if has_reynolds else None
+            return True, (values[:, 0], values[:, 1], values[:, 2], skipped, rows, reynolds)
             
         except Exception as e:
             return False, f"Error reading TXT file: {str(e)}"
     
-    def _process_loaded_data(self, filepath, alpha_values, cl_values, cd_values):
+    @instrumented("profiles.register")
+    def _process_loaded_data(self, filepath, alpha_values, cl_values, cd_values, skipped=0, rows=None,
+                             reynolds_values=None):
         """Process and validate loaded data"""
-        if not alpha_values:
+        if not len(alpha_values):
             return False, "No valid data found in file"
         
         # Validate data
-        is_valid, message = self.validate_profile_data(alpha_values, cl_values, cd_values)
+        is_valid, message = self.validate_profile_data(alpha_values, cl_values, cd_values, rows, reynolds_values)
         if not is_valid:
             return False, f"Data validation failed: {message}"
+        try:
+            profile_data = self.build_profile(alpha_values, cl_values, cd_values, reynolds_values)
+        except ValueError as e:
+            return False, f"Data validation failed: {e}"
         
         # Generate profile name from filename
         filename = os.path.basename(filepath)
         profile_name = os.path.splitext(filename)[0].upper()
         
+        # Add basic info
+        description = f"Custom profile loaded from {filename}"
+        if "Re" in profile_data:
+            description += f" (polars at {len(profile_data['Re'])} Reynolds numbers)"
+        if skipped:
+            description += f" ({skipped} invalid rows skipped)"
+        
+        return True, self.add_profile(profile_name, profile_data, description)
+    
+    def add_profile(self, profile_name, profile_data, description):
+        """
+        Register, compile and save a validated profile
+        
+        Args:
+            profile_name: Requested name; a numeric suffix is added if taken
+            profile_data: Profile dictionary (see `build_profile`)
+            description: Text shown with the profile
+        
+        Returns:
+            str: The name the profile was registered under
+        """
         # Make sure name is unique
         original_name = profile_name
         counter = 1
@@ -237,33 +555,44 @@ class ProfileManager:
             counter += 1
         
         # Add profile to data
-        self.naca_data[profile_name] = {
-            "alpha": alpha_values,
-            "CL": cl_values,
-            "CD": cd_values
-        }
+        self.naca_data[profile_name] = profile_data
+        register_polar(profile_name, self.naca_data[profile_name])
+        self.naca_data.set_description(profile_name, description)
         
-        # Add basic info
-        self.profile_info[profile_name] = f"Custom profile loaded from {filename}"
+        # Save the new profile
+        self._save_profile(profile_name)
+        self._notify_profile_changed(profile_name)
+        return profile_name
+    
+    def add_generated_profile(self, designation, profile_data):
+        """
+        Register a polar synthesized by `panel_method.generate_polar`
         
-        # Save custom profiles
-        self.save_custom_profiles()
+        Returns:
+            tuple: (success, profile_name or error_message)
+        """
+        try:
+            digits = parse_designation(designation)["digits"]
+        except ValueError as e:
+            return False, str(e)
         
-        return True, profile_name
+        description = f"NACA {digits} generated by the vortex panel method (potential-flow lift, estimated drag, no stall)"
+        if "Re" in profile_data:
+            description += f" at {len(profile_data['Re'])} Reynolds numbers"
+        return True, self.add_profile(f"NACA {digits} (panel)", profile_data, description)
     
     def remove_custom_profile(self, profile_name):
         """Remove a custom profile"""
-        standard_profiles = ["NACA 2412", "NACA 0012", "NACA 4412", "NACA 2415", 
-                            "NACA 6409", "NACA 0015", "NACA 23012", "NACA 64A010"]
-        
-        if profile_name in standard_profiles:
+        if profile_name in STANDARD_PROFILES:
             return False, "Cannot remove standard NACA profiles"
         
         if profile_name in self.naca_data:
             del self.naca_data[profile_name]
+        unregister_polar(profile_name)
             
         if profile_name in self.profile_info:
             del self.profile_info[profile_name]
             
-        self.save_custom_profiles()
+        self._delete_saved_profile(profile_name)
+        self._notify_profile_changed(profile_name)
         return True, f"Profile {profile_name} removed successfully"
\ No newline at end of file
@@ -0,0 +1,167 @@
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from calculations.characteristics import compute_characteristics, characteristics_table
+from calculations.polar_table import reference_polar
+
+
+class ProfileRegistry(MutableMapping):
+    """
+    Dictionary-like view of the whole profile library that loads polars lazily.
+
+    Only a lightweight index (name, description, point count, alpha range,
+    store offset and summary characteristics) is kept for every profile. Built-in profiles and profiles
+    added at runtime stay resident; profiles from the store are read the first
+    time they are accessed and kept in a bounded LRU working set.
+    Because it behaves like the `naca_data` dictionary, it can be passed
+    anywhere a `profiles_data` argument is expected. Access is guarded by a
+    lock so background workers can read profiles while the GUI registers new ones.
+    """
+
+    def __init__(self, builtin_data, builtin_info, store, max_loaded=64):
+        """
+        Args:
+            builtin_data: Built-in profiles (e.g. `naca_data`), always resident
+            builtin_info: Descriptions of the built-in profiles
+            store: ProfileStore holding the custom profiles
+            max_loaded: Maximum number of stored profiles kept in memory
+        """
+        if max_loaded <= 0:
+            raise ValueError("Working set size must be greater than zero.")
+
+        self.store = store
+        self.max_loaded = max_loaded
+        self.listeners = []
+        self._resident = {}
+        self._loaded = OrderedDict()
+        self._lock = threading.RLock()
+        self.index = OrderedDict()
+
+        for name, profile_data in builtin_data.items():
+            self._resident[name] = profile_data
+            self.index[name] = self._entry_for(profile_data, builtin_info.get(name, ""))
+        for name in store.names():
+            if name not in self.index:
+                self.index[name] = self._entry_from_store(name)
+
+    @staticmethod
+    def _characteristics_of(profile_data):
+        polar = reference_polar(profile_data)
+        return compute_characteristics(polar["alpha"], polar["CL"], polar["CD"])
+
+    @classmethod
+    def _entry_for(cls, profile_data, description, offset=None):
+        alpha = profile_data["alpha"]
+        return {
+            "description": description,
+            "points": len(alpha),
+            "alpha_min": float(min(alpha)),
+            "alpha_max": float(max(alpha)),
+            "offset": offset,
+            "characteristics": cls._characteristics_of(profile_data)
+        }
+
+    def _entry_from_store(self, name):
+        entry = self.store.entries[name]
+        return {
+            "description": entry.get("info", ""),
+            "points": entry["rows"],
+            "alpha_min": entry.get("alpha_min"),
+            "alpha_max": entry.get("alpha_max"),
+            "offset": entry["offset"],
+            # Stores written before characteristics were indexed lack them;
+            # they are then computed on first query
+            "characteristics": entry.get("characteristics")
+        }
+
+    def add_eviction_listener(self, callback):
+        """Register a callback(profile_name) run when a profile leaves the working set"""
+        self.listeners.append(callback)
+
+    def describe(self, name):
+        """Description of a profile, without loading its data"""
+        entry = self.index.get(name)
+        return entry["description"] if entry else "No description available"
+
+    def characteristics(self, name):
+        """
+        Summary characteristics of a profile (see `CHARACTERISTICS`).
+
+        Computed once when the profile is registered or stored; reading them
+        does not load the polar.
+
+        Raises:
+            KeyError: If the profile is unknown
+        """
+        with self._lock:
+            entry = self.index[name]
+            if entry["characteristics"] is None:
+                entry["characteristics"] = self._characteristics_of(self[name])
+            return entry["characteristics"]
+
+    def characteristics_table(self, names=None):
+        """
+        Characteristics of many profiles as one structured array.
+
+        Args:
+            names: Profiles to include (default: the whole library)
+        """
+        names = list(self.index) if names is None else names
+        return characteristics_table((name, self.characteristics(name)) for name in names)
+
+    def set_description(self, name, description):
+        self.index[name]["description"] = description
+
+    def release(self, name):
+        """Makes a runtime profile that is now saved in the store evictable"""
+        with self._lock:
+            if name in self._resident and name in self.store:
+                self._loaded[name] = self._resident.pop(name)
+                self.index[name]["offset"] = self.store.entries[name]["offset"]
+
+    def is_loaded(self, name):
+        return name in self._resident or name in self._loaded
+
+    def __getitem__(self, name):
+        with self._lock:
+            if name in self._resident:
+                return self._resident[name]
+            if name in self._loaded:
+                self._loaded.move_to_end(name)
+                return self._loaded[name]
+            if name not in self.index:
+                raise KeyError(name)
+
+            profile_data = self.store.load(name)
+            self._loaded[name] = profile_data
+            while len(self._loaded) > self.max_loaded:
+                evicted, _ = self._loaded.popitem(last=False)
+                for callback in self.listeners:
+                    callback(evicted)
+            return profile_data
+
+    def __setitem__(self, name, profile_data):
+        """Registers a runtime profile; it stays resident until deleted"""
+        with self._lock:
+            self._loaded.pop(name, None)
+            self._resident[name] = profile_data
+            description = self.index[name]["description"] if name in self.index else ""
+            self.index[name] = self._entry_for(profile_data, description)
+
+    def __delitem__(self, name):
+        with self._lock:
+            if name not in self.index:
+                raise KeyError(name)
+            del self.index[name]
+            self._resident.pop(name, None)
+            self._loaded.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
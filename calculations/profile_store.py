@@ -0,0 +1,198 @@
+import os
+import json
+
+import numpy as np
+
+from calculations.characteristics import compute_characteristics
+from calculations.polar_table import is_reynolds_profile, reference_polar
+
+DATA_FILE = "profiles.bin"
+INDEX_FILE = "index.jsonl"
+
+# Columns stored for a plain polar, in order
+POLAR_COLUMNS = ("alpha", "CL", "CD")
+# Columns stored for polars at several Reynolds numbers; CL and CD are
+# (Re x alpha) grids flattened row by row
+REYNOLDS_COLUMNS = ("alpha", "Re", "CL", "CD")
+
+
+class ProfileStore:
+    """
+    Binary columnar store for custom profiles.
+
+    Polars live in one append-only file of float64 values, each profile as a
+    contiguous block of columns (alpha, CL, CD). A small JSON-lines index
+    records one line per added or deleted profile, so saving or removing a
+    profile never rewrites the others. Reynolds-dependent profiles store the
+    alpha and Re axes followed by their flattened CL and CD grids. Deleted blocks stay in the data file
+    as dead space until `compact` is called.
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory: Folder holding the data and index files (created on first write)
+        """
+        self.directory = directory
+        self.data_path = os.path.join(directory, DATA_FILE)
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.entries = {}
+        self._load_index()
+
+    def _load_index(self):
+        """Replay the index log into name -> entry"""
+        self.entries = {}
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("deleted"):
+                    self.entries.pop(record["name"], None)
+                else:
+                    self.entries[record["name"]] = record
+
+    def _append_index(self, record):
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def names(self):
+        """Names of all stored profiles, in insertion order"""
+        return list(self.entries)
+
+    def info(self, name):
+        """Description stored with a profile"""
+        return self.entries[name].get("info", "")
+
+    def append(self, name, profile_data, info=""):
+        """
+        Store one profile, replacing any previous profile of the same name.
+
+        Args:
+            name: Profile name
+            profile_data: Dictionary with equally long "alpha", "CL" and "CD"
+                sequences, or with "alpha", "Re" and (Re x alpha) "CL" and "CD"
+            info: Profile description
+        """
+        columns = list(REYNOLDS_COLUMNS if is_reynolds_profile(profile_data) else POLAR_COLUMNS)
+        block = np.concatenate([np.ravel(np.asarray(profile_data[column], dtype='<f8')) for column in columns])
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.data_path, 'ab') as f:
+            offset = f.tell() // 8
+            block.tofile(f)
+
+        alpha = np.asarray(profile_data["alpha"], dtype=np.float64)
+        polar = reference_polar(profile_data)
+        record = {
+            "name": name,
+            "offset": offset,
+            "rows": len(alpha),
+            "columns": columns,
+            "alpha_min": float(alpha.min()),
+            "alpha_max": float(alpha.max()),
+            "characteristics": compute_characteristics(polar["alpha"], polar["CL"], polar["CD"]),
+            "info": info
+        }
+        if "Re" in columns:
+            record["reynolds"] = len(profile_data["Re"])
+        self._append_index(record)
+        self.entries[name] = record
+
+    def delete(self, name):
+        """Remove one profile from the index; its data becomes dead space"""
+        if name not in self.entries:
+            return False
+        self._append_index({"name": name, "deleted": True})
+        del self.entries[name]
+        return True
+
+    def load(self, name):
+        """
+        Read a single profile without touching the others.
+
+        Returns:
+            Profile dictionary with one list per column
+
+        Raises:
+            KeyError: If the profile is not stored
+        """
+        entry = self.entries[name]
+        block = np.fromfile(self.data_path, dtype='<f8', count=self._size(entry),
+                            offset=entry["offset"] * 8)
+        rows, n_reynolds = entry["rows"], entry.get("reynolds")
+        if n_reynolds is None:
+            return {column: values.tolist() for column, values in
+                    zip(entry["columns"], block.reshape(len(entry["columns"]), rows))}
+
+        grid = n_reynolds * rows
+        alpha, reynolds, CL, CD = np.split(block, np.cumsum([rows, n_reynolds, grid]))
+        return {"alpha": alpha.tolist(), "Re": reynolds.tolist(),
+                "CL": CL.reshape(n_reynolds, rows).tolist(), "CD": CD.reshape(n_reynolds, rows).tolist()}
+
+    @staticmethod
+    def _size(entry):
+        """Number of float64 values in a profile's block"""
+        rows, n_reynolds = entry["rows"], entry.get("reynolds")
+        if n_reynolds is None:
+            return len(entry["columns"]) * rows
+        return rows + n_reynolds + 2 * n_reynolds * rows
+
+    def dead_space(self):
+        """Fraction of the data file no longer referenced by the index"""
+        if not os.path.exists(self.data_path):
+            return 0.0
+        total = os.path.getsize(self.data_path) // 8
+        used = sum(self._size(entry) for entry in self.entries.values())
+        return 1.0 - used / total if total else 0.0
+
+    def compact(self):
+        """Rewrite the data file and index without deleted profiles"""
+        profiles = [(name, self.load(name), self.info(name)) for name in self.entries]
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path):
+                os.replace(path, path + ".old")
+        self.entries = {}
+        try:
+            for name, profile_data, info in profiles:
+                self.append(name, profile_data, info)
+        except Exception:
+            for path in (self.data_path, self.index_path):
+                if os.path.exists(path + ".old"):
+                    os.replace(path + ".old", path)
+            self._load_index()
+            raise
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path + ".old"):
+                os.remove(path + ".old")
+
+    def migrate_from_json(self, json_path, skip=()):
+        """
+        Import profiles saved by the previous JSON format.
+
+        Args:
+            json_path: Path of the legacy custom_profiles.json
+            skip: Profile names not to import (e.g. standard profiles)
+
+        Returns:
+            Number of imported profiles
+        """
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        infos = data.get('profile_info', {})
+        imported = 0
+        for name, profile_data in data.get('profiles', {}).items():
+            if name in skip or name in self.entries:
+                continue
+            self.append(name, profile_data, infos.get(name, ""))
+            imported += 1
+        return imported
@@ -0,0 +1,375 @@
+"""
+Local HTTP/JSON analysis service: other tools get the coefficient lookups and
+force calculations over HTTP instead of re-implementing them or paying the
+interpreter and library startup on every call.
+
+One warm profile registry and analysis cache serve all requests. The server
+speaks HTTP/1.1 with keep-alive on asyncio streams (standard library only).
+Single analyses run on the event loop; batches and sweeps run in worker
+threads so they do not stall other connections.
+
+Endpoints:
+    GET  /profiles        Profile names, descriptions and characteristics
+    GET  /stats           Cache statistics and instrumentation counters
+    POST /analyze         One condition {"profile", "alpha", "V", "rho" or
+                          "altitude", "S"[, "chord", "method", "resolution"]},
+                          or a list of them; lists are grouped by profile and
+                          evaluated in batch
+    POST /analyze/batch   Columns {"profile", "alpha": [...], "V": [...], ...};
+                          scalars are broadcast
+    POST /sweep           Grid {"alpha", "V", "rho", "S"[, "profiles"]} through
+                          SweepEngine
+
+Usage:
+    python -m calculations.service [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from calculations import instrumentation
+from calculations.aero_calculations import (KINEMATIC_VISCOSITY, analyze_airfoil_batch,
+                                            calculate_efficiency_metrics, calculate_efficiency_metrics_batch)
+from calculations.analysis_cache import AnalysisCache
+from calculations.atmosphere import isa
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest accepted request body and header block [bytes]
+MAX_BODY_SIZE = 64 * 1024 * 1024
+MAX_HEADER_SIZE = 64 * 1024
+
+# Seconds an idle keep-alive connection is kept open
+KEEP_ALIVE_TIMEOUT = 30.0
+
+# Largest grid (profiles x points) accepted by /sweep
+MAX_SWEEP_POINTS = 50_000_000
+
+# Finest lookup resolution [°] clients may request; every resampled table is
+# cached, so this bounds the memory one request can claim
+MIN_SERVICE_RESOLUTION = 0.01
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status and a JSON {"error": message} body"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _jsonable(value):
+    """Converts NumPy values to JSON types; non-finite numbers become null"""
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _condition(body, name, default=None):
+    value = body.get(name, default)
+    if value is None:
+        raise HTTPError(400, f"Missing field '{name}'")
+    return value
+
+
+def _resolution(body):
+    """Optional "resolution" field of a request, validated against MIN_SERVICE_RESOLUTION"""
+    value = body.get("resolution")
+    if value is None:
+        return None
+    value = float(value)
+    if not value >= MIN_SERVICE_RESOLUTION:
+        raise HTTPError(400, f"Resolution must be at least {MIN_SERVICE_RESOLUTION}")
+    return value
+
+
+class AnalysisService:
+    """Request handling on top of one in-memory profile library"""
+
+    def __init__(self, profiles_data: Optional[Dict] = None, cache_size: int = 65536,
+                 max_sweep_workers: Optional[int] = None):
+        """
+        Args:
+            profiles_data: Aerodynamic data dictionary (defaults to the library
+                with saved custom profiles, as in the GUI)
+            cache_size: Entries of the single-analysis cache
+            max_sweep_workers: Worker processes per sweep (default: CPU count)
+        """
+        if profiles_data is None:
+            from calculations.naca_data import naca_data, profile_info
+            from calculations.profile_manager import ProfileManager
+
+            profiles_data = ProfileManager(dict(naca_data), dict(profile_info)).naca_data
+        self.profiles_data = profiles_data
+        self.cache = AnalysisCache(maxsize=cache_size)
+        self.max_sweep_workers = max_sweep_workers
+        self.requests = 0
+        self._writers = set()
+
+    # Endpoints
+
+    def list_profiles(self):
+        describe = getattr(self.profiles_data, "describe", None)
+        characteristics = getattr(self.profiles_data, "characteristics", None)
+        return {"profiles": [{
+            "name": name,
+            "description": describe(name) if describe else None,
+            "characteristics": characteristics(name) if characteristics else None
+        } for name in self.profiles_data]}
+
+    def stats(self):
+        return {"requests": self.requests, "cache": self.cache.stats(),
+                "instrumentation": instrumentation.snapshot()}
+
+    def _atmosphere(self, body):
+        """(rho, kinematic viscosity) from "rho" and/or "altitude" fields"""
+        if "altitude" not in body:
+            return _condition(body, "rho"), KINEMATIC_VISCOSITY
+        atmosphere = isa(body["altitude"])
+        rho = body.get("rho")
+        return (atmosphere["density"] if rho is None else rho), atmosphere["kinematic_viscosity"]
+
+    def _atmosphere_columns(self, items):
+        """Vectorized `_atmosphere` over a list of conditions"""
+        altitude = np.array([float(item.get("altitude", np.nan)) for item in items])
+        has_altitude = ~np.isnan(altitude)
+        nu = np.full(len(items), KINEMATIC_VISCOSITY)
+        isa_density = np.full(len(items), np.nan)
+        if has_altitude.any():
+            atmosphere = isa(altitude[has_altitude])
+            nu[has_altitude] = atmosphere["kinematic_viscosity"]
+            isa_density[has_altitude] = atmosphere["density"]
+        rho = np.array([float(item["rho"]) if item.get("rho") is not None else
+                        float(isa_density[i]) if has_altitude[i] else float(_condition(item, "rho"))
+                        for i, item in enumerate(items)])
+        return rho, nu
+
+    def analyze(self, body):
+        """One condition through the cache, or a list evaluated per profile in batch"""
+        if isinstance(body, list):
+            return self.analyze_many(body)
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Expected a JSON object or a list of objects")
+
+        rho, nu = self._atmosphere(body)
+        results = self.cache.analyze(float(_condition(body, "alpha")), float(_condition(body, "V")), float(rho),
+                                     float(_condition(body, "S")), _condition(body, "profile"), self.profiles_data,
+                                     chord=float(body.get("chord", 1.0)), resolution=_resolution(body),
+                                     kinematic_viscosity=float(nu), method=body.get("method", "linear"))
+        results["efficiency"] = calculate_efficiency_metrics(results)
+        return results
+
+    def analyze_many(self, items):
+        """Groups a list of single conditions by profile (and method, resolution) and runs one batch per group"""
+        if not all(isinstance(item, dict) for item in items):
+            raise HTTPError(400, "Expected a list of JSON objects")
+        responses = [None] * len(items)
+        groups = {}
+        for i, item in enumerate(items):
+            key = (_condition(item, "profile"), item.get("method", "linear"), _resolution(item))
+            groups.setdefault(key, []).append(i)
+
+        for (profile, method, resolution), indices in groups.items():
+            group = [items[i] for i in indices]
+            columns = {name: np.array([float(_condition(item, name)) for item in group])
+                       for name in ("alpha", "V", "S")}
+            rho, nu = self._atmosphere_columns(group)
+            chord = np.array([float(item.get("chord", 1.0)) for item in group])
+
+            results = analyze_airfoil_batch(columns["alpha"], columns["V"], rho, columns["S"], profile,
+                                            self.profiles_data, chord=chord, resolution=resolution,
+                                            kinematic_viscosity=nu, method=method)
+            rows = {key: value.tolist() for key, value in results.items()}
+            for j, i in enumerate(indices):
+                row = {"profile": profile, **{key: values[j] for key, values in rows.items()}}
+                row["efficiency"] = calculate_efficiency_metrics(row)
+                responses[i] = row
+        return responses
+
+    def analyze_columns(self, body):
+        """Column-oriented batch: arrays in, arrays out"""
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Expected a JSON object")
+        rho, nu = self._atmosphere(body)
+        results = analyze_airfoil_batch(_condition(body, "alpha"), _condition(body, "V"), rho, _condition(body, "S"),
+                                        _condition(body, "profile"), self.profiles_data,
+                                        chord=body.get("chord", 1.0), resolution=_resolution(body),
+                                        kinematic_viscosity=nu, method=body.get("method", "linear"))
+        return {**results, **calculate_efficiency_metrics_batch(results)}
+
+    def sweep(self, body):
+        from calculations.sweep import SweepEngine
+
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Expected a JSON object")
+        grid = [np.atleast_1d(np.asarray(_condition(body, name), dtype=np.float64)) for name in ("alpha", "V", "rho", "S")]
+        profiles = body.get("profiles") or list(self.profiles_data)
+        if len(profiles) * int(np.prod([len(axis) for axis in grid])) > MAX_SWEEP_POINTS:
+            raise HTTPError(413, f"Sweep larger than {MAX_SWEEP_POINTS} points")
+        engine = SweepEngine(self.profiles_data, profiles, max_workers=self.max_sweep_workers)
+        return engine.run(*grid, chord=float(body.get("chord", 1.0)))
+
+    # HTTP
+
+    ROUTES = {
+        ("GET", "/profiles"): ("list_profiles", False),
+        ("GET", "/stats"): ("stats", False),
+        ("POST", "/analyze"): ("analyze", False),
+        ("POST", "/analyze/batch"): ("analyze_columns", True),
+        ("POST", "/sweep"): ("sweep", True),
+    }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        """
+        Routes one request.
+
+        Returns:
+            Tuple (status, JSON-serializable payload)
+        """
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        route = self.ROUTES.get((method, path))
+        if route is None:
+            if any(route_path == path for _, route_path in self.ROUTES):
+                raise HTTPError(405, f"Method {method} not allowed for {path}")
+            raise HTTPError(404, f"Unknown endpoint {path}")
+        handler_name, in_thread = route
+        handler = getattr(self, handler_name)
+
+        if method == "GET":
+            return 200, handler()
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}")
+
+        if in_thread or (isinstance(payload, list) and len(payload) > 1):
+            result = await asyncio.get_running_loop().run_in_executor(None, handler, payload)
+        else:
+            result = handler(payload)
+        return 200, result
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves requests of one connection until it closes or stops keep-alive"""
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, {"error": "Request headers too large"}, keep_alive=False)
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, keep_alive=False)
+                    return
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length"}, keep_alive=False)
+                    return
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {"error": "Request body too large"}, keep_alive=False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                with instrumentation.timed(f"service.{method} {target.split('?', 1)[0]}"):
+                    try:
+                        status, payload = await self.dispatch(method, target, body)
+                    except HTTPError as e:
+                        status, payload = e.status, {"error": str(e)}
+                    except (ValueError, KeyError, TypeError) as e:
+                        status, payload = 400, {"error": str(e)}
+                    except Exception as e:
+                        status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(_jsonable(payload), separators=(",", ":")).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Starts listening; port 0 picks a free port (see `server.sockets`)"""
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_SIZE)
+
+    async def shutdown(self, server: asyncio.AbstractServer):
+        """Stops listening and closes the open keep-alive connections"""
+        server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await server.wait_closed()
+        await asyncio.sleep(0)  # Let the connection handlers finish
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m calculations.service",
+                                     description="Serve profile lookups and analyses over local HTTP/JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port, 0 for any free one (default: %(default)s)")
+    parser.add_argument("--sweep-workers", type=int, default=None, help="Worker processes per sweep")
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(max_sweep_workers=args.sweep_workers)
+
+    async def serve():
+        server = await service.start(args.host, args.port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Serving {len(service.profiles_data)} profiles on http://{host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Callable
+
+import numpy as np
+
+from calculations.aero_calculations import (calculate_efficiency_metrics_batch, calculate_reynolds_number,
+                                            KINEMATIC_VISCOSITY)
+from calculations.polar_table import PolarTable, ReynoldsPolarTable, is_reynolds_profile
+
+# Quantities whose maxima over the grid are tracked for every profile
+ENVELOPE_METRICS = ("L_D_ratio", "lift", "drag", "drag_efficiency", "power_factor")
+
+# Flattened grid points evaluated per task
+DEFAULT_CHUNK_SIZE = 250_000
+
+# Tasks in flight per worker; the rest are only submitted while the sweep is
+# not cancelled
+TASKS_PER_WORKER = 2
+
+# Per-process state set up once by `_init_worker`
+_worker_state = {}
+
+
+def pack_polars(profiles_data: Dict, profile_names: List[str]):
+    """
+    Packs the polars of several profiles into one flat float64 array.
+
+    A profile with n angles and m Reynolds numbers occupies n + m + 2 * m * n
+    consecutive values: alpha, Re, then the (Re x alpha) CL and CD grids.
+    Plain profiles have m = 0 and are stored as alpha, CL and CD.
+
+    Returns:
+        Tuple (buffer, offsets, lengths, reynolds_counts)
+    """
+    polars = [profiles_data[name] for name in profile_names]
+    lengths = np.array([len(polar["alpha"]) for polar in polars], dtype=np.intp)
+    reynolds_counts = np.array([len(polar["Re"]) if is_reynolds_profile(polar) else 0 for polar in polars],
+                               dtype=np.intp)
+    sizes = lengths + reynolds_counts + 2 * lengths * np.maximum(reynolds_counts, 1)
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.intp)
+    buffer = np.empty(int(sizes.sum()), dtype=np.float64)
+    for data, offset, size, m in zip(polars, offsets, sizes, reynolds_counts):
+        parts = [data["alpha"], data["Re"]] if m else [data["alpha"]]
+        parts += [np.ravel(data["CL"]), np.ravel(data["CD"])]
+        buffer[offset:offset + size] = np.concatenate(parts)
+    return buffer, offsets, lengths, reynolds_counts
+
+
+def _unpack_table(buffer, offset, n, m):
+    """Compiled table of one profile packed by `pack_polars`"""
+    if m == 0:
+        polar = buffer[offset:offset + 3 * n].reshape(3, n)
+        return PolarTable(polar[0], polar[1], polar[2])
+    alpha = buffer[offset:offset + n]
+    reynolds = buffer[offset + n:offset + n + m]
+    grids = buffer[offset + n + m:offset + n + m + 2 * m * n].reshape(2, m, n)
+    return ReynoldsPolarTable(alpha, reynolds, grids[0], grids[1])
+
+
+def _attach_shared_memory(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no `track`; pool workers share the parent's
+        # resource tracker, so the extra registration is harmless
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(shm_name, size, offsets, lengths, reynolds_counts, grid, reynolds):
+    """Attaches to the shared polar block and compiles the tables once per worker."""
+    shm = _attach_shared_memory(shm_name)
+    buffer = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+    tables = [_unpack_table(buffer, offset, n, m) for offset, n, m in zip(offsets, lengths, reynolds_counts)]
+
+    _worker_state["shm"] = shm
+    _worker_state["tables"] = tables
+    _worker_state["grid"] = grid
+    _worker_state["reynolds"] = reynolds
+
+
+def _sweep_task(profile_index, start, stop):
+    """Evaluates one slice of the flattened grid and reduces it to its maxima."""
+    alpha, V, rho, S = _worker_state["grid"]
+    table = _worker_state["tables"][profile_index]
+
+    i_alpha, i_v, i_rho, i_s = np.unravel_index(np.arange(start, stop),
+                                                (len(alpha), len(V), len(rho), len(S)))
+
+    # Coefficients depend on alpha (and on V through the Reynolds number):
+    # interpolate the axes, then gather
+    if isinstance(table, ReynoldsPolarTable):
+        CL_grid, CD_grid = table.evaluate(alpha[:, None], _worker_state["reynolds"][None, :])
+        CL, CD = CL_grid[i_alpha, i_v], CD_grid[i_alpha, i_v]
+    else:
+        CL_axis, CD_axis = table.evaluate(alpha)
+        CL, CD = CL_axis[i_alpha], CD_axis[i_alpha]
+    qS = 0.5 * rho[i_rho] * V[i_v]**2 * S[i_s]
+
+    results = {"CL": CL, "CD": CD, "lift": CL * qS, "drag": CD * qS}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        results["L_D_ratio"] = np.where(results["drag"] > 0, results["lift"] / results["drag"], np.inf)
+    metrics = calculate_efficiency_metrics_batch(results)
+    results["drag_efficiency"] = metrics["drag_efficiency"]
+    results["power_factor"] = metrics["power_factor"]
+
+    reduced = {}
+    for metric in ENVELOPE_METRICS:
+        values = np.nan_to_num(results[metric], nan=-np.inf, posinf=np.inf)
+        best = int(np.argmax(values))
+        reduced[metric] = (float(values[best]), start + best)
+    return profile_index, stop - start, reduced
+
+
+class SweepEngine:
+    """
+    Multi-core parameter sweep over every (alpha, V, rho, S) combination.
+
+    The polars are packed once into a shared memory block that the worker
+    processes attach to, so tasks only carry a profile index and a slice of
+    the flattened grid. Partial maxima are merged as tasks complete.
+    Reynolds-dependent profiles are evaluated at each speed's Reynolds
+    number, as in `analyze_airfoil_batch`.
+    """
+
+    def __init__(self, profiles_data: Dict, profile_names: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            profiles_data: Aerodynamic data dictionary
+            profile_names: Profiles to sweep (defaults to all of them)
+            max_workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Flattened grid points evaluated per task
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be greater than zero.")
+
+        self.profiles_data = profiles_data
+        self.profile_names = list(profile_names) if profile_names is not None else list(profiles_data.keys())
+        missing = [name for name in self.profile_names if name not in profiles_data]
+        if missing:
+            raise ValueError(f"Profiles not found: {', '.join(missing)}")
+
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.cancelled = False
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """
+        Requests cancellation of the current or next `run`: no further tasks
+        are submitted, pending ones are cancelled and `run` returns early with
+        the partial maxima. The request is consumed when that run ends.
+        """
+        self._cancel_event.set()
+
+    def run(self, alpha, V, rho, S,
+            progress: Optional[Callable[[int, int], None]] = None,
+            chord: float = 1.0, kinematic_viscosity: float = KINEMATIC_VISCOSITY) -> Dict[str, Dict]:
+        """
+        Sweeps every profile over the full condition grid.
+
+        Args:
+            alpha: Angles of attack [°]
+            V: Flight speeds [m/s]
+            rho: Air densities [kg/m³]
+            S: Wing surface areas [m²]
+            progress: Optional callback receiving (completed_tasks, total_tasks)
+            chord: Chord length of the airfoils [m], for the Reynolds number
+            kinematic_viscosity: Kinematic viscosity of air [m²/s]
+
+        Returns:
+            Dictionary per profile with the number of evaluated points and, for
+            each envelope metric, its maximum and the conditions where it occurs
+        """
+        grid = tuple(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in (alpha, V, rho, S))
+        if np.any(grid[1] <= 0):
+            raise ValueError("Velocity must be greater than zero.")
+        if np.any(grid[2] <= 0):
+            raise ValueError("Air density must be greater than zero.")
+        if np.any(grid[3] <= 0):
+            raise ValueError("Wing area must be greater than zero.")
+        reynolds = calculate_reynolds_number(grid[1], chord, kinematic_viscosity)
+
+        self.cancelled = False
+
+        shape = tuple(len(axis) for axis in grid)
+        n_points = int(np.prod(shape))
+        tasks = [(p, start, min(start + self.chunk_size, n_points))
+                 for p in range(len(self.profile_names))
+                 for start in range(0, n_points, self.chunk_size)]
+
+        best = {name: {"points": 0, **{metric: (-np.inf, -1) for metric in ENVELOPE_METRICS}}
+                for name in self.profile_names}
+
+        buffer, offsets, lengths, reynolds_counts = pack_polars(self.profiles_data, self.profile_names)
+        shm = shared_memory.SharedMemory(create=True, size=max(buffer.nbytes, 1))
+        try:
+            np.ndarray(buffer.shape, dtype=np.float64, buffer=shm.buf)[:] = buffer
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                     initargs=(shm.name, buffer.size, offsets, lengths, reynolds_counts,
+                                               grid, reynolds)) as pool:
+                # A bounded window of tasks in flight, so a cancellation only
+                # waits for the chunks already running
+                window = TASKS_PER_WORKER * (self.max_workers or os.cpu_count() or 1)
+                queued = iter(tasks)
+                pending = set()
+                done = 0
+                while True:
+                    while len(pending) < window and not self._cancel_event.is_set():
+                        task = next(queued, None)
+                        if task is None:
+                            break
+                        pending.add(pool.submit(_sweep_task, *task))
+                    if self._cancel_event.is_set():
+                        self.cancelled = True
+                        for future in pending:
+                            future.cancel()
+                        break
+                    if not pending:
+                        break
+
+                    completed, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        profile_index, n_evaluated, reduced = future.result()
+                        entry = best[self.profile_names[profile_index]]
+                        entry["points"] += n_evaluated
+                        for metric, candidate in reduced.items():
+                            if candidate[0] > entry[metric][0]:
+                                entry[metric] = candidate
+
+                        done += 1
+                        if progress is not None:
+                            progress(done, len(tasks))
+        finally:
+            self._cancel_event.clear()
+            shm.close()
+            shm.unlink()
+
+        return {name: self._describe(entry, grid, shape) for name, entry in best.items()}
+
+    @staticmethod
+    def _describe(entry, grid, shape):
+        described = {"points": entry["points"]}
+        for metric in ENVELOPE_METRICS:
+            value, index = entry[metric]
+            if index < 0:
+                described[metric] = None
+                continue
+            i_alpha, i_v, i_rho, i_s = np.unravel_index(index, shape)
+            described[metric] = {
+                "value": value,
+                "alpha": float(grid[0][i_alpha]),
+                "velocity": float(grid[1][i_v]),
+                "density": float(grid[2][i_rho]),
+                "wing_area": float(grid[3][i_s])
+            }
+        return described
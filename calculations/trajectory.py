@@ -0,0 +1,277 @@
+"""
+Point-mass trajectory simulation (glides and climbs) on the compiled polar
+lookups.
+
+Every step advances a whole ensemble of trajectories with NumPy: the state
+is a (4, n) array of horizontal distance, altitude, speed and flight-path
+angle, and one `evaluate` call per stage looks up CL and CD for all of them.
+The history can be streamed to a CSV or NPY file with the batch writers, so
+long or large runs do not keep it in memory.
+
+Usage:
+    from calculations.trajectory import simulate
+    final = simulate("NACA 2412", naca_data, mass=450.0, S=12.0, alpha=4.0,
+                     V0=30.0, altitude0=1000.0, output="glide.npy")
+"""
+from bisect import bisect_right
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from calculations.atmosphere import GRAVITY, MAX_ALTITUDE, MIN_ALTITUDE, isa
+from calculations.batch import open_result_writer
+from calculations.polar_table import get_polar_table
+
+# Columns of the streamed history, one row per trajectory and recorded step
+TRAJECTORY_COLUMNS = ("trajectory", "time", "x", "altitude", "velocity", "gamma", "alpha", "CL", "CD")
+
+INTEGRATORS = ("rk4", "bs23")
+
+# Spacing [m] of the tabulated atmosphere used inside the integration loop;
+# linear interpolation keeps density within ~1e-7 relative of `isa`
+ATMOSPHERE_STEP = 5.0
+
+# Bogacki-Shampine step size control
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 5.0
+
+
+def _control(alpha, n):
+    """
+    Returns a function (t, state) -> angles of attack [°] of all trajectories.
+
+    `alpha` is a constant (scalar or one value per trajectory), a (times,
+    angles) schedule interpolated linearly in time with angles shaped (k,) or
+    (n, k), or a callable (t, state) used as is.
+    """
+    if callable(alpha):
+        return alpha
+    if isinstance(alpha, tuple):
+        times, angles = (np.asarray(x, dtype=np.float64) for x in alpha)
+        if times.ndim != 1 or len(times) < 2 or np.any(np.diff(times) <= 0):
+            raise ValueError("Control schedule times must be ascending with at least two points.")
+        angles = np.broadcast_to(angles, (n, len(times)))
+        times = times.tolist()
+
+        def scheduled(t, state):
+            i = min(max(bisect_right(times, t) - 1, 0), len(times) - 2)
+            w = min(max((t - times[i]) / (times[i + 1] - times[i]), 0.0), 1.0)
+            return angles[:, i] + w * (angles[:, i + 1] - angles[:, i])
+        return scheduled
+
+    constant = np.broadcast_to(np.asarray(alpha, dtype=np.float64), (n,))
+    return lambda t, state: constant
+
+
+class _AtmosphereTable:
+    """ISA density and kinematic viscosity on a uniform altitude grid"""
+
+    def __init__(self, step=ATMOSPHERE_STEP):
+        n_points = int(round((MAX_ALTITUDE - MIN_ALTITUDE) / step)) + 1
+        altitude = np.linspace(MIN_ALTITUDE, MAX_ALTITUDE, n_points)
+        atmosphere = isa(altitude)
+        self.values = np.column_stack((atmosphere["density"], atmosphere["kinematic_viscosity"]))
+        self.slopes = np.diff(self.values, axis=0)
+        self._inv_step = (n_points - 1) / (MAX_ALTITUDE - MIN_ALTITUDE)
+        self._last = float(n_points - 1)
+
+    def evaluate(self, altitude):
+        """Returns (density, kinematic viscosity); altitudes are clamped to the ISA range"""
+        t = np.minimum(np.maximum((altitude - MIN_ALTITUDE) * self._inv_step, 0.0), self._last)
+        idx = np.minimum(t.astype(np.intp), len(self.slopes) - 1)
+        result = self.values[idx] + self.slopes[idx] * (t - idx)[:, None]
+        return result[:, 0], result[:, 1]
+
+
+_atmosphere_table = None
+
+
+def _atmosphere():
+    global _atmosphere_table
+    if _atmosphere_table is None:
+        _atmosphere_table = _AtmosphereTable()
+    return _atmosphere_table
+
+
+def simulate(profile_name: str, profiles_data: Dict, mass, S, alpha, V0, altitude0,
+             gamma0=0.0, thrust=0.0, chord=1.0, t_end: float = 600.0, dt: float = 0.05,
+             integrator: str = "rk4", rtol: float = 1e-6, atol: float = 1e-6, ground: float = 0.0,
+             resolution: Optional[float] = None, method: str = "linear", output: Optional[str] = None,
+             record_every: int = 1, max_steps: int = 1_000_000, on_step: Optional[Callable[[float, np.ndarray], None]] = None) -> Dict:
+    """
+    Integrates the longitudinal point-mass equations of motion
+
+        dV/dt = (T - D) / m - g sin(gamma)
+        dgamma/dt = L / (m V) - g cos(gamma) / V
+        dx/dt = V cos(gamma),  dh/dt = V sin(gamma)
+
+    for one or many trajectories at once, with ISA density and viscosity at
+    the current altitude (from a table, see ATMOSPHERE_STEP) and CL, CD from the profile's compiled table at the
+    commanded angle of attack and current Reynolds number. A trajectory stops
+    when it reaches the ground; its landing point is interpolated within the
+    step. All trajectories share the time step, so the adaptive integrator
+    picks it from the least accurate one.
+
+    Args:
+        profile_name: Name of the airfoil profile
+        profiles_data: Aerodynamic data dictionary
+        mass: Mass(es) [kg]
+        S: Wing surface area(s) [m²]
+        alpha: Angle of attack control [°]: constant, (times, angles) schedule
+            or callable (t, state) -> angles; see `_control`
+        V0: Initial speed(s) [m/s]
+        altitude0: Initial altitude(s) [m]
+        gamma0: Initial flight-path angle(s) [°], positive when climbing
+        thrust: Thrust(s) along the flight path [N]
+        chord: Chord length(s) [m], for the Reynolds number
+        t_end: Simulated duration [s]
+        dt: Step [s] for "rk4"; initial step for "bs23"
+        integrator: "rk4" (classic fixed-step Runge-Kutta) or "bs23"
+            (adaptive Bogacki-Shampine 3(2))
+        rtol: Relative tolerance of "bs23"
+        atol: Absolute tolerance of "bs23"
+        ground: Altitude [m] at which trajectories end
+        resolution: Optional uniform-grid spacing [°] for resampled lookups
+        method: Interpolation of the polar in alpha - "linear", "pchip" or
+            "spline" (see `get_polar_table`)
+        output: Optional CSV or NPY file receiving TRAJECTORY_COLUMNS rows
+        record_every: Write every n-th step (initial and final states are
+            always written)
+        max_steps: Safety limit on the number of steps
+        on_step: Optional callback receiving (t, state) after every step
+
+    Returns:
+        Dictionary of per-trajectory arrays "time" (landing time, or the end
+        time for trajectories still flying), "x", "altitude", "velocity",
+        "gamma" [°] and "landed", plus "steps" and "rows" written
+
+    Raises:
+        ValueError: If a profile, integrator or interpolation method is
+            unknown or an input is out of range
+    """
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"Unknown integrator '{integrator}'. Available: {', '.join(INTEGRATORS)}")
+    if dt <= 0 or t_end <= 0:
+        raise ValueError("Time step and duration must be greater than zero.")
+    if record_every < 1:
+        raise ValueError("record_every must be at least 1.")
+
+    V0, h0, gamma0, mass, S, thrust, chord = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in (V0, altitude0, gamma0, mass, S, thrust, chord)))
+    if np.any(mass <= 0):
+        raise ValueError("Mass must be greater than zero.")
+    if np.any(S <= 0):
+        raise ValueError("Wing area must be greater than zero.")
+    if np.any(V0 <= 0):
+        raise ValueError("Velocity must be greater than zero.")
+
+    n = len(V0)
+    table = get_polar_table(profile_name, profiles_data, resolution, method)
+    control = _control(alpha, n)
+    atmosphere = _atmosphere()
+    active = h0 > ground
+
+    def coefficients(t, y):
+        rho, nu = atmosphere.evaluate(y[1])
+        V = np.maximum(y[2], 1e-6)
+        angle = control(t, y)
+        CL, CD = table.evaluate(angle, V * chord / nu)
+        return angle, CL, CD, rho, V
+
+    def derivatives(t, y):
+        _, CL, CD, rho, V = coefficients(t, y)
+        qS = 0.5 * rho * V**2 * S
+        cos_g, sin_g = np.cos(y[3]), np.sin(y[3])
+        dy = np.empty_like(y)
+        dy[0] = V * cos_g
+        dy[1] = V * sin_g
+        dy[2] = (thrust - CD * qS) / mass - GRAVITY * sin_g
+        dy[3] = CL * qS / (mass * V) - GRAVITY * cos_g / V
+        dy[:, ~active] = 0.0  # Landed trajectories stay put
+        return dy
+
+    y = np.stack((np.zeros(n), h0, V0, np.radians(gamma0)))
+    t = 0.0
+    t_final = np.full(n, t_end)
+    t_final[~active] = 0.0
+    steps = 0
+    writer = open_result_writer(output, TRAJECTORY_COLUMNS) if output is not None else None
+
+    def record(t, y, rows):
+        if writer is None or not rows.any():
+            return
+        angle, CL, CD, _, _ = coefficients(t, y)
+        time = np.where(rows & ~active & (h0 > ground), t_final, t)  # Touchdown time once landed
+        block = np.column_stack((np.flatnonzero(rows), time[rows], y[0, rows], y[1, rows],
+                                 y[2, rows], np.degrees(y[3, rows]), np.broadcast_to(angle, (n,))[rows],
+                                 np.broadcast_to(CL, (n,))[rows], np.broadcast_to(CD, (n,))[rows]))
+        writer.write(block)
+
+    try:
+        record(t, y, np.ones(n, dtype=bool))
+        h = min(dt, t_end)
+        k1 = derivatives(t, y) if integrator == "bs23" else None
+
+        while t < t_end and active.any():
+            if steps >= max_steps:
+                raise ValueError(f"Trajectory did not finish within {max_steps} steps.")
+            h = min(h, t_end - t)
+
+            if integrator == "rk4":
+                k1 = derivatives(t, y)
+                k2 = derivatives(t + h / 2, y + h / 2 * k1)
+                k3 = derivatives(t + h / 2, y + h / 2 * k2)
+                k4 = derivatives(t + h, y + h * k3)
+                y_new = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+                h_next = h
+            else:
+                k2 = derivatives(t + h / 2, y + h / 2 * k1)
+                k3 = derivatives(t + 3 * h / 4, y + 3 * h / 4 * k2)
+                y_new = y + h * (2 / 9 * k1 + 1 / 3 * k2 + 4 / 9 * k3)
+                k4 = derivatives(t + h, y_new)
+                error = h * (-5 / 72 * k1 + 1 / 12 * k2 + 1 / 9 * k3 - 1 / 8 * k4)
+                scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+                norm = np.sqrt(np.mean((error[:, active] / scale[:, active])**2, axis=0)).max()
+                factor = _SAFETY * norm**(-1 / 3) if norm > 0 else _MAX_FACTOR
+                h_next = h * min(_MAX_FACTOR, max(_MIN_FACTOR, factor))
+                if norm > 1:
+                    h = h_next
+                    continue
+                k1 = k4  # First same as last
+
+            # Trajectories crossing the ground end at the interpolated touchdown
+            landed = active & (y_new[1] <= ground)
+            if landed.any():
+                w = (y[1, landed] - ground) / (y[1, landed] - y_new[1, landed])
+                y_new[:, landed] = y[:, landed] + w * (y_new[:, landed] - y[:, landed])
+                y_new[1, landed] = ground
+                t_final[landed] = t + w * h
+
+            recorded = active.copy()
+            y, t = y_new, t + h
+            active &= ~landed
+            steps += 1
+            if integrator == "bs23" and landed.any():
+                k1 = derivatives(t, y)
+            if on_step is not None:
+                on_step(t, y)
+            if steps % record_every == 0 or not active.any() or t >= t_end:
+                record(t, y, recorded)
+            elif landed.any():
+                record(t, y, landed)
+            h = h_next
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return {
+        "time": t_final,
+        "x": y[0],
+        "altitude": y[1],
+        "velocity": y[2],
+        "gamma": np.degrees(y[3]),
+        "landed": ~active & (h0 > ground),
+        "steps": steps,
+        "rows": writer.rows if writer is not None else 0
+    }
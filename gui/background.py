@@ -0,0 +1,212 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobCancelled(Exception):
+    """Raised by `Job.check` to abandon a cancelled job"""
+
+
+class Job:
+    """
+    Handle passed to a background function to check for cancellation and report progress.
+
+    Cancellation is cooperative: long-running functions call `check` between
+    steps (or pass `should_stop` to calculations that accept one), so a
+    superseded job frees its worker early instead of running to the end.
+    """
+
+    def __init__(self, runner, channel, generation):
+        self.runner = runner
+        self.channel = channel
+        self.generation = generation
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def should_stop(self):
+        """True once the job is cancelled; for `should_stop` arguments"""
+        return self._cancel_event.is_set()
+
+    def check(self):
+        """
+        Raises:
+            JobCancelled: If the job was cancelled
+        """
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, fraction):
+        """Report progress in [0, 1]; delivered to `on_progress` on the Tk thread"""
+        self.runner._results.put((self, "progress", fraction))
+
+
+class BackgroundRunner:
+    """
+    Runs work on background threads and hands the results back to the Tk loop.
+
+    Every job belongs to a channel (e.g. "analysis", "import"). Submitting a
+    new job on a channel cancels the previous one and makes its result stale,
+    so only the latest request's callbacks ever run. Callbacks are invoked
+    from `root.after` polling, never from the worker threads.
+    """
+
+    def __init__(self, root, max_workers=2, poll_ms=30):
+        """
+        Args:
+            root: Tk widget whose event loop receives the results
+            max_workers: Number of worker threads
+            poll_ms: Result queue polling interval while jobs are running
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aero-worker")
+        self._results = queue.Queue()
+        self._jobs = {}
+        self._callbacks = {}
+        self._generation = 0
+        self._polling = False
+        self.on_busy_changed = None
+
+    def submit(self, channel, func, *args, on_done=None, on_error=None, on_progress=None):
+        """
+        Run `func(job, *args)` on a worker thread.
+
+        Args:
+            channel: Name of the request stream; supersedes its previous job
+            func: Function called with the Job handle followed by `args`
+            on_done: Called on the Tk thread with the function's result
+            on_error: Called on the Tk thread with the raised exception
+            on_progress: Called on the Tk thread with reported progress
+
+        Returns:
+            The Job handle
+        """
+        self.cancel(channel)
+        self._generation += 1
+        job = Job(self, channel, self._generation)
+        self._jobs[channel] = job
+        self._callbacks[job.generation] = (on_done, on_error, on_progress)
+        self._executor.submit(self._run, job, func, args)
+        self._notify_busy()
+        self._schedule_poll()
+        return job
+
+    def _run(self, job, func, args):
+        if job.cancelled:
+            return  # Superseded while queued
+        try:
+            result = func(job, *args)
+        except JobCancelled:
+            return
+        except Exception as e:
+            self._results.put((job, "error", e))
+        else:
+            self._results.put((job, "done", result))
+
+    def cancel(self, channel):
+        """Cancel the job of a channel: a queued job never starts, a running one stops at its next check, and its result is discarded"""
+        job = self._jobs.pop(channel, None)
+        if job is not None:
+            job.cancel()
+            self._callbacks.pop(job.generation, None)
+            self._notify_busy()
+
+    def cancel_all(self):
+        for channel in list(self._jobs):
+            self.cancel(channel)
+
+    def busy(self):
+        return bool(self._jobs)
+
+    def shutdown(self):
+        self.cancel_all()
+        self._executor.shutdown(wait=False)
+
+    def _notify_busy(self):
+        if self.on_busy_changed is not None:
+            self.on_busy_changed(self.busy())
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                job, kind, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            callbacks = self._callbacks.get(job.generation)
+            if callbacks is None or job.cancelled:
+                continue  # Superseded or cancelled: drop stale result
+            on_done, on_error, on_progress = callbacks
+
+            if kind == "progress":
+                if on_progress is not None:
+                    on_progress(payload)
+                continue
+
+            del self._callbacks[job.generation]
+            if self._jobs.get(job.channel) is job:
+                del self._jobs[job.channel]
+                self._notify_busy()
+            if kind == "done" and on_done is not None:
+                on_done(payload)
+            elif kind == "error" and on_error is not None:
+                on_error(payload)
+
+        if self._jobs:
+            self._schedule_poll()
+
+
+class Throttle:
+    """
+    Coalesces rapid calls (e.g. slider drags) into at most one call per interval.
+
+    `trigger` records the latest arguments; the function runs on the Tk loop
+    with those arguments once the interval since the previous run has passed,
+    so intermediate values are dropped instead of queued.
+    """
+
+    def __init__(self, root, func, interval_ms=16):
+        """
+        Args:
+            root: Tk widget whose event loop runs the function
+            func: Function to call with the latest arguments
+            interval_ms: Minimum time between two calls (16 ms is about 60 Hz)
+        """
+        self.root = root
+        self.func = func
+        self.interval = interval_ms / 1000
+        self._args = None
+        self._scheduled = False
+        self._last_call = float("-inf")
+
+    def trigger(self, *args):
+        self._args = args
+        if not self._scheduled:
+            self._scheduled = True
+            wait = max(0.0, self._last_call + self.interval - time.monotonic())
+            self.root.after(int(wait * 1000), self._fire)
+
+    def cancel(self):
+        """Drop the pending call, if any"""
+        self._args = None
+
+    def _fire(self):
+        self._scheduled = False
+        if self._args is None:
+            return
+        args, self._args = self._args, None
+        self._last_call = time.monotonic()
+        self.func(*args)
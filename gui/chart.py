@@ -0,0 +1,166 @@
+from calculations.instrumentation import timed
+from calculations.polar_table import compile_polar, is_reynolds_profile
+
+# Relative change of Re within which the drawn polar of a Reynolds-dependent
+# profile is kept and only the operating point is blitted
+REYNOLDS_BIN = 0.05
+
+
+class ProfileChart:
+    """
+    Polar chart of one profile with an operating-point overlay.
+
+    The curves, markers and the results box are created once and updated in
+    place. A full redraw happens only when the profile, the title or the axes
+    limits change; moving the operating point restores the cached background
+    and blits just the overlay artists. Reynolds-dependent profiles are drawn
+    at the Reynolds number of a recent result (the reference polar before any
+    analysis); the curves are redrawn only when Re moves by more than
+    REYNOLDS_BIN or crosses a tabulated Re, so a live speed sweep still blits.
+    """
+
+    def __init__(self, ax, canvas, colors):
+        """
+        Args:
+            ax: Matplotlib axes to draw into
+            canvas: Figure canvas of the axes
+            colors: Color scheme of the application
+        """
+        self.ax = ax
+        self.canvas = canvas
+        self.colors = colors
+        self.profile = None
+        self.reynolds = None
+        self._table = None
+        self.full_draws = 0
+        self.blits = 0
+        self._background = None
+
+        ax.set_xlabel("Angle of attack [°]", fontsize=11, color=colors["text"])
+        ax.set_ylabel("Coefficient", fontsize=11, color=colors["text"])
+        ax.tick_params(colors=colors["text"])
+        ax.grid(True, linestyle='--', alpha=0.4)
+
+        self.cl_line, = ax.plot([], [], 'o-', color=colors["primary"], label="CL", linewidth=2)
+        self.cd_line, = ax.plot([], [], 's-', color=colors["secondary"], label="CD", linewidth=2)
+
+        # Overlay artists are animated: excluded from full draws and blitted on top
+        self.cl_marker = ax.scatter([], [], s=100, color='red', marker='o', label="Operating point", animated=True, zorder=3)
+        self.cd_marker = ax.scatter([], [], s=100, color='red', marker='s', animated=True, zorder=3)
+        self.info_text = ax.text(0.02, 0.98, "", transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.9), animated=True, visible=False)
+        self.overlay = (self.cl_marker, self.cd_marker, self.info_text)
+        ax.legend()
+
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def show_profile(self, name, profile_data, title=None):
+        """Show the polar of a profile and hide the operating point (full redraw)"""
+        self._set_profile(name, profile_data, title)
+        for artist in self.overlay:
+            artist.set_visible(False)
+        self.redraw()
+
+    def _set_profile(self, name, profile_data, title, reynolds=None):
+        self.profile = name
+        self.reynolds = reynolds
+        alpha, CL, CD = self._curve(profile_data, reynolds)
+        self.cl_line.set_data(alpha, CL)
+        self.cd_line.set_data(alpha, CD)
+        self.ax.set_title(title or f"Profile: {name}", fontsize=12, pad=15, color=self.colors["text"])
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def show_results(self, results, profile_data):
+        """
+        Move the operating point to an analysis result.
+
+        Blits the overlay when only the point moved; falls back to a full
+        redraw when the profile or title changes or the point leaves the axes.
+        """
+        name = results["profile"]
+        title = f"Analysis: {name}"
+        reynolds = None
+        if is_reynolds_profile(profile_data):
+            reynolds = self._drawn_reynolds(name, profile_data, results["reynolds_number"])
+            title += f" (Re = {reynolds:.3g})"
+        full = name != self.profile or self.ax.get_title() != title
+        if name != self.profile or reynolds != self.reynolds:
+            self._set_profile(name, profile_data, title, reynolds)
+        elif full:
+            self.ax.set_title(title, fontsize=12, pad=15, color=self.colors["text"])
+
+        alpha = results["alpha"]
+        self.cl_marker.set_offsets([[alpha, results["CL"]]])
+        self.cd_marker.set_offsets([[alpha, results["CD"]]])
+        self.info_text.set_text(f"CL: {results['CL']:.3f}  CD: {results['CD']:.4f}\n"
+                                f"Lift: {results['lift']:.1f} N\nDrag: {results['drag']:.1f} N\nL/D: {results['L_D_ratio']:.2f}"
+                                + (f"\nRe: {results['reynolds_number']:.3g}" if reynolds is not None else ""))
+        for artist in self.overlay:
+            artist.set_visible(True)
+
+        if not self._within_limits(alpha, results["CL"], results["CD"]):
+            self.ax.update_datalim([[alpha, results["CL"]], [alpha, results["CD"]]])
+            self.ax.autoscale_view()
+            full = True
+
+        if full or self._background is None:
+            self.redraw()
+        else:
+            self.blit()
+
+    def _drawn_reynolds(self, name, profile_data, reynolds):
+        """Re to draw the polar at: the current one while Re stays in its bin"""
+        drawn = self.reynolds
+        if name != self.profile or drawn is None:
+            return reynolds
+        low, high = sorted((drawn, reynolds))
+        tabulated = self._compiled(profile_data).reynolds
+        if high - low > REYNOLDS_BIN * drawn or ((tabulated > low) & (tabulated < high)).any():
+            return reynolds
+        return drawn
+
+    def _compiled(self, profile_data):
+        if self._table is None or self._table.source is not profile_data:
+            self._table = compile_polar(profile_data)
+        return self._table
+
+    def _curve(self, profile_data, reynolds):
+        """Polar to draw: the profile's own columns, or its grid at one Re"""
+        if not is_reynolds_profile(profile_data):
+            return profile_data["alpha"], profile_data["CL"], profile_data["CD"]
+        table = self._compiled(profile_data)
+        return (table.alpha,) + table.evaluate(table.alpha, reynolds)
+
+    def _within_limits(self, alpha, *values):
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        return x0 <= alpha <= x1 and all(y0 <= value <= y1 for value in values)
+
+    def redraw(self):
+        """Full redraw; the background is re-captured by the draw event"""
+        self.full_draws += 1
+        with timed("chart.draw"):
+            self.canvas.draw()
+
+    def blit(self):
+        """Redraw only the overlay artists over the cached background"""
+        if self._background is None or not self.canvas.supports_blit:
+            self.redraw()
+            return
+        self.blits += 1
+        with timed("chart.blit"):
+            self.canvas.restore_region(self._background)
+            self._draw_overlay()
+            self.canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        # Runs after every full draw, including resizes and toolbar zoom/pan
+        if self.canvas.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_overlay()
+
+    def _draw_overlay(self):
+        for artist in self.overlay:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
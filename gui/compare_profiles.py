@@ -1,9 +1,18 @@
 import tkinter as tk
 from tkinter import Toplevel, ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
-from calculations.aero_calculations import analyze_airfoil
+import numpy as np
+
+from calculations.comparison import alpha_grid, compare_profiles, rank_profiles
+from calculations.optimum import find_optima
+from calculations.polar_table import INTERPOLATION_METHODS, get_polar_table
+from gui.background import BackgroundRunner
+
+# Number of best-ranked profiles drawn as labeled lines; the rest share one collection
+HIGHLIGHTED_PROFILES = 5
 
 class ProfileComparisonWindow:
     def __init__(self, master, naca_data, profile_info, colors):
@@ -13,17 +22,28 @@ class ProfileComparisonWindow:
         self.colors = colors
 
         self.top = Toplevel(master)
-        self.top.title("Compare Two Profiles")
+        self.top.title("Compare Profiles")
         self.top.configure(bg=self.colors["background"])
-        self.top.geometry("1000x700")
+        self.top.geometry("1200x760")
 
-        self.profile1 = tk.StringVar()
-        self.profile2 = tk.StringVar()
+        self.alpha_start = tk.DoubleVar(value=-5.0)
+        self.alpha_stop = tk.DoubleVar(value=15.0)
+        self.alpha_step = tk.DoubleVar(value=0.25)
         self.air_speed = tk.DoubleVar(value=25.0)
         self.air_density = tk.DoubleVar(value=1.225)
         self.wing_area = tk.DoubleVar(value=12.0)
+        self.fast_lookup = tk.BooleanVar(value=False)
+        self.lookup_resolution = tk.DoubleVar(value=0.1)
+        self.interpolation = tk.StringVar(value="linear")
 
+        self.runner = BackgroundRunner(self.top)
         self.setup_ui()
+        self.runner.on_busy_changed = self.on_busy_changed
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self):
+        self.runner.shutdown()
+        self.top.destroy()
 
     def setup_ui(self):
         main_frame = ttk.Frame(self.top, style="Card.TFrame")
@@ -34,20 +54,41 @@ class ProfileComparisonWindow:
         control_frame = ttk.Frame(main_frame, style="Card.TFrame", padding=10)
         control_frame.grid(row=0, column=0, sticky="nsw")
 
-        profiles = list(self.naca_data.keys())
+        ttk.Label(control_frame, text="Profiles:", style="Card.TLabel").pack(anchor="w")
+        list_frame = ttk.Frame(control_frame)
+        list_frame.pack(fill="x", pady=5)
+        self.profile_list = tk.Listbox(list_frame, selectmode="extended", height=12, exportselection=False)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.profile_list.yview)
+        self.profile_list.configure(yscrollcommand=scrollbar.set)
+        self.profile_list.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        for name in self.naca_data:
+            self.profile_list.insert("end", name)
+
+        ttk.Button(control_frame, text="Select all", command=lambda: self.profile_list.selection_set(0, "end"), style="Secondary.TButton").pack(fill="x")
 
-        ttk.Label(control_frame, text="Profile 1:", style="Card.TLabel").pack(anchor="w")
-        ttk.Combobox(control_frame, textvariable=self.profile1, values=profiles, state="readonly").pack(fill="x", pady=5)
+        self.add_entry(control_frame, "Alpha from [°]:", self.alpha_start)
+        self.add_entry(control_frame, "Alpha to [°]:", self.alpha_stop)
+        self.add_entry(control_frame, "Alpha step [°]:", self.alpha_step)
 
-        ttk.Label(control_frame, text="Profile 2:", style="Card.TLabel").pack(anchor="w")
-        ttk.Combobox(control_frame, textvariable=self.profile2, values=profiles, state="readonly").pack(fill="x", pady=5)
+        ttk.Label(control_frame, text="Interpolation:", style="Card.TLabel").pack(anchor="w")
+        ttk.Combobox(control_frame, textvariable=self.interpolation, values=INTERPOLATION_METHODS, state="readonly").pack(fill="x", pady=5)
+
+        ttk.Checkbutton(control_frame, text="Fast lookup (uniform grid)", variable=self.fast_lookup).pack(anchor="w", pady=(5, 0))
+        self.add_entry(control_frame, "Grid resolution [°]:", self.lookup_resolution)
 
         ttk.Button(control_frame, text="Compare", command=self.compare_profiles, style="Action.TButton").pack(fill="x", pady=10)
 
+        self.lookup_label = ttk.Label(control_frame, text="", style="Card.TLabel", font=("Segoe UI", 8), foreground=self.colors["text_light"], wraplength=200)
+        self.lookup_label.pack(anchor="w")
+
+        self.progress = ttk.Progressbar(control_frame, mode="determinate", maximum=1.0)
+
         chart_frame = ttk.Frame(main_frame, style="Card.TFrame", padding=10)
         chart_frame.grid(row=0, column=1, sticky="nsew")
         chart_frame.columnconfigure(0, weight=1)
-        chart_frame.rowconfigure(0, weight=1)
+        chart_frame.rowconfigure(0, weight=3)
+        chart_frame.rowconfigure(1, weight=1)
 
         self.figure = Figure(figsize=(6, 5), dpi=100, facecolor=self.colors["surface"])
         self.ax = self.figure.add_subplot(111)
@@ -55,39 +96,115 @@ class ProfileComparisonWindow:
         self.canvas = FigureCanvasTkAgg(self.figure, chart_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
 
+        columns = ("rank", "profile", "max_L_D", "alpha_at_max_L_D", "CL_max")
+        headings = ("#", "Profile", "Max L/D", "Alpha at max L/D [°]", "CL max")
+        self.summary = ttk.Treeview(chart_frame, columns=columns, show="headings", height=8)
+        for column, heading in zip(columns, headings):
+            self.summary.heading(column, text=heading)
+            self.summary.column(column, width=60 if column == "rank" else 140, anchor="w" if column == "profile" else "e")
+        self.summary.grid(row=1, column=0, sticky="nsew", pady=(10, 0))
+
     def add_entry(self, parent, label, var):
         ttk.Label(parent, text=label, style="Card.TLabel").pack(anchor="w")
         entry = ttk.Entry(parent, textvariable=var)
         entry.pack(fill="x", pady=5)
 
+    def selected_profiles(self):
+        return [self.profile_list.get(i) for i in self.profile_list.curselection()]
+
     def compare_profiles(self):
-        p1 = self.profile1.get()
-        p2 = self.profile2.get()
-        if not p1 or not p2:
-            messagebox.showerror("Error", "Select both profiles")
+        names = self.selected_profiles()
+        if not names:
+            messagebox.showerror("Error", "Select at least one profile")
             return
 
         try:
-            alpha_range = self.naca_data[p1]["alpha"]
+            alpha = alpha_grid(self.alpha_start.get(), self.alpha_stop.get(), self.alpha_step.get())
             V, rho, S = self.air_speed.get(), self.air_density.get(), self.wing_area.get()
+            resolution = self.lookup_resolution.get() if self.fast_lookup.get() else None
+            method = self.interpolation.get()
+        except (tk.TclError, ValueError) as e:
+            messagebox.showerror("Calculation Error", str(e))
+            return
 
-            results1 = [analyze_airfoil(a, V, rho, S, p1, self.naca_data) for a in alpha_range]
-            results2 = [analyze_airfoil(a, V, rho, S, p2, self.naca_data) for a in alpha_range]
-
-            best1 = max(results1, key=lambda r: r["L_D_ratio"])
-            best2 = max(results2, key=lambda r: r["L_D_ratio"])
-
-            self.ax.clear()
-            self.ax.grid(True, linestyle='--', alpha=0.3)
-            self.ax.set_title("L/D Ratio Comparison", color=self.colors["text"])
-            self.ax.set_xlabel("Angle of Attack [deg]", color=self.colors["text"])
-            self.ax.set_ylabel("L/D Ratio", color=self.colors["text"])
-            self.ax.tick_params(colors=self.colors["text"])
-
-            self.ax.plot(alpha_range, [r["L_D_ratio"] for r in results1], label=f"{p1} (max @ {best1['alpha']:.1f}°)", color=self.colors["primary"])
-            self.ax.plot(alpha_range, [r["L_D_ratio"] for r in results2], label=f"{p2} (max @ {best2['alpha']:.1f}°)", color=self.colors["secondary"])
+        # A new comparison supersedes one still running
+        self.runner.submit("compare", self.compute_comparison, names, alpha, V, rho, S, resolution, method,
+                           on_done=self.show_comparison,
+                           on_progress=lambda fraction: self.progress.configure(value=fraction),
+                           on_error=lambda e: messagebox.showerror("Calculation Error", str(e)))
+
+    def compute_comparison(self, job, names, alpha, V, rho, S, resolution, method):
+        """Runs on a worker thread; returns everything `show_comparison` needs"""
+        def progress(done, total):
+            job.check()  # A superseded comparison stops after the current profile
+            job.report_progress(done / total)
+
+        comparison = compare_profiles(names, self.naca_data, alpha, V, rho, S, resolution=resolution,
+                                      progress=progress, method=method)
+        job.check()
+        # Exact optima between the grid points, not just at them
+        optima = find_optima(names, self.naca_data, alpha_range=(alpha[0], alpha[-1]), method=method,
+                             reynolds=comparison["reynolds_number"])
+        ranking = rank_profiles(comparison, optima)
+        job.check()
+
+        errors = None
+        # The smooth modes ignore the resolution
+        if resolution is not None and method == "linear":
+            # Reynolds-dependent profiles are never resampled and report no error
+            tables = {name: get_polar_table(name, self.naca_data, resolution) for name in names}
+            errors = {name: table.max_error for name, table in tables.items() if hasattr(table, "max_error")}
+        return comparison, ranking, errors
+
+    def show_comparison(self, result):
+        comparison, ranking, errors = result
+
+        if not errors:
+            self.lookup_label.config(text="")
+        else:
+            worst_cl = max(errors.items(), key=lambda item: item[1]["CL"])
+            worst_cd = max(errors.items(), key=lambda item: item[1]["CD"])
+            self.lookup_label.config(text=f"Max resampling error: ΔCL={worst_cl[1]['CL']:.2g} ({worst_cl[0]}), "
+                                          f"ΔCD={worst_cd[1]['CD']:.2g} ({worst_cd[0]})")
+
+        self.plot_comparison(comparison, ranking)
+        self.summary.delete(*self.summary.get_children())
+        for row in ranking:
+            values = [row["rank"], row["profile"]] + [
+                "-" if row[key] is None else f"{row[key]:.{digits}f}"
+                for key, digits in (("max_L_D", 2), ("alpha_at_max_L_D", 2), ("CL_max", 3))]
+            self.summary.insert("", "end", values=values)
+
+    def plot_comparison(self, comparison, ranking):
+        alpha = comparison["alpha"]
+        index = {name: i for i, name in enumerate(comparison["profiles"])}
+        highlighted = [row["profile"] for row in ranking[:HIGHLIGHTED_PROFILES] if row["max_L_D"] is not None]
+
+        self.ax.clear()
+        self.ax.grid(True, linestyle='--', alpha=0.3)
+        self.ax.set_title(f"L/D Ratio Comparison ({len(ranking)} profiles)", color=self.colors["text"])
+        self.ax.set_xlabel("Angle of Attack [deg]", color=self.colors["text"])
+        self.ax.set_ylabel("L/D Ratio", color=self.colors["text"])
+        self.ax.tick_params(colors=self.colors["text"])
+
+        # All other profiles as a single artist, so 50+ curves still draw quickly
+        others = [np.column_stack((alpha, comparison["L_D_ratio"][index[name]]))
+                  for name in comparison["profiles"] if name not in highlighted]
+        if others:
+            self.ax.add_collection(LineCollection(others, colors=self.colors["text_light"], linewidths=1, alpha=0.4))
+
+        for row in ranking[:len(highlighted)]:
+            self.ax.plot(alpha, comparison["L_D_ratio"][index[row["profile"]]], linewidth=2,
+                         label=f"{row['profile']} (max {row['max_L_D']:.1f} @ {row['alpha_at_max_L_D']:.1f}°)")
+        self.ax.autoscale_view()
+        if highlighted:
             self.ax.legend()
 
-            self.canvas.draw()
-        except Exception as e:
-            messagebox.showerror("Calculation Error", str(e))
+        self.canvas.draw()
+
+    def on_busy_changed(self, busy):
+        if busy:
+            self.progress.configure(value=0)
+            self.progress.pack(fill="x", pady=5)
+        else:
+            self.progress.pack_forget()
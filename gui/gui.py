@@ -1,12 +1,15 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+from tkinter import ttk, messagebox, simpledialog
 from calculations.naca_data import naca_data, profile_info
-from calculations.aero_calculations import analyze_airfoil
+from calculations.aero_calculations import KINEMATIC_VISCOSITY, analyze_airfoil
+from calculations.atmosphere import MAX_ALTITUDE, MIN_ALTITUDE, isa
+from calculations.analysis_cache import AnalysisCache
+from calculations.naca_geometry import parse_designation
+from calculations.panel_method import generate_polar
+from calculations.polar_table import INTERPOLATION_METHODS
 from calculations.profile_manager import ProfileManager
-from gui.compare_profiles import ProfileComparisonWindow
+from gui.background import BackgroundRunner, Throttle
+from gui.chart import ProfileChart
 
 class AirfoilGUI:
     def __init__(self, root):
@@ -26,8 +29,14 @@ class AirfoilGUI:
         self.setup_window()
         self.init_variables()
         self.profile_manager = ProfileManager(naca_data, profile_info)
+        self.profiles = self.profile_manager.naca_data
+        self.analysis_cache = AnalysisCache(maxsize=4096)
+        self.profile_manager.add_listener(self.analysis_cache.profile_changed)
+        self.runner = BackgroundRunner(self.root)
+        self.live_throttle = Throttle(self.root, self.live_update)
         self.configure_styles()
         self.create_interface()
+        self.runner.on_busy_changed = self.on_busy_changed
 
     def setup_window(self):
         screen_w, screen_h = self.root.winfo_screenwidth(), self.root.winfo_screenheight()
@@ -43,10 +52,37 @@ class AirfoilGUI:
         self.selected_profile = tk.StringVar(value=profiles[0])
         self.angle_of_attack = tk.DoubleVar(value=5.0)
         self.air_speed = tk.DoubleVar(value=25.0)
+        self.altitude = tk.DoubleVar(value=0.0)
         self.air_density = tk.DoubleVar(value=1.225)
         self.wing_area = tk.DoubleVar(value=12.0)
+        self.interpolation = tk.StringVar(value="linear")
+        self.live_mode = tk.BooleanVar(value=False)
         self.last_results = None
 
+        for variable in (self.selected_profile, self.angle_of_attack, self.air_speed, self.air_density, self.wing_area, self.interpolation):
+            variable.trace_add("write", self.on_input_changed)
+        self.altitude.trace_add("write", self.on_altitude_changed)
+
+    def on_altitude_changed(self, *args):
+        # The ISA density of the new altitude; it can still be overridden by hand
+        try:
+            self.air_density.set(round(float(isa(self.altitude.get())["density"]), 4))
+        except (tk.TclError, ValueError):
+            pass
+
+    def kinematic_viscosity(self):
+        """ISA kinematic viscosity at the current altitude (sea level if it is invalid)"""
+        try:
+            return float(isa(self.altitude.get())["kinematic_viscosity"])
+        except (tk.TclError, ValueError):
+            return KINEMATIC_VISCOSITY
+
+    def on_input_changed(self, *args):
+        # A pending analysis is stale as soon as any input changes
+        self.runner.cancel("analysis")
+        if self.live_mode.get():
+            self.live_throttle.trigger()
+
     def configure_styles(self):
         style = ttk.Style()
         style.theme_use('clam')
@@ -99,12 +135,14 @@ class AirfoilGUI:
         profile_frame.pack(fill="x", pady=(0, 15))
 
         ttk.Label(profile_frame, text="Select profile:", style="Card.TLabel").pack(anchor="w", pady=(0, 5))
-        profile_combo = ttk.Combobox(profile_frame, textvariable=self.selected_profile, values=list(naca_data.keys()), state="readonly")
-        profile_combo.pack(fill="x", pady=(0, 8))
-        profile_combo.bind('<<ComboboxSelected>>', self.on_profile_change)
+        self.profile_combo = ttk.Combobox(profile_frame, textvariable=self.selected_profile, values=list(self.profiles.keys()), state="readonly")
+        self.profile_combo.pack(fill="x", pady=(0, 8))
+        self.profile_combo.bind('<<ComboboxSelected>>', self.on_profile_change)
 
         open_btn = ttk.Button(profile_frame, text="📂 Open", command=self.add_custom_profile, style="Accent.TButton")
         open_btn.pack(fill="x", pady=(0, 5))
+        generate_btn = ttk.Button(profile_frame, text="✈ Generate NACA", command=self.generate_naca_profile, style="Secondary.TButton")
+        generate_btn.pack(fill="x", pady=(0, 5))
 
         self.profile_desc = ttk.Label(profile_frame, text="", style="Card.TLabel", font=("Segoe UI", 8), foreground=self.colors["text_light"], wraplength=240)
         self.profile_desc.pack(anchor="w")
@@ -114,12 +152,50 @@ class AirfoilGUI:
         params_frame.pack(fill="x", pady=(0, 15))
         self.create_parameter_input(params_frame, "Angle of attack [°]:", self.angle_of_attack, (-20, 30))
         self.create_parameter_input(params_frame, "Air speed [m/s]:", self.air_speed, (1, 200))
+        self.create_parameter_input(params_frame, "Altitude (ISA) [m]:", self.altitude, (MIN_ALTITUDE, MAX_ALTITUDE))
         self.create_parameter_input(params_frame, "Air density [kg/m³]:", self.air_density, (0.1, 5.0))
         self.create_parameter_input(params_frame, "Wing area [m²]:", self.wing_area, (0.1, 1000))
+        ttk.Label(params_frame, text="Interpolation:", style="Card.TLabel").pack(anchor="w", pady=(0, 2))
+        ttk.Combobox(params_frame, textvariable=self.interpolation, values=INTERPOLATION_METHODS, state="readonly").pack(fill="x", pady=(0, 8))
+
+        self.create_live_panel(control_frame)
 
         analyze_btn = ttk.Button(control_frame, text="🔬 ANALYZE", command=self.perform_analysis, style="Action.TButton")
         analyze_btn.pack(fill="x", pady=(10, 5))
 
+    def create_live_panel(self, parent):
+        live_frame = ttk.LabelFrame(parent, text="Live Mode", style="Card.TLabelframe", padding=10)
+        live_frame.pack(fill="x", pady=(0, 15))
+        ttk.Checkbutton(live_frame, text="Update while dragging", variable=self.live_mode, command=self.toggle_live_mode).pack(anchor="w")
+
+        self.live_sliders = ttk.Frame(live_frame)
+        for label, variable, limits in (("Angle of attack [°]", self.angle_of_attack, (-10, 20)),
+                                        ("Air speed [m/s]", self.air_speed, (1, 200)),
+                                        ("Air density [kg/m³]", self.air_density, (0.1, 5.0))):
+            ttk.Label(self.live_sliders, text=label, style="Card.TLabel").pack(anchor="w")
+            ttk.Scale(self.live_sliders, from_=limits[0], to=limits[1], variable=variable, orient="horizontal").pack(fill="x", pady=(0, 6))
+
+    def toggle_live_mode(self):
+        if self.live_mode.get():
+            self.live_sliders.pack(fill="x", pady=(8, 0))
+            self.live_throttle.trigger()
+        else:
+            self.live_throttle.cancel()
+            self.live_sliders.pack_forget()
+
+    def live_update(self):
+        """Analyze the current inputs on the Tk thread and move the operating point"""
+        if not self.validate_all_inputs():
+            return
+        try:
+            results = analyze_airfoil(self.angle_of_attack.get(), self.air_speed.get(), self.air_density.get(),
+                                      self.wing_area.get(), self.selected_profile.get(), self.profiles,
+                                      kinematic_viscosity=self.kinematic_viscosity(), method=self.interpolation.get())
+        except ValueError as e:
+            self.status_label.config(text=str(e))
+            return
+        self.on_analysis_done(results)
+
     def create_parameter_input(self, parent, label, variable, limits):
         ttk.Label(parent, text=label, style="Card.TLabel").pack(anchor="w", pady=(0, 2))
         entry = ttk.Entry(parent, textvariable=variable)
@@ -134,21 +210,13 @@ class AirfoilGUI:
 
         ttk.Label(chart_frame, text="Aerodynamic Characteristics", font=("Segoe UI", 14, "bold"), style="Card.TLabel").grid(row=0, column=0, sticky="w", pady=(0, 15))
 
-        plot_container = ttk.Frame(chart_frame)
-        plot_container.grid(row=1, column=0, sticky="nsew")
-        plot_container.grid_rowconfigure(0, weight=1)
-        plot_container.grid_columnconfigure(0, weight=1)
-
-        self.figure = Figure(figsize=(7, 5), dpi=100, facecolor=self.colors["background"])
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor(self.colors["background"])
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_container)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-
-        toolbar_frame = ttk.Frame(plot_container)
-        toolbar_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
-        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        self.toolbar.update()
+        self.plot_container = ttk.Frame(chart_frame)
+        self.plot_container.grid(row=1, column=0, sticky="nsew")
+        self.plot_container.grid_rowconfigure(0, weight=1)
+        self.plot_container.grid_columnconfigure(0, weight=1)
+        self.figure = None
+        self.chart_placeholder = ttk.Label(self.plot_container, text="Loading chart...", style="Card.TLabel", foreground=self.colors["text_light"])
+        self.chart_placeholder.grid(row=0, column=0)
 
         bottom_btn_frame = ttk.Frame(chart_frame)
         bottom_btn_frame.grid(row=3, column=0, sticky="ew", pady=(10, 0))
@@ -159,26 +227,52 @@ class AirfoilGUI:
         compare_btn = ttk.Button(bottom_btn_frame, text="Comparision mode", command=self.open_comparison_window, style="Action.TButton")
         compare_btn.pack(side="left", padx=5)
 
+        performance_btn = ttk.Button(bottom_btn_frame, text="Performance", command=self.open_performance_window, style="Secondary.TButton")
+        performance_btn.pack(side="left", padx=5)
+
+        self.cancel_btn = ttk.Button(bottom_btn_frame, text="Cancel", command=self.cancel_background_work, style="Secondary.TButton")
+        self.progress = ttk.Progressbar(bottom_btn_frame, mode="indeterminate", length=160)
+
         self.status_label = ttk.Label(chart_frame, text="Select parameters and click 'ANALYZE'", style="Card.TLabel", foreground=self.colors["text_light"], font=("Segoe UI", 9, "italic"))
         self.status_label.grid(row=2, column=0, sticky="w", pady=(15, 0))
 
-        self.plot_initial_data()
+        # Matplotlib is the slowest import of the application, so the chart is
+        # only built once the window has been shown
+        self.root.after_idle(lambda: self.root.after(0, self.init_chart))
+
+    def init_chart(self):
+        """Create the Matplotlib figure; deferred until after the first paint"""
+        if self.figure is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+
+        self.chart_placeholder.destroy()
+        self.figure = Figure(figsize=(7, 5), dpi=100, facecolor=self.colors["background"])
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor(self.colors["background"])
+        self.canvas = FigureCanvasTkAgg(self.figure, self.plot_container)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+
+        toolbar_frame = ttk.Frame(self.plot_container)
+        toolbar_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        self.toolbar.update()
+        self.chart = ProfileChart(self.ax, self.canvas, self.colors)
+
+        if self.last_results is not None:
+            self.update_plot_with_results(self.last_results)
+        else:
+            self.plot_initial_data()
+
     def plot_initial_data(self):
+        if self.figure is None:
+            return
         profile = self.selected_profile.get()
-        data = naca_data[profile]
-        self.ax.clear()
-        self.ax.set_title(f"Profile: {profile}", fontsize=12, pad=15, color=self.colors["text"])
-        self.ax.set_xlabel("Angle of attack [°]", fontsize=11, color=self.colors["text"])
-        self.ax.set_ylabel("Coefficient", fontsize=11, color=self.colors["text"])
-        self.ax.tick_params(colors=self.colors["text"])
-        self.ax.grid(True, linestyle='--', alpha=0.4)
-        self.ax.plot(data["alpha"], data["CL"], 'o-', color=self.colors["primary"], label="CL", linewidth=2)
-        self.ax.plot(data["alpha"], data["CD"], 's-', color=self.colors["secondary"], label="CD", linewidth=2)
-        self.ax.legend()
-        self.canvas.draw()
+        self.chart.show_profile(profile, self.profiles[profile])
 
     def update_profile_description(self):
-        desc = profile_info.get(self.selected_profile.get(), "No description available")
+        desc = self.profiles.describe(self.selected_profile.get())
         self.profile_desc.config(text=desc)
 
     def on_profile_change(self, event=None):
@@ -196,16 +290,35 @@ class AirfoilGUI:
 
     def perform_analysis(self):
         if not self.validate_all_inputs(): return
-        try:
-            results = analyze_airfoil(alpha=self.angle_of_attack.get(), V=self.air_speed.get(), rho=self.air_density.get(), S=self.wing_area.get(), profile_name=self.selected_profile.get(), profiles_data=naca_data)
-            self.last_results = results
-            self.update_plot_with_results(results)
-            self.status_label.config(text=f"✅ L/D: {results['L_D_ratio']:.2f}, Lift: {results['lift']:.1f} N")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        params = dict(alpha=self.angle_of_attack.get(), V=self.air_speed.get(), rho=self.air_density.get(), S=self.wing_area.get(), profile_name=self.selected_profile.get(), profiles_data=self.profiles, kinematic_viscosity=self.kinematic_viscosity(), method=self.interpolation.get())
+        self.status_label.config(text="Analyzing...")
+        self.runner.submit("analysis", lambda job: self.analysis_cache.analyze(**params), on_done=self.on_analysis_done, on_error=self.on_background_error)
+
+    def on_analysis_done(self, results):
+        self.last_results = results
+        self.update_plot_with_results(results)
+        self.status_label.config(text=f"✅ L/D: {results['L_D_ratio']:.2f}, Lift: {results['lift']:.1f} N")
+
+    def on_background_error(self, error):
+        self.status_label.config(text="")
+        messagebox.showerror("Error", str(error))
+
+    def on_busy_changed(self, busy):
+        if busy:
+            self.cancel_btn.pack(side="right", padx=5)
+            self.progress.pack(side="right", padx=5)
+            self.progress.start(15)
+        else:
+            self.progress.stop()
+            self.progress.pack_forget()
+            self.cancel_btn.pack_forget()
+
+    def cancel_background_work(self):
+        self.runner.cancel_all()
+        self.status_label.config(text="Cancelled")
 
     def validate_all_inputs(self):
-        limits = [(self.angle_of_attack, (-10, 20)), (self.air_speed, (1, 200)), (self.air_density, (0.1, 5.0)), (self.wing_area, (0.1, 1000))]
+        limits = [(self.angle_of_attack, (-10, 20)), (self.air_speed, (1, 200)), (self.air_density, (0.1, 5.0)), (self.wing_area, (0.1, 1000)), (self.altitude, (MIN_ALTITUDE, MAX_ALTITUDE))]
         for var, rng in limits:
             try:
                 val = var.get()
@@ -214,41 +327,63 @@ class AirfoilGUI:
         return True
 
     def update_plot_with_results(self, results):
-        profile = results["profile"]
-        data = naca_data[profile]
-        self.ax.clear()
-        self.ax.set_title(f"Analysis: {profile}", fontsize=12, pad=15, color=self.colors["text"])
-        self.ax.set_xlabel("Angle of attack [°]", fontsize=11, color=self.colors["text"])
-        self.ax.set_ylabel("Coefficient", fontsize=11, color=self.colors["text"])
-        self.ax.tick_params(colors=self.colors["text"])
-        self.ax.grid(True, linestyle='--', alpha=0.4)
-        self.ax.plot(data["alpha"], data["CL"], 'o-', color=self.colors["primary"], label="CL", linewidth=2)
-        self.ax.plot(data["alpha"], data["CD"], 's-', color=self.colors["secondary"], label="CD", linewidth=2)
-        self.ax.scatter([results["alpha"]], [results["CL"]], s=100, color='red', marker='o', label=f"CL={results['CL']:.3f}")
-        self.ax.scatter([results["alpha"]], [results["CD"]], s=100, color='red', marker='s')
-        self.ax.text(0.02, 0.98, f"Lift: {results['lift']:.1f} N\nDrag: {results['drag']:.1f} N\nL/D: {results['L_D_ratio']:.2f}", transform=self.ax.transAxes, fontsize=10, verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.9))
-        self.ax.legend()
-        self.canvas.draw()
+        if self.figure is None:
+            return
+        self.chart.show_results(results, self.profiles[results["profile"]])
 
     def reset_parameters(self):
-        self.selected_profile.set(list(naca_data.keys())[0])
+        self.selected_profile.set(next(iter(self.profiles)))
         self.angle_of_attack.set(5.0)
         self.air_speed.set(25.0)
+        self.altitude.set(0.0)
         self.air_density.set(1.225)
         self.wing_area.set(12.0)
+        self.interpolation.set("linear")
         self.update_profile_description()
         self.plot_initial_data()
         self.status_label.config(text="Parameters reset")
 
     def add_custom_profile(self):
-        success, result = self.profile_manager.load_profile_from_file()
+        filepath = self.profile_manager.ask_profile_path()
+        if not filepath:
+            return
+        self.status_label.config(text=f"Loading {filepath}...")
+        self.runner.submit("import", lambda job: self.profile_manager.parse_profile_file(filepath), on_done=lambda parsed: self.on_profile_parsed(filepath, parsed), on_error=self.on_background_error)
+
+    def on_profile_parsed(self, filepath, parsed):
+        success, result = parsed
         if success:
+            success, result = self.profile_manager.add_parsed_profile(filepath, result)
+        self.on_profile_added(success, result)
+
+    def generate_naca_profile(self):
+        designation = simpledialog.askstring("Generate NACA", "NACA 4- or 5-digit designation (e.g. 4415, 23012):", parent=self.root)
+        if not designation:
+            return
+        try:
+            parse_designation(designation)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.status_label.config(text=f"Generating NACA {designation}...")
+        self.runner.submit("generate", lambda job: generate_polar(designation, should_stop=job.should_stop), on_done=lambda polar: self.on_profile_added(*self.profile_manager.add_generated_profile(designation, polar)), on_error=self.on_background_error)
+
+    def on_profile_added(self, success, result):
+        if success:
+            self.profile_combo.config(values=list(self.profiles.keys()))
             self.selected_profile.set(result)
             self.update_profile_description()
             self.plot_initial_data()
+            self.status_label.config(text=f"Profile '{result}' added")
             messagebox.showinfo("Success", f"Profile '{result}' added.")
         else:
+            self.status_label.config(text="")
             messagebox.showerror("Error", result)
 
     def open_comparison_window(self):
-        ProfileComparisonWindow(self.root, naca_data, profile_info, self.colors)
+        from gui.compare_profiles import ProfileComparisonWindow
+        ProfileComparisonWindow(self.root, self.profiles, profile_info, self.colors)
+
+    def open_performance_window(self):
+        from gui.performance import PerformanceWindow
+        PerformanceWindow(self.root, self.colors)
@@ -0,0 +1,131 @@
+import tkinter as tk
+from tkinter import Toplevel, ttk, filedialog, messagebox
+
+from calculations import instrumentation
+
+# Table refresh period while the window is open [ms]
+REFRESH_MS = 1000
+
+COLUMNS = (("operation", "Operation", 220), ("count", "Calls", 70), ("mean", "Mean [ms]", 85),
+           ("p50", "p50 [ms]", 80), ("p90", "p90 [ms]", 80), ("p99", "p99 [ms]", 80),
+           ("max", "Max [ms]", 85), ("total", "Total [s]", 80))
+
+
+def format_duration(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+class PerformanceWindow:
+    """Live view of the instrumentation counters, with recording switch and JSON export"""
+
+    def __init__(self, master, colors):
+        self.master = master
+        self.colors = colors
+
+        self.top = Toplevel(master)
+        self.top.title("Performance")
+        self.top.configure(bg=self.colors["background"])
+        self.top.geometry("860x520")
+
+        self.recording = tk.BooleanVar(value=instrumentation.is_enabled())
+        self.stats = {}
+        self.message = ""
+        self._refresh_job = None
+
+        self.setup_ui()
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def close(self):
+        if self._refresh_job is not None:
+            self.top.after_cancel(self._refresh_job)
+        self.top.destroy()
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.top, style="Card.TFrame", padding=10)
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(1, weight=1)
+
+        toolbar = ttk.Frame(main_frame, style="Card.TFrame")
+        toolbar.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        ttk.Checkbutton(toolbar, text="Record timings", variable=self.recording, command=self.toggle_recording).pack(side="left")
+        ttk.Button(toolbar, text="Save JSON...", command=self.save_json, style="Accent.TButton").pack(side="right", padx=5)
+        ttk.Button(toolbar, text="Reset", command=self.reset, style="Secondary.TButton").pack(side="right", padx=5)
+
+        self.table = ttk.Treeview(main_frame, columns=[key for key, _, _ in COLUMNS], show="headings", height=10)
+        for key, heading, width in COLUMNS:
+            self.table.heading(key, text=heading)
+            self.table.column(key, width=width, anchor="w" if key == "operation" else "e")
+        self.table.grid(row=1, column=0, sticky="nsew")
+        self.table.bind("<<TreeviewSelect>>", lambda e: self.show_histogram())
+
+        ttk.Label(main_frame, text="Latency histogram (select an operation):", style="Card.TLabel").grid(row=2, column=0, sticky="w", pady=(10, 2))
+        self.histogram = tk.Text(main_frame, height=9, font=("Consolas", 9), bg=self.colors["background"],
+                                 fg=self.colors["text"], relief="flat", state="disabled")
+        self.histogram.grid(row=3, column=0, sticky="ew")
+
+        self.status_label = ttk.Label(main_frame, text="", style="Card.TLabel", foreground=self.colors["text_light"])
+        self.status_label.grid(row=4, column=0, sticky="w", pady=(8, 0))
+
+    def toggle_recording(self):
+        if self.recording.get():
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        self.refresh()
+
+    def reset(self):
+        instrumentation.reset()
+        self.refresh()
+
+    def refresh(self):
+        """Update the table from the counters and schedule the next refresh"""
+        if self._refresh_job is not None:
+            self.top.after_cancel(self._refresh_job)
+        self.stats = instrumentation.snapshot()
+        selected = self.table.selection()
+        self.table.delete(*self.table.get_children())
+        for name, stat in self.stats.items():
+            self.table.insert("", "end", iid=name, values=(
+                name, stat["count"], *(f"{stat[key] * 1e3:.3f}" for key in ("mean", "p50", "p90", "p99", "max")),
+                f"{stat['total']:.3f}"))
+        kept = [iid for iid in selected if iid in self.stats]
+        if kept:
+            self.table.selection_set(kept)
+        self.show_histogram()
+
+        state = "recording" if instrumentation.is_enabled() else "not recording"
+        text = f"{len(self.stats)} operations, {state} (set {instrumentation.ENV_VARIABLE}=1 to record from startup)"
+        self.status_label.config(text=f"{text} - {self.message}" if self.message else text)
+        self._refresh_job = self.top.after(REFRESH_MS, self.refresh)
+
+    def show_histogram(self):
+        selected = self.table.selection()
+        lines = []
+        if selected and selected[0] in self.stats:
+            histogram = self.stats[selected[0]]["histogram"]
+            peak = max(histogram.values())
+            for bound, count in histogram.items():
+                bar = "█" * max(1, round(30 * count / peak))
+                lines.append(f"< {format_duration(float(bound)):>9}  {bar} {count}")
+        self.histogram.config(state="normal")
+        self.histogram.delete("1.0", "end")
+        self.histogram.insert("1.0", "\n".join(lines))
+        self.histogram.config(state="disabled")
+
+    def save_json(self):
+        path = filedialog.asksaveasfilename(parent=self.top, title="Save performance report", defaultextension=".json",
+                                            filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            instrumentation.dump(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save the report: {e}", parent=self.top)
+            return
+        self.message = f"saved to {path}"
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
 import sys
 import os
 
@@ -9,16 +8,20 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from gui.gui import AirfoilGUI
 
+def set_window_icon(root):
+    # PIL is only needed for the icon, so it is loaded after the window is up
+    from PIL import Image, ImageTk
+    ico = Image.open('gui/ikona.png')
+    root.icon_photo = ImageTk.PhotoImage(ico)
+    root.wm_iconphoto(False, root.icon_photo)
+
 def main():
     try:
         root = tk.Tk()
         
         
-        ico = Image.open('gui/ikona.png')
-        photo = ImageTk.PhotoImage(ico)
-        root.wm_iconphoto(False, photo)
-        
         app = AirfoilGUI(root)
+        root.after_idle(set_window_icon, root)
         root.mainloop()
         
     except Exception as e:
@@ -29,4 +32,4 @@ def main():
 
 if __name__ == "__main__":
     exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(exit_code)
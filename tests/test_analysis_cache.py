@@ -0,0 +1,42 @@
+import sys
+import os
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.analysis_cache import AnalysisCache
+
+data = {
+    "NACA0012": {
+        "alpha": [-5, 0, 5, 10],
+        "CL": [-0.5, 0.0, 0.5, 1.0],
+        "CD": [0.05, 0.02, 0.03, 0.07]
+    }
+}
+
+def test_cache_hits_and_eviction():
+    cache = AnalysisCache(maxsize=2)
+    first = cache.analyze(2.5, 30, 1.2, 10, "NACA0012", data)
+    assert first == ac.analyze_airfoil(2.5, 30, 1.2, 10, "NACA0012", data)
+    cache.analyze(2.5, 30, 1.2, 10, "NACA0012", data)
+    cache.analyze(3.0, 30, 1.2, 10, "NACA0012", data)
+    cache.analyze(4.0, 30, 1.2, 10, "NACA0012", data)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 3, 1, 2)
+
+def test_cache_quantization_and_invalidation():
+    cache = AnalysisCache(quantum={"alpha": 0.01, "V": 0.1})
+    cache.analyze(2.501, 30, 1.2249, 10, "NACA0012", data)
+    results = cache.analyze(2.499, 30.02, 1.2249, 10, "NACA0012", data)
+    assert cache.stats()["hits"] == 1
+    # Results carry the snapped inputs; inputs without a step are kept as given
+    assert (results["alpha"], results["velocity"], results["density"]) == (2.5, 30.0, 1.2249)
+    cache.analyze(2.5, 30, 1.2248, 10, "NACA0012", data)
+    assert cache.stats()["misses"] == 2
+    cache.profile_changed("NACA0012")
+    assert cache.stats()["size"] == 0
+
+def test_cache_rejects_invalid_quanta():
+    for quantum in ({"alpha": 0.0}, {"beta": 0.1}):
+        with pytest.raises(ValueError):
+            AnalysisCache(quantum=quantum)
@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations import batch
+from calculations.atmosphere import isa, flight_envelope
+from calculations.polar_table import get_polar_table
+from calculations.naca_data import naca_data
+
+reynolds_data = {
+    "RE": {
+        "alpha": [0.0, 5.0, 10.0, 15.0],
+        "Re": [1e5, 1e6],
+        "CL": [[0.1, 0.6, 1.0, 0.8], [0.0, 0.5, 1.0, 1.3]],
+        "CD": [[0.02, 0.03, 0.06, 0.12], [0.006, 0.01, 0.02, 0.05]]
+    }
+}
+
+def test_isa_standard_values():
+    atmosphere = isa([0.0, 11000.0, 20000.0])
+    np.testing.assert_allclose(atmosphere["temperature"], [288.15, 216.65, 216.65])
+    np.testing.assert_allclose(atmosphere["density"], [1.225, 0.3639, 0.08803], rtol=1e-3)
+    assert atmosphere["speed_of_sound"][0] == pytest.approx(340.29, abs=0.01)
+    assert atmosphere["kinematic_viscosity"][0] == pytest.approx(1.461e-5, rel=1e-3)
+    with pytest.raises(ValueError):
+        isa(40000.0)
+
+def test_max_lift_follows_reynolds_number():
+    table = get_polar_table("RE", reynolds_data)
+    Re = np.geomspace(1e4, 1e7, 200)
+    brute = [table.evaluate(np.linspace(0, 15, 3001), r)[0].max() for r in Re]
+    np.testing.assert_allclose(table.max_lift(Re), brute, atol=1e-12)
+    assert get_polar_table("NACA 2412", naca_data).max_lift(Re).shape == Re.shape
+
+def test_flight_envelope_maps():
+    altitudes = np.linspace(0, 10000, 50)
+    speeds = np.linspace(10, 80, 70)
+    envelope = flight_envelope("RE", reynolds_data, altitudes, speeds, S=12.0, weight=8000.0, chord=0.1)
+    assert envelope["max_lift"].shape == (50, 70)
+
+    # At the stall speed the maximum lift equals the weight
+    i, j = 20, 40
+    CL_max = envelope["CL_max"][i, j]
+    rho = isa(altitudes[i])["density"]
+    assert 0.5 * rho * envelope["stall_speed"][i, j]**2 * 12.0 * CL_max == pytest.approx(8000.0)
+    np.testing.assert_array_equal(envelope["can_fly"], envelope["max_load_factor"] >= 1 - 1e-12)
+    # Thinner air needs more speed
+    assert envelope["stall_speed"][-1, -1] > envelope["stall_speed"][0, -1]
+
+def test_batch_altitude_column(tmp_path):
+    conditions = np.column_stack((np.full(4, 5.0), np.full(4, 30.0), np.full(4, 10.0), [0, 2000, 5000, 9000]))
+    src = tmp_path / "conditions.csv"
+    np.savetxt(src, conditions, delimiter=",", header="alpha,V,S,altitude", comments="")
+    out = tmp_path / "results.npy"
+
+    assert batch.run_batch("RE", str(src), str(out), profiles_data=reynolds_data) == 4
+    results = np.load(out)
+    atmosphere = isa(conditions[:, 3])
+    np.testing.assert_allclose(results[:, batch.RESULT_COLUMNS.index("density")], atmosphere["density"])
+    expected = ac.analyze_airfoil_batch(5.0, 30.0, atmosphere["density"], 10.0, "RE", reynolds_data,
+                                        kinematic_viscosity=atmosphere["kinematic_viscosity"])
+    np.testing.assert_allclose(results[:, batch.RESULT_COLUMNS.index("reynolds_number")], expected["reynolds_number"])
+    np.testing.assert_allclose(results[:, batch.RESULT_COLUMNS.index("CL")], expected["CL"])
@@ -0,0 +1,100 @@
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gui.background import BackgroundRunner, Throttle
+
+class FakeRoot:
+    """Stands in for Tk: `after` callbacks run when `pump` is called"""
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def pump(self, timeout=2.0):
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.005)
+
+def test_newer_job_supersedes_stale_one():
+    root = FakeRoot()
+    runner = BackgroundRunner(root)
+    release = threading.Event()
+    results = []
+
+    def slow(job):
+        release.wait(1)
+        return "stale"
+
+    runner.submit("analysis", slow, on_done=results.append)
+    runner.submit("analysis", lambda job: "fresh", on_done=results.append)
+    release.set()
+    root.pump()
+    assert results == ["fresh"]
+    assert not runner.busy()
+    runner.shutdown()
+
+def test_errors_and_progress_reach_the_loop():
+    root = FakeRoot()
+    runner = BackgroundRunner(root)
+    progress, errors = [], []
+
+    def failing(job):
+        job.report_progress(0.5)
+        raise ValueError("boom")
+
+    runner.submit("import", failing, on_error=errors.append, on_progress=progress.append)
+    root.pump()
+    assert progress == [0.5]
+    assert str(errors[0]) == "boom"
+    runner.shutdown()
+
+def test_throttle_coalesces_calls_to_latest_arguments():
+    root = FakeRoot()
+    calls = []
+    throttle = Throttle(root, calls.append)
+
+    for value in range(10):
+        throttle.trigger(value)
+    assert len(root.pending) == 1
+    root.pump()
+    assert calls == [9]
+
+    throttle.trigger(10)
+    throttle.cancel()
+    root.pump()
+    assert calls == [9]
+
+def test_cancelled_jobs_stop_at_their_next_check():
+    root = FakeRoot()
+    runner = BackgroundRunner(root, max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    steps, results = [], []
+
+    def long_running(job):
+        started.set()
+        release.wait(1)
+        for step in range(100):
+            job.check()
+            steps.append(step)
+        return "stale"
+
+    def never_started(job):
+        steps.append("queued")
+
+    runner.submit("compare", long_running, on_done=results.append)
+    started.wait(1)
+    runner.submit("analysis", never_started)
+    runner.cancel("analysis")  # Cancelled while queued behind the first job
+    runner.submit("compare", lambda job: "fresh", on_done=results.append)
+    release.set()
+    root.pump()
+    assert results == ["fresh"]
+    assert steps == []
+    runner.shutdown()
@@ -0,0 +1,39 @@
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations import batch
+from calculations.naca_data import naca_data
+
+def _conditions(n):
+    rng = np.random.default_rng(0)
+    return np.column_stack((rng.uniform(-10, 20, n), rng.uniform(5, 80, n),
+                            rng.uniform(0.8, 1.3, n), rng.uniform(1, 20, n)))
+
+def test_batch_csv_to_npy_in_chunks(tmp_path):
+    conditions = _conditions(2500)
+    src = tmp_path / "conditions.csv"
+    np.savetxt(src, conditions, delimiter=",", header="alpha,V,rho,S", comments="")
+    out = tmp_path / "results.npy"
+
+    rows = batch.run_batch("NACA 2412", str(src), str(out), profiles_data=naca_data, chunk_size=1000)
+    assert rows == 2500
+
+    results = np.load(out)
+    expected = ac.analyze_airfoil_batch(*conditions.T, "NACA 2412", naca_data)
+    assert results.shape == (2500, len(batch.RESULT_COLUMNS))
+    np.testing.assert_allclose(results[:, batch.RESULT_COLUMNS.index("lift")], expected["lift"])
+
+def test_batch_cli_with_polar_file(tmp_path):
+    src = tmp_path / "conditions.npy"
+    np.save(src, _conditions(10)[:, :1])
+    polar = os.path.join(os.path.dirname(__file__), '..', 'test_profile2.csv')
+    out = tmp_path / "results.csv"
+
+    code = batch.main([polar, str(src), str(out), "--velocity", "30", "--density", "1.2",
+                       "--wing-area", "10", "--quiet"])
+    assert code == 0
+    results = np.loadtxt(out, delimiter=",", skiprows=1)
+    assert results.shape == (10, len(batch.RESULT_COLUMNS))
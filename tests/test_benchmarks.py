@@ -0,0 +1,28 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+import run_benchmarks
+
+
+def test_quick_suite_writes_json_and_flags_regressions(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    assert run_benchmarks.main(["--quick", "--filter", "analysis.batch", "--output", str(baseline)]) == 0
+    report = json.loads(baseline.read_text())
+    assert set(report["benchmarks"]) == {"analysis.batch", "analysis.batch_large"}
+    assert report["metadata"]["quick"] is True
+
+    # Pretend the baseline was ten times faster
+    for result in report["benchmarks"].values():
+        result["median"] /= 10
+    baseline.write_text(json.dumps(report))
+    assert run_benchmarks.main(["--quick", "--filter", "analysis.batch", "--compare", str(baseline)]) == 1
+
+
+def test_compare_results_statuses():
+    baseline = {"a": {"median": 1.0}, "b": {"median": 1.0}, "c": {"median": 1.0}}
+    current = {"a": {"median": 1.1}, "b": {"median": 2.0}, "c": {"median": 0.5}, "new": {"median": 1.0}}
+    rows = {row[0]: row[4] for row in run_benchmarks.compare_results(current, baseline, threshold=0.25)}
+    assert rows == {"a": "ok", "b": "regression", "c": "improvement"}
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -27,3 +28,167 @@ def test_reynolds():
     Re = ac.calculate_reynolds_number(velocity=30, chord=1)
     assert isinstance(Re, float)
     assert Re > 0
+
+def test_analyze_batch_matches_scalar():
+    alphas = [-5, 1.5, 7.0]
+    batch = ac.analyze_airfoil_batch(alphas, 30.0, 1.2, 10.0, "NACA0012", dummy_data)
+    for i, a in enumerate(alphas):
+        single = ac.analyze_airfoil(a, 30.0, 1.2, 10.0, "NACA0012", dummy_data)
+        for key in ("CL", "CD", "lift", "drag", "L_D_ratio", "reynolds_number", "dynamic_pressure"):
+            assert batch[key][i] == pytest.approx(single[key])
+
+def test_analyze_batch_broadcast_and_validation():
+    batch = ac.analyze_airfoil_batch([[0.0], [5.0]], [10.0, 20.0, 30.0], 1.2, 10.0, "NACA0012", dummy_data)
+    assert batch["lift"].shape == (2, 3)
+    with pytest.raises(ValueError):
+        ac.analyze_airfoil_batch(0.0, [10.0, 0.0], 1.2, 10.0, "NACA0012", dummy_data)
+
+def test_polar_table_matches_np_interp():
+    from calculations.polar_table import PolarTable
+    data = dummy_data["NACA0012"]
+    table = PolarTable.from_profile(data)
+    angles = np.array([-20.0, -5.0, -1.2, 0.0, 3.3, 9.99, 10.0, 40.0])
+    cl, cd = table.evaluate(angles)
+    np.testing.assert_allclose(cl, np.interp(angles, data["alpha"], data["CL"]))
+    np.testing.assert_allclose(cd, np.interp(angles, data["alpha"], data["CD"]))
+    for a in angles:
+        assert table.evaluate(a) == pytest.approx((np.interp(a, data["alpha"], data["CL"]),
+                                                   np.interp(a, data["alpha"], data["CD"])))
+
+def test_nan_angle_gives_nan_like_np_interp():
+    for options in ({}, {"resolution": 0.5}, {"method": "pchip"}, {"method": "spline"}):
+        CL, CD = ac.interpolate_coefficients("NACA0012", float("nan"), dummy_data, **options)
+        assert np.isnan(CL) and np.isnan(CD)
+        CL, CD = ac.interpolate_coefficients("NACA0012", np.array([np.nan, 2.5]), dummy_data, **options)
+        assert np.isnan(CL[0]) and CL[1] == pytest.approx(0.25)
+
+def test_uniform_polar_table_error_bound():
+    from calculations.polar_table import get_polar_table
+    exact = get_polar_table("NACA0012", dummy_data)
+    coarse = get_polar_table("NACA0012", dummy_data, resolution=3.0)
+    fine = get_polar_table("NACA0012", dummy_data, resolution=0.01)
+    assert coarse.max_error["CD"] > 0
+    # Grid nodes line up with every source point, so the fine table is exact
+    assert fine.max_error["CL"] < 1e-12 and fine.max_error["CD"] < 1e-12
+    angles = np.linspace(-8, 13, 101)
+    for a in (-8.0, 2.5, 13.0):
+        assert fine.evaluate(a) == pytest.approx(exact.evaluate(a))
+    np.testing.assert_allclose(coarse.evaluate(angles)[1], exact.evaluate(angles)[1],
+                               atol=coarse.max_error["CD"] + 1e-12)
+
+def test_resampled_tables_are_bounded():
+    from calculations import polar_table
+    with pytest.raises(ValueError):
+        polar_table.get_polar_table("NACA0012", dummy_data, resolution=1e-9)
+    for i in range(polar_table.MAX_RESAMPLED_TABLES + 10):
+        polar_table.get_polar_table("NACA0012", dummy_data, resolution=0.1 + i * 1e-3)
+    assert len(polar_table._resampled_tables) == polar_table.MAX_RESAMPLED_TABLES
+
+def test_table_caches_are_thread_safe():
+    import threading
+    from calculations import polar_table
+    data = {name: dict(dummy_data["NACA0012"]) for name in ("A", "B")}
+    errors = []
+
+    def lookups(options):
+        try:
+            for i in range(300):
+                polar_table.get_polar_table("A" if i % 2 else "B", data, **options)
+        except Exception as e:
+            errors.append(e)
+
+    def replacements():
+        try:
+            for _ in range(300):
+                polar_table.register_polar("A", data["A"])
+                polar_table.unregister_polar("B")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookups, args=(options,))
+               for options in ({"resolution": 0.5}, {"resolution": 0.25}, {"method": "pchip"})]
+    threads.append(threading.Thread(target=replacements))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    # A replaced profile never gets a table built from its old data
+    data["A"] = {"alpha": [0.0, 10.0], "CL": [0.0, 2.0], "CD": [0.01, 0.02]}
+    assert polar_table.get_polar_table("A", data, method="spline").evaluate(5.0)[0] == pytest.approx(1.0)
+
+reynolds_data = {
+    "RE": {
+        "alpha": [-5.0, 0.0, 5.0, 10.0],
+        "Re": [1e5, 1e6],
+        "CL": [[-0.4, 0.1, 0.6, 0.9], [-0.5, 0.0, 0.5, 1.0]],
+        "CD": [[0.03, 0.02, 0.03, 0.06], [0.01, 0.006, 0.01, 0.02]]
+    }
+}
+
+def test_reynolds_table_interpolates_in_alpha_and_log_re():
+    from calculations.polar_table import get_polar_table
+    table = get_polar_table("RE", reynolds_data)
+    assert table.evaluate(5.0, 1e5) == pytest.approx((0.6, 0.03))
+    assert table.evaluate(5.0, 1e7) == pytest.approx((0.5, 0.01))  # clamped to the last polar
+    # Halfway between the polars in log(Re), a quarter into the alpha segment
+    CL, CD = table.evaluate(1.25, np.sqrt(1e5 * 1e6))
+    assert CL == pytest.approx(0.5 * (0.225 + 0.125))
+    assert CD == pytest.approx(0.5 * (0.0225 + 0.007))
+
+def test_reynolds_table_nan_angle():
+    CL, CD = ac.interpolate_coefficients("RE", float("nan"), reynolds_data, reynolds=1e5)
+    assert np.isnan(CL) and np.isnan(CD)
+
+def test_analysis_uses_reynolds_number_of_each_condition():
+    V = np.array([1.48, 14.8, 148.0])  # Re = 1e5, 1e6, 1e7 at 1 m chord
+    batch = ac.analyze_airfoil_batch(5.0, V, 1.225, 10.0, "RE", reynolds_data)
+    np.testing.assert_allclose(batch["CL"], [0.6, 0.5, 0.5])
+    for i, v in enumerate(V):
+        scalar = ac.analyze_airfoil(5.0, v, 1.225, 10.0, "RE", reynolds_data)
+        assert scalar["CD"] == pytest.approx(batch["CD"][i])
+    # A smaller chord lowers Re and moves towards the low-Re polar
+    assert ac.analyze_airfoil(5.0, 14.8, 1.225, 10.0, "RE", reynolds_data, chord=0.1)["CL"] == pytest.approx(0.6)
+
+def test_stall_angle_of_reynolds_profile():
+    assert ac.get_stall_angle("RE", reynolds_data) == 10.0
+    assert ac.get_stall_angle("NACA0012", dummy_data) == 10.0
+
+def test_smooth_interpolation_modes():
+    from calculations.polar_table import CubicPolarTable, get_polar_table
+    peak = {"PEAK": {"alpha": [0.0, 1.0, 2.0], "CL": [0.0, 1.0, 0.0], "CD": [0.01, 0.02, 0.04]}}
+    pchip = get_polar_table("PEAK", peak, method="pchip")
+    spline = get_polar_table("PEAK", peak, method="spline")
+    assert isinstance(pchip, CubicPolarTable) and get_polar_table("PEAK", peak, method="pchip") is pchip
+    # Hand-computed values: pchip keeps the peak at the node, the natural spline is C2
+    assert pchip.evaluate(0.5)[0] == pytest.approx(0.75)
+    assert spline.evaluate(0.5)[0] == pytest.approx(0.6875)
+    assert pchip.max_lift() == pytest.approx(1.0)
+
+    angles = np.array([-3.0, 0.0, 0.25, 1.0, 1.7, 2.0, 5.0])
+    for table in (pchip, spline):
+        cl, cd = table.evaluate(angles)
+        np.testing.assert_allclose(cl[[0, 1, 3, 5, 6]], [0.0, 0.0, 1.0, 0.0, 0.0])
+        for a, expected in zip(angles, zip(cl, cd)):
+            assert table.evaluate(a) == pytest.approx(expected)
+
+    with pytest.raises(ValueError):
+        get_polar_table("PEAK", peak, method="cubic")
+
+def test_smooth_modes_in_analysis():
+    from calculations.naca_data import naca_data
+    from calculations.polar_table import get_polar_table
+    alpha = np.linspace(-10, 20, 301)
+    table = get_polar_table("NACA 2412", naca_data)
+    pchip = ac.analyze_airfoil_batch(alpha, 25.0, 1.225, 12.0, "NACA 2412", naca_data, method="pchip")
+    # Monotone cubic never leaves the range of the two neighbouring points
+    i = table.segment_index(alpha)
+    CL = table.values[:, 0]
+    assert np.all(pchip["CL"] >= np.minimum(CL[i], CL[i + 1]) - 1e-12)
+    assert np.all(pchip["CL"] <= np.maximum(CL[i], CL[i + 1]) + 1e-12)
+    # The spline overshoots the tabulated stall peak; max_lift reports the true maximum
+    spline = get_polar_table("NACA 2412", naca_data, method="spline")
+    assert spline.max_lift() > table.max_lift()
+    assert spline.max_lift() == pytest.approx(spline.evaluate(np.linspace(-10, 20, 30001))[0].max(), abs=1e-6)
+    scalar = ac.analyze_airfoil(7.3, 25.0, 1.225, 12.0, "NACA 2412", naca_data, method="spline")
+    assert scalar["CL"] == pytest.approx(spline.evaluate(7.3)[0])
@@ -0,0 +1,53 @@
+import sys
+import os
+import numpy as np
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.characteristics import compute_characteristics
+from calculations.naca_data import naca_data, profile_info
+from calculations.optimum import find_optima
+from calculations.profile_manager import ProfileManager
+from calculations.profile_store import ProfileStore
+
+polar = {"alpha": [-5.0, 0.0, 5.0, 10.0], "CL": [-0.4, 0.1, 0.6, 0.5], "CD": [0.02, 0.01, 0.02, 0.05]}
+
+def test_characteristics_of_simple_polar():
+    values = compute_characteristics(polar["alpha"], polar["CL"], polar["CD"])
+    assert values["CL_max"] == 0.6 and values["stall_angle"] == 5.0
+    assert values["zero_lift_alpha"] == pytest.approx(-1.0)
+    assert values["lift_slope"] == pytest.approx(0.1)
+    assert values["CD0"] == pytest.approx(0.012)
+    assert values["CD_min"] == 0.01
+    assert values["L_D_max"] == pytest.approx(30.0) and values["alpha_L_D_max"] == 5.0
+
+    no_crossing = compute_characteristics([0.0, 5.0], [0.2, 0.6], [0.01, 0.02])
+    assert no_crossing["zero_lift_alpha"] is None and no_crossing["CD0"] is None
+
+def test_characteristics_agree_with_exact_optima():
+    optima = find_optima(list(naca_data), naca_data)
+    for name, data in naca_data.items():
+        values = compute_characteristics(data["alpha"], data["CL"], data["CD"])
+        assert values["L_D_max"] == pytest.approx(optima[name]["L_D_ratio"]["value"])
+        assert values["CL_max"] == optima[name]["CL_max"]["value"]
+
+def test_registry_indexes_characteristics_without_loading(tmp_path):
+    ProfileStore(str(tmp_path / "store")).append("STORED", polar, "")
+    manager = ProfileManager(naca_data, profile_info, str(tmp_path / "none.json"), str(tmp_path / "store"))
+    registry = manager.naca_data
+
+    assert registry.characteristics("STORED")["stall_angle"] == 5.0
+    assert not registry.is_loaded("STORED")
+    assert ac.get_stall_angle("STORED", registry) == 5.0
+
+    table = registry.characteristics_table()
+    assert list(table["profile"]) == list(registry)
+    strong = table[table["CL_max"] >= 1.5]["profile"]
+    assert set(strong) == {name for name, data in naca_data.items() if max(data["CL"]) >= 1.5}
+    assert np.isnan(table[table["profile"] == "STORED"]["zero_lift_alpha"]).sum() == 0
+
+    manager.remove_custom_profile("STORED")
+    assert "STORED" not in registry.characteristics_table()["profile"]
+    with pytest.raises(KeyError):
+        registry.characteristics("STORED")
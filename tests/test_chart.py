@@ -0,0 +1,86 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from calculations.aero_calculations import analyze_airfoil
+from calculations.naca_data import naca_data
+from gui.chart import ProfileChart
+
+COLORS = {"primary": "#1E3A8A", "secondary": "#10B981", "text": "#F1F5F9"}
+
+
+def make_chart():
+    figure = Figure(figsize=(4, 3), dpi=50)
+    canvas = FigureCanvasAgg(figure)
+    return ProfileChart(figure.add_subplot(111), canvas, COLORS)
+
+
+def analyze(alpha, profile="NACA 2412"):
+    return analyze_airfoil(alpha, 25.0, 1.225, 12.0, profile, naca_data)
+
+
+def test_chart_blits_when_only_operating_point_moves():
+    chart = make_chart()
+    chart.show_profile("NACA 2412", naca_data["NACA 2412"])
+    chart.show_results(analyze(2.0), naca_data["NACA 2412"])  # title changes: full redraw
+    draws = chart.full_draws
+
+    for alpha in (3.0, 4.0, 5.0):
+        chart.show_results(analyze(alpha), naca_data["NACA 2412"])
+
+    assert chart.full_draws == draws
+    assert chart.blits == 3
+    assert list(chart.cl_marker.get_offsets()[0]) == [5.0, analyze(5.0)["CL"]]
+    assert "L/D" in chart.info_text.get_text()
+
+
+def test_chart_redraws_on_profile_change_and_reuses_artists():
+    chart = make_chart()
+    chart.show_profile("NACA 2412", naca_data["NACA 2412"])
+    lines = (chart.cl_line, chart.cd_line)
+    chart.show_results(analyze(4.0), naca_data["NACA 2412"])
+    draws = chart.full_draws
+
+    chart.show_results(analyze(4.0, "NACA 0012"), naca_data["NACA 0012"])
+
+    assert chart.full_draws == draws + 1
+    assert (chart.cl_line, chart.cd_line) == lines
+    assert len(chart.ax.lines) == 2
+    assert list(chart.cl_line.get_xdata()) == naca_data["NACA 0012"]["alpha"]
+    assert chart.ax.get_title() == "Analysis: NACA 0012"
+
+    chart.show_profile("NACA 0012", naca_data["NACA 0012"])
+    assert not chart.cl_marker.get_visible()
+
+
+def test_chart_redraws_reynolds_profile_only_when_re_changes_bin():
+    data = {"RE": {"alpha": [-5.0, 0.0, 5.0, 10.0], "Re": [1e5, 1e6, 1e7],
+                   "CL": [[-0.4, 0.1, 0.6, 0.9], [-0.5, 0.0, 0.5, 1.0], [-0.5, 0.0, 0.55, 1.1]],
+                   "CD": [[0.03, 0.02, 0.03, 0.06], [0.01, 0.006, 0.01, 0.02], [0.008, 0.005, 0.0075, 0.015]]}}
+
+    def at_speed(V):
+        return analyze_airfoil(4.0, V, 1.225, 12.0, "RE", data, chord=1.0)
+
+    chart = make_chart()
+    chart.show_results(at_speed(10.0), data["RE"])
+    drawn = chart.reynolds
+    draws = chart.full_draws
+    for V in (10.1, 10.2, 10.4):  # live slider ticks within 5% of the drawn Re
+        chart.show_results(at_speed(V), data["RE"])
+    assert chart.full_draws == draws
+    assert chart.reynolds == drawn
+    assert chart.blits == 3
+    assert "Re: " in chart.info_text.get_text()
+
+    chart.show_results(at_speed(11.0), data["RE"])  # more than 5% away
+    assert chart.full_draws == draws + 1
+    assert chart.reynolds == at_speed(11.0)["reynolds_number"]
+
+    chart.show_results(at_speed(14.6), data["RE"])  # Re = 1e6 at 14.8 m/s
+    draws = chart.full_draws
+    chart.show_results(at_speed(14.9), data["RE"])  # crosses the tabulated Re = 1e6
+    assert chart.full_draws == draws + 1
@@ -0,0 +1,74 @@
+import sys
+import os
+import numpy as np
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.comparison import alpha_grid, compare_profiles, rank_profiles
+from calculations.naca_data import naca_data
+from calculations.optimum import find_optima
+
+def test_comparison_matches_scalar_analysis_on_shared_grid():
+    alpha = alpha_grid(-5, 15, 0.5)
+    assert alpha[0] == -5 and alpha[-1] == 15 and len(alpha) == 41
+
+    names = list(naca_data)
+    comparison = compare_profiles(names, naca_data, alpha, 25.0, 1.225, 12.0)
+    assert comparison["CL"].shape == (len(names), len(alpha))
+
+    for i, name in enumerate(names):
+        for j in (0, 13, 40):
+            scalar = ac.analyze_airfoil(alpha[j], 25.0, 1.225, 12.0, name, naca_data)
+            assert comparison["lift"][i, j] == pytest.approx(scalar["lift"])
+            assert comparison["L_D_ratio"][i, j] == pytest.approx(scalar["L_D_ratio"])
+
+def test_ranking_orders_by_max_lift_to_drag_and_masks_missing_range():
+    data = dict(naca_data)
+    data["Short"] = {"alpha": [20.0, 25.0], "CL": [1.0, 1.1], "CD": [0.1, 0.2]}
+    names = ["NACA 0012", "NACA 2412", "Short"]
+    comparison = compare_profiles(names, data, alpha_grid(-5, 15, 0.25), 25.0, 1.225, 12.0)
+
+    assert np.all(np.isnan(comparison["CL"][2]))
+    ranking = rank_profiles(comparison)
+    assert [row["rank"] for row in ranking] == [1, 2, 3]
+    assert ranking[-1]["profile"] == "Short" and ranking[-1]["max_L_D"] is None
+    assert ranking[0]["max_L_D"] >= ranking[1]["max_L_D"]
+
+    best = ranking[0]
+    i = names.index(best["profile"])
+    assert best["max_L_D"] == np.nanmax(comparison["L_D_ratio"][i])
+    assert best["CL_max"] == np.nanmax(comparison["CL"][i])
+
+def test_alpha_grid_rejects_invalid_range():
+    with pytest.raises(ValueError):
+        alpha_grid(0, 10, 0)
+    with pytest.raises(ValueError):
+        alpha_grid(10, 0, 1)
+
+def test_ranking_uses_exact_optima_between_grid_points():
+    alpha = alpha_grid(-5, 15, 2.0)
+    names = list(naca_data)
+    comparison = compare_profiles(names, naca_data, alpha, 25.0, 1.225, 12.0)
+    optima = find_optima(names, naca_data, alpha_range=(alpha[0], alpha[-1]))
+
+    coarse = {row["profile"]: row for row in rank_profiles(comparison)}
+    for row in rank_profiles(comparison, optima):
+        assert row["max_L_D"] == optima[row["profile"]]["L_D_ratio"]["value"]
+        assert row["max_L_D"] >= coarse[row["profile"]]["max_L_D"]
+
+def test_ranking_of_reynolds_profile_follows_the_condition():
+    data = {"RE": {"alpha": [-5.0, 0.0, 5.0, 10.0], "Re": [1e5, 1e6, 1e7],
+                   "CL": [[-0.4, 0.1, 0.6, 0.9], [-0.5, 0.0, 0.5, 1.0], [-0.5, 0.0, 0.55, 1.1]],
+                   "CD": [[0.03, 0.02, 0.03, 0.06], [0.01, 0.006, 0.01, 0.02], [0.008, 0.005, 0.0075, 0.015]]}}
+    alpha = alpha_grid(-5, 10, 0.5)
+    maxima = []
+    for V in (1.48, 148.0):  # Re = 1e5 and 1e7 at 1 m chord
+        comparison = compare_profiles(["RE"], data, alpha, V, 1.225, 12.0)
+        optima = find_optima(["RE"], data, alpha_range=(alpha[0], alpha[-1]),
+                             reynolds=comparison["reynolds_number"])
+        row = rank_profiles(comparison, optima)[0]
+        assert row["max_L_D"] == pytest.approx(np.nanmax(comparison["L_D_ratio"][0]))
+        assert row["CL_max"] == pytest.approx(np.nanmax(comparison["CL"][0]))
+        maxima.append(row["max_L_D"])
+    assert maxima == pytest.approx([20.0, 0.55 / 0.0075])
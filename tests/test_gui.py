@@ -1,5 +1,6 @@
 import sys
 import os
+import subprocess
 import tkinter as tk
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -11,3 +12,11 @@ def test_gui_launch():
     assert isinstance(app, AirfoilGUI)
     assert hasattr(app, 'selected_profile')
     root.destroy()
+
+def test_startup_defers_heavy_imports():
+    # Matplotlib, PIL and the comparison window are loaded only when needed,
+    # so importing the application must not pull them in
+    script = "import sys, main; print([m for m in ('matplotlib', 'PIL', 'gui.compare_profiles') if m in sys.modules])"
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    result = subprocess.run([sys.executable, "-c", script], cwd=root_dir, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from calculations import instrumentation
+from calculations.aero_calculations import analyze_airfoil
+from calculations.naca_data import naca_data
+from calculations.profile_manager import ProfileManager
+
+
+@pytest.fixture
+def recording():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_nothing_is_recorded_while_disabled():
+    instrumentation.reset()
+    instrumentation.disable()
+    analyze_airfoil(5.0, 25.0, 1.225, 12.0, "NACA 2412", naca_data)
+    assert instrumentation.snapshot() == {}
+
+
+def test_hot_paths_record_counts_and_histograms(recording):
+    for alpha in range(10):
+        analyze_airfoil(alpha, 25.0, 1.225, 12.0, "NACA 2412", naca_data)
+    success, _ = ProfileManager.read_profile_file(os.path.join(ROOT, "test_profile2.csv"))
+    assert success
+
+    stats = instrumentation.snapshot()
+    analysis = stats["analysis.analyze_airfoil"]
+    assert analysis["count"] == 10
+    assert sum(analysis["histogram"].values()) == 10
+    assert analysis["min"] <= analysis["p50"] <= analysis["p99"] <= analysis["max"]
+    assert stats["profiles.read_csv"]["count"] == 1
+    assert stats["profiles.validate"]["count"] == 1
+
+
+def test_dump_and_environment_switch(tmp_path):
+    instrumentation.reset()
+    instrumentation.record("demo", 1500)
+    report = json.loads(instrumentation.dump(str(tmp_path / "report.json")))
+    assert report["operations"]["demo"]["histogram"] == {"2.05e-06": 1}
+    instrumentation.reset()
+
+    # A .json value enables recording and dumps the numbers at exit
+    path = tmp_path / "station.json"
+    script = ("from calculations.aero_calculations import analyze_airfoil\n"
+              "from calculations.naca_data import naca_data\n"
+              "analyze_airfoil(5.0, 25.0, 1.225, 12.0, 'NACA 2412', naca_data)\n")
+    env = dict(os.environ, AIRFOIL_PROFILING=str(path))
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, check=True)
+    assert json.loads(path.read_text())["operations"]["analysis.analyze_airfoil"]["count"] == 1
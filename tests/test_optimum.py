@@ -0,0 +1,84 @@
+import sys
+import os
+import numpy as np
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.naca_data import naca_data
+from calculations.optimum import find_optima, optimum_speeds
+
+def dense_maxima(name, alpha_min=-np.inf, alpha_max=np.inf, method="linear"):
+    data = naca_data[name]
+    alpha = np.linspace(max(data["alpha"][0], alpha_min), min(data["alpha"][-1], alpha_max), 200001)
+    results = ac.analyze_airfoil_batch(alpha, 25.0, 1.225, 12.0, name, naca_data, method=method)
+    metrics = ac.calculate_efficiency_metrics_batch(results)
+    return {"CL_max": results["CL"], "L_D_ratio": results["L_D_ratio"],
+            "drag_efficiency": metrics["drag_efficiency"], "power_factor": metrics["power_factor"]}, alpha
+
+def test_optima_match_dense_sampling_for_every_profile():
+    names = list(naca_data)
+    optima = find_optima(names, naca_data)
+    for name in names:
+        sampled, alpha = dense_maxima(name)
+        for metric, values in sampled.items():
+            exact = optima[name][metric]
+            best = np.nanargmax(values)
+            # Dense sampling can only approach the exact optimum from below
+            assert exact["value"] >= values[best] - 1e-12
+            assert exact["value"] == pytest.approx(values[best], rel=1e-4)
+            assert exact["alpha"] == pytest.approx(alpha[best], abs=1e-2)
+
+@pytest.mark.parametrize("method", ["pchip", "spline"])
+def test_smooth_optima_match_dense_sampling(method):
+    names = ["NACA 2412", "NACA 0012", "NACA 23012"]
+    optima = find_optima(names, naca_data, alpha_range=(-4.0, 14.0), method=method)
+    for name in names:
+        sampled, alpha = dense_maxima(name, -4.0, 14.0, method)
+        for metric, values in sampled.items():
+            exact = optima[name][metric]
+            best = np.nanargmax(values)
+            assert exact["value"] >= values[best] - 1e-12
+            assert exact["value"] == pytest.approx(values[best], rel=1e-6)
+            assert exact["alpha"] == pytest.approx(alpha[best], abs=1e-2)
+    # The smooth polar peaks between the tabulated points
+    linear = find_optima(names, naca_data, method="linear")["NACA 2412"]
+    assert find_optima(names, naca_data, method="spline")["NACA 2412"]["CL_max"]["value"] >= linear["CL_max"]["value"]
+
+def test_optima_respect_alpha_range():
+    optima = find_optima(["NACA 2412"], naca_data, alpha_range=(-2.0, 3.0))["NACA 2412"]
+    sampled, _ = dense_maxima("NACA 2412", -2.0, 3.0)
+    assert -2.0 <= optima["L_D_ratio"]["alpha"] <= 3.0
+    assert optima["L_D_ratio"]["value"] == pytest.approx(np.nanmax(sampled["L_D_ratio"]))
+
+def test_optimum_speeds_balance_weight():
+    optima = find_optima(["NACA 2412"], naca_data)["NACA 2412"]
+    speeds = optimum_speeds(optima, weight=5000.0, rho=1.225, S=12.0)
+    min_drag = speeds["min_drag"]
+    results = ac.analyze_airfoil(min_drag["alpha"], min_drag["velocity"], 1.225, 12.0, "NACA 2412", naca_data)
+    assert results["lift"] == pytest.approx(5000.0)
+    assert min_drag["drag"] == pytest.approx(5000.0 / optima["L_D_ratio"]["value"])
+    assert speeds["min_power"]["velocity"] <= min_drag["velocity"]
+
+    with pytest.raises(ValueError):
+        optimum_speeds(optima, weight=0.0, rho=1.225, S=12.0)
+
+def test_stationary_points_find_close_and_double_roots():
+    from calculations.optimum import _stationary_points
+    # (t - 0.5)(t - 0.5001)(t + 3) and (t - 0.3)^2 (t - 2), lowest order first
+    close = np.polynomial.polynomial.polyfromroots([0.5, 0.5001, -3.0])
+    double = np.polynomial.polynomial.polyfromroots([0.3, 0.3, 2.0])
+    roots = _stationary_points(np.array([close, double]), np.array([1.0, 1.0]))
+    assert np.sort(roots[:, 0][~np.isnan(roots[:, 0])]) == pytest.approx([0.5, 0.5001], abs=1e-9)
+    assert np.nanmin(np.abs(roots[:, 1] - 0.3)) < 1e-6
+
+def test_smooth_optimum_of_a_narrow_peak():
+    # A sharp drag bucket gives an L/D peak much narrower than a segment
+    data = {"PEAK": {"alpha": [0.0, 4.0, 8.0, 12.0], "CL": [0.2, 0.6, 1.0, 1.2],
+                     "CD": [0.03, 0.0102, 0.0100, 0.04]}}
+    optimum = find_optima(["PEAK"], data, method="spline")["PEAK"]["L_D_ratio"]
+    alpha = np.linspace(0.0, 12.0, 1200001)
+    CL, CD = ac.interpolate_coefficients("PEAK", alpha, data, method="spline")
+    ratio = CL / CD
+    assert optimum["value"] >= ratio.max() - 1e-12
+    assert optimum["value"] == pytest.approx(ratio.max(), rel=1e-9)
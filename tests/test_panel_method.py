@@ -0,0 +1,72 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations.aero_calculations import analyze_airfoil
+from calculations.naca_data import naca_data, profile_info
+from calculations.naca_geometry import naca_coordinates, parse_designation
+from calculations.panel_method import PanelSolver, generate_polar
+from calculations.profile_manager import ProfileManager
+
+
+def test_geometry_of_four_and_five_digit_airfoils():
+    x, y = naca_coordinates("NACA 0012", 200)
+    assert len(x) == 201 and (x[0], y[0]) == pytest.approx((1.0, 0.0)) and (x[-1], y[-1]) == pytest.approx((1.0, 0.0))
+    assert x.min() == pytest.approx(0.0)
+    # Symmetric: lower surface mirrors the upper one, 12 % thick near 30 % chord
+    np.testing.assert_allclose(y[:100], -y[200:100:-1], atol=1e-12)
+    assert 2 * y.max() == pytest.approx(0.12, abs=2e-4)
+
+    assert parse_designation("naca23012") == pytest.approx(
+        {"digits": "23012", "series": 5, "thickness": 0.12, "design_lift": 0.3, "m": 0.2025, "k1": 15.957, "k2_k1": 0.0})
+    x, y = naca_coordinates("23112", 100)  # Reflexed mean line
+    assert np.all(np.isfinite(y))
+    for bad in ("241", "NACA 24A12", "2400", "26012", "2012"):
+        with pytest.raises(ValueError):
+            parse_designation(bad)
+
+
+def test_panel_solution_matches_potential_flow():
+    solver = PanelSolver(*naca_coordinates("0012", 200))
+    CL = solver.lift_coefficient(np.array([0.0, 5.0]))
+    assert CL[0] == pytest.approx(0.0, abs=1e-12)
+    # Thickness raises the lift slope above the thin-airfoil 2*pi by about 0.77 t/c
+    assert CL[1] / np.radians(5.0) == pytest.approx(2 * np.pi * (1 + 0.77 * 0.12), rel=0.01)
+    Cp = solver.pressure_coefficient(5.0)
+    assert Cp.max() == pytest.approx(1.0, abs=0.02)  # Stagnation point
+
+    # Camber shifts the zero-lift angle (about -2.1° for the 2412); the panel
+    # count barely changes the answer
+    coarse = PanelSolver(*naca_coordinates("2412", 100)).lift_coefficient(np.array([-2.1, 8.0]))
+    fine = PanelSolver(*naca_coordinates("2412", 400)).lift_coefficient(np.array([-2.1, 8.0]))
+    assert abs(fine[0]) < 0.01
+    assert coarse[1] == pytest.approx(fine[1], rel=0.005)
+
+
+def test_generated_polars_register_and_analyze(tmp_path):
+    polar = generate_polar("4415", reynolds=1e6)
+    assert set(polar) == {"alpha", "CL", "CD"} and len(polar["alpha"]) == len(polar["CD"])
+    assert min(polar["CD"]) > 0
+
+    grid = generate_polar("4415")
+    assert len(grid["Re"]) == 5 and grid["CL"][0] == grid["CL"][-1]
+    # More skin friction at the low Reynolds number
+    assert np.all(np.array(grid["CD"][0]) > np.array(grid["CD"][-1]))
+
+    manager = ProfileManager(dict(naca_data), dict(profile_info), str(tmp_path / "none.json"), str(tmp_path / "store"))
+    success, name = manager.add_generated_profile("4415", grid)
+    assert success and name == "NACA 4415 (panel)"
+    assert manager.add_generated_profile("4415", grid)[1] == "NACA 4415 (panel)_1"
+    assert manager.add_generated_profile("44", grid)[0] is False
+    assert "panel method" in manager.naca_data.describe(name)
+
+    results = analyze_airfoil(4.0, 30.0, 1.225, 10.0, name, manager.naca_data)
+    assert results["CL"] == pytest.approx(np.interp(4.0, grid["alpha"], grid["CL"][0]))
+
+def test_generation_stops_when_asked():
+    assert generate_polar("2412", should_stop=lambda: True) is None
+    assert generate_polar("2412", should_stop=lambda: False)["CL"]
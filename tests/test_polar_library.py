@@ -0,0 +1,76 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import polar_library
+from calculations.comparison import compare_profiles
+from calculations.naca_data import naca_data
+from calculations.polar_library import PackedPolarLibrary
+from calculations.polar_table import get_polar_table
+
+
+def random_library(n_profiles, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(n_profiles):
+        n = int(rng.integers(2, 25))
+        alpha = np.sort(rng.uniform(-15, 25, n))
+        if n > 3 and i % 4 == 0:
+            alpha[2] = alpha[1]  # Repeated angle (vertical step)
+        data[f"P{i}"] = {"alpha": alpha.tolist(), "CL": rng.normal(size=n).tolist(),
+                         "CD": rng.uniform(0.005, 0.1, n).tolist()}
+    return data
+
+
+def test_packed_evaluation_matches_each_polar(monkeypatch):
+    # Small blocks so several passes and the unsorting are exercised
+    monkeypatch.setattr(polar_library, "BLOCK_SIZE", 64)
+    data = random_library(120)
+    library = PackedPolarLibrary.from_profiles(list(data), data)
+    assert library.alpha.shape == (120, library.lengths.max())
+
+    angles = np.random.default_rng(1).uniform(-20, 30, (6, 9))
+    CL, CD = library.evaluate(angles)
+    assert CL.shape == (120, 6, 9)
+    for name, row in library.index.items():
+        table = get_polar_table(name, data)
+        expected_CL, expected_CD = table.evaluate(angles)
+        np.testing.assert_allclose(CL[row], expected_CL, atol=1e-12)
+        np.testing.assert_allclose(CD[row], expected_CD, atol=1e-12)
+        assert library.cl_max[row] == table.max_lift()
+
+
+def test_subsets_scalars_and_range_masking():
+    library = PackedPolarLibrary.from_profiles(list(naca_data), naca_data)
+    CL, CD = library.evaluate(5.0, ["NACA 0012", "NACA 2412"])
+    assert CL.shape == (2,)
+    assert (CL[1], CD[1]) == pytest.approx(get_polar_table("NACA 2412", naca_data).evaluate(5.0))
+
+    CL, _ = library.evaluate([-100.0, 0.0], clamp=False)
+    assert np.all(np.isnan(CL[:, 0])) and not np.any(np.isnan(CL[:, 1]))
+    with pytest.raises(ValueError):
+        library.evaluate(0.0, ["NACA 9999"])
+    with pytest.raises(ValueError):
+        PackedPolarLibrary([], [])
+
+
+def test_reynolds_profiles_are_packed_at_the_given_reynolds_number():
+    data = {"RE": {"alpha": [-5.0, 0.0, 5.0, 10.0], "Re": [1e5, 1e6],
+                   "CL": [[-0.4, 0.1, 0.6, 0.9], [-0.5, 0.0, 0.5, 1.0]],
+                   "CD": [[0.03, 0.02, 0.03, 0.06], [0.01, 0.006, 0.01, 0.02]]},
+            "NACA 0012": naca_data["NACA 0012"]}
+    angles = np.linspace(-5, 10, 31)
+    library = PackedPolarLibrary.from_profiles(list(data), data, reynolds=3e5)
+    CL, CD = library.evaluate(angles, ["RE"])
+    expected = get_polar_table("RE", data).evaluate(angles, 3e5)
+    np.testing.assert_allclose(CL[0], expected[0])
+    np.testing.assert_allclose(CD[0], expected[1])
+
+    # The packed comparison agrees with the per-profile (resampled) path
+    packed = compare_profiles(list(data), data, angles, 4.44, 1.225, 10.0)
+    resampled = compare_profiles(list(data), data, angles, 4.44, 1.225, 10.0, resolution=1e-3)
+    np.testing.assert_allclose(packed["CL"], resampled["CL"], atol=1e-6)
@@ -0,0 +1,71 @@
+import sys
+import os
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations.profile_manager import ProfileManager
+
+def test_txt_parser_skips_and_counts_invalid_rows(tmp_path):
+    path = tmp_path / "polar.txt"
+    path.write_text("# alpha CL CD\n-5 0.0 0.01\n\n0 0.5 0.02 extra\nbad row here\n5 1.0 0.03\n")
+    success, (alpha, cl, cd, skipped, rows, reynolds) = ProfileManager._read_txt_file(str(path))
+    assert success
+    assert alpha.tolist() == [-5.0, 0.0, 5.0]
+    assert skipped == 1
+    assert rows().tolist() == [2, 4, 6]
+
+def test_validation_reports_row_numbers(tmp_path):
+    path = tmp_path / "polar.csv"
+    path.write_text("name,alpha,CL,CD\na,-5,0,0.01\nb,0,0.5,0.02\nc,x,1,1\nd,5,1.0,0.03\ne,4,1,0.03\n")
+    success, message = ProfileManager.read_profile_file(str(path))
+    assert not success
+    assert "ascending order (rows 6)" in message
+
+def test_csv_parser_accepts_quoted_numbers(tmp_path):
+    path = tmp_path / "polar.csv"
+    path.write_text('"alpha","CL","CD"\n"-5","0","0.01"\n"0","0.5","0.02"\n"5","1.0","0.03"\n')
+    success, profile = ProfileManager.read_profile_file(str(path))
+    assert success, profile
+    assert profile["CL"] == [0.0, 0.5, 1.0]
+
+    # Falls back to the regex parser on a bad row, quotes still accepted
+    path.write_text('name,alpha,CL,CD\n"a, b","-5","0",0.01\nbad\nc,0,0.5,"0.02"\nd,5,1.0,0.03\n')
+    success, (alpha, cl, cd, skipped, rows, reynolds) = ProfileManager._read_csv_file(str(path))
+    assert success and alpha.tolist() == [-5.0, 0.0, 5.0] and skipped == 1
+    assert rows().tolist() == [2, 4, 5]
+
+def test_non_finite_values_report_their_own_row(tmp_path):
+    path = tmp_path / "polar.csv"
+    path.write_text("alpha,CL,CD\n-5,0.1,0.01\n0,nan,0.02\n5,0.9,0.03\n")
+    success, message = ProfileManager.read_profile_file(str(path))
+    assert not success and "must be numeric (rows 3)" in message
+
+    # Same row numbers when a malformed row forces the regex parser
+    path.write_text("alpha,CL,CD\n-5,0.1,0.01\nbad\n0,nan,0.02\n5,0.9,0.03\n")
+    success, message = ProfileManager.read_profile_file(str(path))
+    assert not success and "must be numeric (rows 4)" in message
+
+    path = tmp_path / "polar.txt"
+    path.write_text("# alpha CL CD\n-5 0.1 0.01\n\n0 0.5 0.02\n5 inf 0.03\n")
+    success, message = ProfileManager.read_profile_file(str(path))
+    assert not success and "(rows 5)" in message
+
+def test_multi_reynolds_files_build_a_dense_grid(tmp_path):
+    csv_path = tmp_path / "multi.csv"
+    csv_path.write_text("alpha,CL,CD,Re\n-5,-0.4,0.03,1e5\n0,0.1,0.02,1e5\n5,0.6,0.03,1e5\n"
+                        "-4,-0.4,0.01,1e6\n2,0.2,0.006,1e6\n6,0.6,0.01,1e6\n")
+    success, profile = ProfileManager.read_profile_file(str(csv_path))
+    assert success, profile
+    assert profile["Re"] == [1e5, 1e6]
+    # Union of both polars' angles within the range they share
+    assert profile["alpha"] == [-4.0, 0.0, 2.0, 5.0]
+    assert profile["CL"][1] == pytest.approx([-0.4, 0.0, 0.2, 0.5])
+
+    txt_path = tmp_path / "multi.txt"
+    txt_path.write_text("# alpha CL CD Re\n0 0.1 0.02 1e5\n5 0.6 0.03 1e5\n0 0.0 0.01 1e6\n5 0.5 0.01 1e6\n")
+    success, profile = ProfileManager.read_profile_file(str(txt_path))
+    assert success and profile["Re"] == [1e5, 1e6]
+
+    txt_path.write_text("# alpha CL CD Re\n0 0.1 0.02 1e5\n5 0.6 0.03 1e5\n5 0.0 0.01 1e6\n0 0.5 0.01 1e6\n")
+    success, message = ProfileManager.read_profile_file(str(txt_path))
+    assert not success and "ascending order (rows 5)" in message
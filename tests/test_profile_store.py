@@ -0,0 +1,67 @@
+import sys
+import os
+import json
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations.profile_store import ProfileStore
+from calculations.profile_manager import ProfileManager
+from calculations.naca_data import naca_data, profile_info
+
+polar = {"alpha": [-5.0, 0.0, 5.0], "CL": [-0.4, 0.1, 0.6], "CD": [0.02, 0.01, 0.02]}
+
+def test_store_append_delete_and_reopen(tmp_path):
+    store = ProfileStore(str(tmp_path / "store"))
+    store.append("A", polar, "first")
+    store.append("B", {**polar, "CL": [0.0, 0.5, 1.0]})
+    assert store.delete("A")
+
+    reopened = ProfileStore(str(tmp_path / "store"))
+    assert reopened.names() == ["B"]
+    assert reopened.load("B")["CL"] == [0.0, 0.5, 1.0]
+    assert reopened.dead_space() > 0
+
+    reopened.compact()
+    assert reopened.dead_space() == 0
+    assert ProfileStore(str(tmp_path / "store")).load("B") == {**polar, "CL": [0.0, 0.5, 1.0]}
+
+def test_manager_migrates_legacy_json(tmp_path):
+    legacy = tmp_path / "custom_profiles.json"
+    legacy.write_text(json.dumps({"profiles": {"OLD": polar}, "profile_info": {"OLD": "legacy"}}))
+
+    manager = ProfileManager(naca_data, profile_info, str(legacy), str(tmp_path / "store"))
+    assert manager.naca_data["OLD"] == polar
+    assert manager.naca_data.describe("OLD") == "legacy"
+    assert "OLD" not in naca_data
+    assert not legacy.exists()
+
+    manager.remove_custom_profile("OLD")
+    assert "OLD" not in ProfileStore(str(tmp_path / "store"))
+
+def test_registry_loads_lazily_with_bounded_working_set(tmp_path):
+    store = ProfileStore(str(tmp_path / "store"))
+    for i in range(5):
+        store.append(f"P{i}", polar, f"profile {i}")
+
+    manager = ProfileManager(naca_data, profile_info, str(tmp_path / "none.json"),
+                             str(tmp_path / "store"), max_loaded_profiles=2)
+    registry = manager.naca_data
+    assert list(registry)[-5:] == [f"P{i}" for i in range(5)]
+    assert registry.index["P3"]["points"] == 3 and not registry.is_loaded("P3")
+
+    for i in range(5):
+        assert registry[f"P{i}"] == polar
+    assert [registry.is_loaded(f"P{i}") for i in range(5)] == [False, False, False, True, True]
+    assert registry.is_loaded("NACA 2412")
+
+def test_store_round_trips_reynolds_grid(tmp_path):
+    profile = {"alpha": [0.0, 5.0, 10.0], "Re": [1e5, 1e6],
+               "CL": [[0.1, 0.6, 0.9], [0.0, 0.5, 1.0]], "CD": [[0.02, 0.03, 0.06], [0.01, 0.01, 0.02]]}
+    store = ProfileStore(str(tmp_path / "store"))
+    store.append("A", polar)
+    store.append("RE", profile)
+    store.delete("A")
+
+    reopened = ProfileStore(str(tmp_path / "store"))
+    assert reopened.load("RE") == profile
+    reopened.compact()
+    assert reopened.load("RE") == profile and reopened.dead_space() == 0
@@ -0,0 +1,127 @@
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.atmosphere import isa
+from calculations.naca_data import naca_data
+from calculations.service import AnalysisService
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Runs the service on a free port in a background event loop"""
+    service = AnalysisService(dict(naca_data), max_sweep_workers=1)
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(service.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield listener.sockets[0].getsockname()[1]
+    asyncio.run_coroutine_threadsafe(service.shutdown(listener), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def request(connection, method, path, body=None):
+    payload = json.dumps(body) if body is not None else None
+    connection.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_profiles_and_single_analysis_on_one_connection(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server, timeout=10)
+    status, listing = request(connection, "GET", "/profiles")
+    assert status == 200
+    assert {entry["name"] for entry in listing["profiles"]} == set(naca_data)
+
+    # Same keep-alive connection for the second request
+    status, result = request(connection, "POST", "/analyze",
+                             {"profile": "NACA 2412", "alpha": 5.0, "V": 25.0, "rho": 1.225, "S": 12.0})
+    expected = ac.analyze_airfoil(5.0, 25.0, 1.225, 12.0, "NACA 2412", naca_data)
+    assert status == 200
+    assert result["lift"] == pytest.approx(expected["lift"])
+    assert result["efficiency"]["glide_ratio"] == pytest.approx(expected["L_D_ratio"])
+    connection.close()
+
+
+def test_batched_requests_match_single_analyses(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server, timeout=10)
+    items = [{"profile": name, "alpha": alpha, "V": 30.0, "altitude": 2000.0, "S": 10.0}
+             for name in ("NACA 2412", "NACA 0012") for alpha in (-4.0, 0.0, 4.0, 8.0)]
+    status, results = request(connection, "POST", "/analyze", items)
+    assert status == 200 and len(results) == len(items)
+
+    atmosphere = isa(2000.0)
+    for item, result in zip(items, results):
+        expected = ac.analyze_airfoil(item["alpha"], 30.0, float(atmosphere["density"]), 10.0, item["profile"],
+                                      naca_data, kinematic_viscosity=float(atmosphere["kinematic_viscosity"]))
+        assert result["profile"] == item["profile"]
+        assert result["drag"] == pytest.approx(expected["drag"])
+    # CL^1.5 of a negative CL has no real value and is sent as null
+    assert results[4]["CL"] < 0 and results[4]["efficiency"]["drag_efficiency"] is None
+
+    status, columns = request(connection, "POST", "/analyze/batch",
+                              {"profile": "NACA 2412", "alpha": [0.0, 4.0, 8.0], "V": 30.0, "rho": 1.1, "S": 10.0})
+    assert status == 200
+    assert len(columns["CL"]) == 3 and len(columns["power_factor"]) == 3
+    connection.close()
+
+
+def test_sweep_and_errors(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server, timeout=60)
+    status, sweep = request(connection, "POST", "/sweep", {"profiles": ["NACA 2412"], "alpha": [0.0, 5.0, 10.0],
+                                                           "V": [20.0, 30.0], "rho": [1.225], "S": [12.0]})
+    assert status == 200
+    assert sweep["NACA 2412"]["points"] == 6
+
+    status, error = request(connection, "POST", "/analyze", {"profile": "NACA 9999", "alpha": 1.0, "V": 20.0,
+                                                             "rho": 1.2, "S": 10.0})
+    assert status == 400 and "not found" in error["error"]
+    assert request(connection, "POST", "/analyze", {"profile": "NACA 2412"})[0] == 400
+    assert request(connection, "GET", "/nothing")[0] == 404
+    assert request(connection, "GET", "/analyze")[0] == 405
+
+    # Fast lookups on both endpoints, limited to a sane grid spacing
+    condition = {"profile": "NACA 2412", "alpha": 5.05, "V": 25.0, "rho": 1.225, "S": 12.0}
+    status, single = request(connection, "POST", "/analyze", {**condition, "resolution": 0.5})
+    status_list, listed = request(connection, "POST", "/analyze", [{**condition, "resolution": 0.5}] * 2)
+    status_batch, batch = request(connection, "POST", "/analyze/batch", {**condition, "resolution": 0.5})
+    assert status == status_list == status_batch == 200
+    expected = ac.analyze_airfoil(5.05, 25.0, 1.225, 12.0, "NACA 2412", naca_data, resolution=0.5)
+    assert single["CL"] == listed[1]["CL"] == pytest.approx(batch["CL"]) == pytest.approx(expected["CL"])
+    for path in ("/analyze", "/analyze/batch"):
+        assert request(connection, "POST", path, {**condition, "resolution": 1e-9})[0] == 400
+    connection.close()
+
+
+def test_invalid_content_length_is_rejected(server):
+    import socket
+
+    for length in ("abc", "-5"):
+        with socket.create_connection(("127.0.0.1", server), timeout=10) as sock:
+            sock.sendall(f"POST /analyze HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n".encode("latin-1"))
+            response = b""
+            while chunk := sock.recv(4096):
+                response += chunk
+        head, body = response.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 400") and b"Connection: close" in head
+        assert "Content-Length" in json.loads(body)["error"]
+
+
+def test_cache_holds_analyses_only():
+    service = AnalysisService(dict(naca_data), max_sweep_workers=1)
+    body = {"profile": "NACA 2412", "alpha": 5.0, "V": 25.0, "rho": 1.225, "S": 12.0}
+    first = service.analyze(dict(body))
+    second = service.analyze(dict(body))
+    stats = service.cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert second["efficiency"] == first["efficiency"] == ac.calculate_efficiency_metrics(first)
@@ -0,0 +1,71 @@
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations import aero_calculations as ac
+from calculations.naca_data import naca_data
+from calculations.sweep import SweepEngine
+
+def test_sweep_matches_serial_maxima():
+    alpha = np.linspace(-10, 20, 31)
+    V = np.array([10.0, 25.0, 40.0])
+    rho = np.array([0.9, 1.225])
+    S = np.array([5.0, 12.0])
+    names = ["NACA 2412", "NACA 0012"]
+    progress = []
+
+    engine = SweepEngine(naca_data, names, max_workers=2, chunk_size=100)
+    results = engine.run(alpha, V, rho, S, progress=lambda done, total: progress.append((done, total)))
+
+    assert progress[-1][0] == progress[-1][1]
+    grid = np.meshgrid(alpha, V, rho, S, indexing="ij")
+    for name in names:
+        serial = ac.analyze_airfoil_batch(*grid, name, naca_data)
+        assert results[name]["points"] == serial["lift"].size
+        assert results[name]["L_D_ratio"]["value"] == np.max(serial["L_D_ratio"])
+        assert results[name]["lift"]["value"] == np.max(serial["lift"])
+        assert results[name]["lift"]["velocity"] == 40.0
+
+def test_sweep_evaluates_reynolds_profiles_at_each_speed():
+    profiles = {
+        "RE": {"alpha": [-5.0, 0.0, 5.0, 10.0], "Re": [1e5, 1e6, 1e7],
+               "CL": [[-0.4, 0.1, 0.6, 0.9], [-0.5, 0.0, 0.5, 1.0], [-0.5, 0.0, 0.5, 1.1]],
+               "CD": [[0.03, 0.02, 0.03, 0.06], [0.01, 0.006, 0.01, 0.02], [0.008, 0.005, 0.008, 0.015]]},
+        "PLAIN": {"alpha": [-5.0, 0.0, 5.0, 10.0], "CL": [-0.5, 0.0, 0.5, 1.0], "CD": [0.05, 0.02, 0.03, 0.07]},
+    }
+    alpha = np.array([0.0, 2.5, 5.0])
+    V = np.array([2.0, 30.0])
+    rho, S = np.array([1.225]), np.array([10.0])
+
+    results = SweepEngine(profiles, max_workers=1, chunk_size=4).run(alpha, V, rho, S, chord=0.5)
+    grid = np.meshgrid(alpha, V, rho, S, indexing="ij")
+    for name in profiles:
+        serial = ac.analyze_airfoil_batch(*grid, name, profiles, chord=0.5)
+        for metric in ("L_D_ratio", "lift", "drag"):
+            assert results[name][metric]["value"] == np.max(serial[metric])
+
+def test_sweep_cancellation_before_and_during_run():
+    alpha = np.linspace(-10, 20, 31)
+    V, rho, S = np.array([10.0, 25.0, 40.0]), np.array([1.225]), np.array([12.0])
+    engine = SweepEngine(naca_data, ["NACA 2412", "NACA 0012"], max_workers=1, chunk_size=5)
+    n_tasks = 2 * int(np.ceil(len(alpha) * len(V) / 5))
+
+    # A cancel issued before the run starts (e.g. while the job is queued) is honoured
+    engine.cancel()
+    results = engine.run(alpha, V, rho, S)
+    assert engine.cancelled
+    assert all(entry["points"] == 0 for entry in results.values())
+
+    # ...and consumed, so the next run is complete; cancelling mid-run stops
+    # submitting chunks
+    completed = []
+
+    def progress(done, total):
+        completed.append(done)
+        engine.cancel()
+
+    results = engine.run(alpha, V, rho, S, progress=progress)
+    assert engine.cancelled
+    assert len(completed) < n_tasks
+    assert engine.run(alpha, V, rho, S)["NACA 2412"]["points"] == len(alpha) * len(V)
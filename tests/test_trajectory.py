@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from calculations.atmosphere import GRAVITY, isa
+from calculations.polar_table import get_polar_table
+from calculations.trajectory import simulate, TRAJECTORY_COLUMNS
+from calculations.naca_data import naca_data
+
+NAME = "NACA 2412"
+
+def test_equilibrium_glide_holds_polar_glide_angle():
+    CL, CD = get_polar_table(NAME, naca_data).evaluate(4.0)
+    gamma = -np.arctan(CD / CL)
+    V = np.sqrt(2 * 450.0 * GRAVITY * np.cos(gamma) / (isa(3000.0)["density"] * 12.0 * CL))
+    start = dict(mass=450.0, S=12.0, alpha=4.0, V0=V, altitude0=3000.0, gamma0=np.degrees(gamma), t_end=300.0)
+    rk4 = simulate(NAME, naca_data, dt=0.1, **start)
+    bs23 = simulate(NAME, naca_data, integrator="bs23", rtol=1e-8, atol=1e-8, **start)
+    assert rk4["gamma"][0] == pytest.approx(np.degrees(gamma), abs=0.02)
+    assert bs23["x"][0] == pytest.approx(rk4["x"][0], rel=1e-5)
+    assert bs23["steps"] < rk4["steps"]
+
+def test_smooth_polar_glide_uses_the_interpolation_method():
+    CL, CD = get_polar_table(NAME, naca_data, method="pchip").evaluate(3.3)
+    gamma = -np.arctan(CD / CL)
+    V = np.sqrt(2 * 450.0 * GRAVITY * np.cos(gamma) / (isa(3000.0)["density"] * 12.0 * CL))
+    start = dict(mass=450.0, S=12.0, alpha=3.3, V0=V, altitude0=3000.0, gamma0=np.degrees(gamma), t_end=100.0)
+    smooth = simulate(NAME, naca_data, method="pchip", dt=0.1, **start)
+    linear = simulate(NAME, naca_data, dt=0.1, **start)
+    assert smooth["gamma"][0] == pytest.approx(np.degrees(gamma), abs=0.02)
+    assert abs(linear["gamma"][0] - np.degrees(gamma)) > 0.03
+
+def test_ensemble_matches_single_runs_and_streams_history(tmp_path):
+    masses = np.array([300.0, 450.0, 600.0])
+    schedule = ([0.0, 10.0, 20.0], [2.0, 6.0, 4.0])
+    out = tmp_path / "history.npy"
+    ensemble = simulate(NAME, naca_data, mass=masses, S=12.0, alpha=schedule, V0=30.0, altitude0=50.0,
+                        t_end=600.0, output=str(out), record_every=10)
+    assert ensemble["landed"].all()
+    np.testing.assert_allclose(ensemble["altitude"], 0.0)
+
+    for i, mass in enumerate(masses):
+        single = simulate(NAME, naca_data, mass=mass, S=12.0, alpha=schedule, V0=30.0, altitude0=50.0, t_end=600.0)
+        assert single["x"][0] == pytest.approx(ensemble["x"][i])
+        assert single["time"][0] == pytest.approx(ensemble["time"][i])
+
+    history = np.load(out)
+    assert history.shape == (ensemble["rows"], len(TRAJECTORY_COLUMNS))
+    for i in range(len(masses)):
+        rows = history[history[:, 0] == i]
+        assert rows[0, 1] == 0.0 and rows[0, 3] == 50.0
+        assert rows[-1, 1] == pytest.approx(ensemble["time"][i])
+        assert rows[-1, 2] == pytest.approx(ensemble["x"][i])
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        simulate(NAME, naca_data, mass=0.0, S=12.0, alpha=4.0, V0=30.0, altitude0=100.0)
+    with pytest.raises(ValueError):
+        simulate(NAME, naca_data, mass=400.0, S=12.0, alpha=([0.0, 0.0], [1.0, 2.0]), V0=30.0, altitude0=100.0)
+    with pytest.raises(ValueError):
+        simulate(NAME, naca_data, mass=400.0, S=12.0, alpha=4.0, V0=30.0, altitude0=100.0, integrator="euler")
+    with pytest.raises(ValueError):
+        simulate(NAME, naca_data, mass=400.0, S=12.0, alpha=4.0, V0=30.0, altitude0=100.0, method="rk4")